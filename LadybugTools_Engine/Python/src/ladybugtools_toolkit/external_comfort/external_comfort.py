@@ -346,25 +346,12 @@ class ExternalComfort(BHoMObject):
 
         epw = self.SimulationResult.epw
 
-        dbt_evap, rh_evap = np.array(
-            [
-                evaporative_cooling_effect(
-                    dry_bulb_temperature=_dbt,
-                    relative_humidity=_rh,
-                    evaporative_cooling_effectiveness=0.5,
-                    atmospheric_pressure=_atm,
-                )
-                for _dbt, _rh, _atm in list(
-                    zip(
-                        *[
-                            epw.dry_bulb_temperature,
-                            epw.relative_humidity,
-                            epw.atmospheric_station_pressure,
-                        ]
-                    )
-                )
-            ]
-        ).T
+        dbt_evap, rh_evap = evaporative_cooling_effect(
+            dry_bulb_temperature=epw.dry_bulb_temperature.values,
+            relative_humidity=epw.relative_humidity.values,
+            evaporative_cooling_effectiveness=0.5,
+            atmospheric_pressure=epw.atmospheric_station_pressure.values,
+        )
         dbt_evap = epw.dry_bulb_temperature.get_aligned_collection(dbt_evap)
         rh_evap = epw.relative_humidity.get_aligned_collection(rh_evap)
 
@@ -9,6 +9,52 @@ from honeybee_energy.material.opaque import EnergyMaterial, _EnergyMaterialOpaqu
 from honeybee_radiance.sensorgrid import Sensor, SensorGrid
 from ladybug_geometry.geometry3d import Point3D, Vector3D
 
+# face directions of a Room created using Room.from_box with the default orientation,
+# in the order (Bottom, Front, Right, Back, Left, Top) in which its faces are created
+_BOX_FACE_DIRECTIONS = ("DOWN", "NORTH", "EAST", "SOUTH", "WEST", "UP")
+
+_MATERIAL_EQUALITY_FIELDS = (
+    "identifier",
+    "roughness",
+    "thickness",
+    "conductivity",
+    "density",
+    "specific_heat",
+    "thermal_absorptance",
+    "solar_absorptance",
+    "visible_absorptance",
+)
+
+
+def _material_eq(
+    material0: _EnergyMaterialOpaqueBase, material1: _EnergyMaterialOpaqueBase
+) -> bool:
+    """Check for equality between two opaque energy materials, field-by-field.
+
+    Args:
+        material0 (_EnergyMaterialOpaqueBase):
+            A honeybee-energy opaque material.
+        material1 (_EnergyMaterialOpaqueBase):
+            A honeybee-energy opaque material.
+
+    Returns:
+        bool:
+            True if materials are equal.
+    """
+
+    if type(material0) is not type(material1):
+        return False
+
+    if not isinstance(material0, EnergyMaterial):
+        # other material types carry additional properties, so fall back to
+        # comparing their full string representation
+        return str(material0) == str(material1)
+
+    return all(
+        getattr(material0, field) == getattr(material1, field)
+        for field in _MATERIAL_EQUALITY_FIELDS
+    )
+
 
 def equality(model0: Model, model1: Model, include_identifier: bool = False) -> bool:
     """Check for equality between two models, with regards to their material
@@ -38,14 +84,13 @@ def equality(model0: Model, model1: Model, include_identifier: bool = False) ->
     # Check ground material properties
     gnd0_material = model0.faces[5].properties.energy.construction.materials[0]
     gnd1_material = model1.faces[5].properties.energy.construction.materials[0]
-    gnd_materials_match: bool = str(gnd0_material) == str(gnd1_material)
+    if not _material_eq(gnd0_material, gnd1_material):
+        return False
 
     # Check shade material properties
     shd0_material = model0.faces[-6].properties.energy.construction.materials[0]
     shd1_material = model1.faces[-6].properties.energy.construction.materials[0]
-    shd_materials_match: bool = str(shd0_material) == str(shd1_material)
-
-    return gnd_materials_match and shd_materials_match
+    return _material_eq(shd0_material, shd1_material)
 
 
 def _create_ground_zone(
@@ -106,23 +151,19 @@ def _create_ground_zone(
         ],
     )
 
-    for face in ground_zone.faces:
+    for face, direction in zip(ground_zone.faces, _BOX_FACE_DIRECTIONS):
         face: Face
-        if face.normal.z == 1:
-            face.identifier = f"GROUND_ZONE_UP_{shade_id}"
+        face.identifier = f"GROUND_ZONE_{direction}_{shade_id}"
+        if direction == "UP":
             face.boundary_condition = boundary_conditions.outdoors
             face.type = face_types.roof_ceiling
             face.properties.energy.construction = ground_top_construction
             face.properties.radiance.modifier = ground_top_modifier
-        elif face.normal.z == -1:
-            face.identifier = f"GROUND_ZONE_DOWN_{shade_id}"
+        elif direction == "DOWN":
             face.boundary_condition = boundary_conditions.ground
             face.type = face_types.floor
             face.properties.energy.construction = ground_interface_construction
         else:
-            face.identifier = (
-                f"GROUND_ZONE_{face.cardinal_direction().upper()}_{shade_id}"
-            )
             face.boundary_condition = boundary_conditions.ground
             face.type = face_types.wall
             face.properties.energy.construction = ground_interface_construction
@@ -168,22 +209,20 @@ def _create_shade_zone(
         identifier="SHADE_CONSTRUCTION", materials=[material]
     )
     shade_modifier = shade_construction.to_radiance_solar_exterior()
-    for face in shade_zone.faces:
+    for face, direction in zip(shade_zone.faces, _BOX_FACE_DIRECTIONS):
         face: Face
-        if face.normal.z == 1:
-            face.identifier = "SHADE_ZONE_UP"
+        face.identifier = f"SHADE_ZONE_{direction}"
+        if direction == "UP":
             face.boundary_condition = boundary_conditions.outdoors
             face.type = face_types.roof_ceiling
             face.properties.energy.construction = shade_construction
             face.properties.radiance.modifier = shade_modifier
-        elif face.normal.z == -1:
-            face.identifier = "SHADE_ZONE_DOWN"
+        elif direction == "DOWN":
             face.boundary_condition = boundary_conditions.outdoors
             face.type = face_types.floor
             face.properties.energy.construction = shade_construction
             face.properties.radiance.modifier = shade_modifier
         else:
-            face.identifier = f"SHADE_ZONE_{face.cardinal_direction().upper()}"
             face.boundary_condition = boundary_conditions.outdoors
             face.type = face_types.wall
             face.properties.energy.construction = shade_construction
@@ -8,6 +8,7 @@ import json
 import shutil
 import warnings
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from types import FunctionType
 from typing import Any, Dict, List, Tuple, Union
@@ -87,6 +88,24 @@ def working_directory(model: Model, create: bool = False) -> Path:
     return working_dir
 
 
+@lru_cache(maxsize=64)
+def _load_existing_model(
+    hbjson_path: str, mtime: float  # pylint: disable=unused-argument
+) -> Model:
+    """Load a previously simulated HBJSON file, caching the result so that repeated
+        checks against the same unchanged file avoid re-parsing it.
+
+    Args:
+        hbjson_path (str): The path to an HBJSON file.
+        mtime (float): The modification time of the HBJSON file, used to invalidate
+            cached models when the file changes on disk.
+
+    Returns:
+        Model: The honeybee Model stored in the HBJSON file.
+    """
+    return Model.from_hbjson(hbjson_path)
+
+
 def simulation_id(
     epw_file: Path,
     ground_material: Union[EnergyMaterial, EnergyMaterialVegetation],
@@ -275,8 +294,9 @@ def surface_temperature_results_exist(model: Model, epw: EPW = None) -> bool:
 
     # Try to load existing HBJSON file and check that it matches
     try:
-        existing_model = Model.from_hbjson(
-            (wd / f"{model.identifier}.hbjson").as_posix()
+        hbjson_path = wd / f"{model.identifier}.hbjson"
+        existing_model = _load_existing_model(
+            hbjson_path.as_posix(), hbjson_path.stat().st_mtime
         )
         if not model_eq(model, existing_model, include_identifier=True):
             return False
@@ -442,8 +462,9 @@ def solar_radiation_results_exist(model: Model, epw: EPW = None) -> bool:
 
     # Try to load existing HBJSON file and check that it matches
     try:
-        existing_model = Model.from_hbjson(
-            (wd / "annual_irradiance" / f"{model.identifier}.hbjson").as_posix()
+        hbjson_path = wd / "annual_irradiance" / f"{model.identifier}.hbjson"
+        existing_model = _load_existing_model(
+            hbjson_path.as_posix(), hbjson_path.stat().st_mtime
         )
         if not model_eq(model, existing_model, include_identifier=True):
             return False
@@ -1397,14 +1418,9 @@ class SimulationResult(BHoMObject):
             name,
         ):
             # create feasible ranges of values
-            dbts, rhs = np.array(
-                [
-                    evaporative_cooling_effect(
-                        dbt, rh, evap_x * evaporative_cooling_effectiveness, atm
-                    )
-                    for evap_x in evap_clg_proportions
-                ]
-            ).T
+            dbts, rhs = evaporative_cooling_effect(
+                dbt, rh, evap_clg_proportions * evaporative_cooling_effectiveness, atm
+            )
             wss = ws * wind_shelter_proportions
             mrts = np.interp(shading_proportions, [0, 1], [mrt_unshaded, mrt_shaded])
 
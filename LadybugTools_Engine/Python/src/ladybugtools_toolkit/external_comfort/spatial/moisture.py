@@ -135,7 +135,7 @@ class MoistureSource:
         vectors = emitter_points[:, np.newaxis] - spatial_points
 
         # calculate angle to north for each vector
-        angles = np.array([angle_from_north(i.T).T for i in vectors])
+        angles = angle_from_north(np.moveaxis(vectors, -1, 0))
 
         return angles
 
@@ -62,15 +62,22 @@ class PointMitigation:
         # adjust values in sim res to contain values from point location
         sim_res = copy(simulation_result)
         sim_res.UnshadedMeanRadiantTemperature = self._point_mrt
-        setattr(getattr(sim_res.epw, "wind_speed"), "values", self._point_ws.values)
-        setattr(
-            getattr(sim_res.epw, "relative_humidity"), "values", self._point_rh.values
-        )
-        setattr(
-            getattr(sim_res.epw, "dry_bulb_temperature"),
-            "values",
-            self._point_dbt.values,
-        )
+
+        # point collections are already validated, so assign their values directly
+        # to the EPW collections rather than re-validating via the values setter
+        # pylint: disable=protected-access
+        for epw_collection, point_collection in [
+            (sim_res.epw.wind_speed, self._point_ws),
+            (sim_res.epw.relative_humidity, self._point_rh),
+            (sim_res.epw.dry_bulb_temperature, self._point_dbt),
+        ]:
+            if len(point_collection) != len(epw_collection):
+                raise ValueError(
+                    "Point values must be the same length as the values in the simulation result EPW."
+                )
+            epw_collection._values = list(point_collection.values)
+        # pylint: enable=protected-access
+
         self.simulation_result = sim_res
 
     def __repr__(self):
@@ -205,24 +205,12 @@ class Typology(BHoMObject):
             return epw.dry_bulb_temperature
 
         # if there is evaporative cooling effect, return the adjusted DBT
-        dbt_evap = []
-        for dbt, rh, ece, atm in list(
-            zip(
-                *[
-                    epw.dry_bulb_temperature,
-                    epw.relative_humidity,
-                    self.EvaporativeCoolingEffect,
-                    epw.atmospheric_station_pressure,
-                ]
-            )
-        ):
-            _dbt, _ = evaporative_cooling_effect(
-                dry_bulb_temperature=dbt,
-                relative_humidity=rh,
-                evaporative_cooling_effectiveness=ece,
-                atmospheric_pressure=atm,
-            )
-            dbt_evap.append(_dbt)
+        dbt_evap, _ = evaporative_cooling_effect(
+            dry_bulb_temperature=epw.dry_bulb_temperature.values,
+            relative_humidity=epw.relative_humidity.values,
+            evaporative_cooling_effectiveness=self.EvaporativeCoolingEffect,
+            atmospheric_pressure=epw.atmospheric_station_pressure.values,
+        )
 
         return epw.dry_bulb_temperature.get_aligned_collection(dbt_evap)
 
@@ -242,24 +230,12 @@ class Typology(BHoMObject):
             return epw.relative_humidity
 
         # if there is evaporative cooling effect, return the adjusted RH
-        rh_evap = []
-        for dbt, rh, ece, atm in list(
-            zip(
-                *[
-                    epw.dry_bulb_temperature,
-                    epw.relative_humidity,
-                    self.EvaporativeCoolingEffect,
-                    epw.atmospheric_station_pressure,
-                ]
-            )
-        ):
-            _, _rh = evaporative_cooling_effect(
-                dry_bulb_temperature=dbt,
-                relative_humidity=rh,
-                evaporative_cooling_effectiveness=ece,
-                atmospheric_pressure=atm,
-            )
-            rh_evap.append(_rh)
+        _, rh_evap = evaporative_cooling_effect(
+            dry_bulb_temperature=epw.dry_bulb_temperature.values,
+            relative_humidity=epw.relative_humidity.values,
+            evaporative_cooling_effectiveness=self.EvaporativeCoolingEffect,
+            atmospheric_pressure=epw.atmospheric_station_pressure.values,
+        )
 
         return epw.relative_humidity.get_aligned_collection(rh_evap)
 
@@ -1,8 +1,12 @@
 import calendar
+import math
+import os
+import sys
 import warnings
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Callable, List, Tuple, Union
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -13,7 +17,6 @@ from ladybug_comfort.collection.solarcal import OutdoorSolarCal
 from ladybug_comfort.collection.utci import UTCI
 from matplotlib.colors import BoundaryNorm, Colormap, ListedColormap
 from numpy.typing import NDArray
-from scipy.interpolate import interp1d, interp2d
 from tqdm import tqdm
 
 from ..helpers import evaporative_cooling_effect
@@ -169,11 +172,11 @@ def utci(
         ).universal_thermal_climate_index
 
     if all((isinstance(i, (float, int)) for i in _inputs)):
-        return utci_vectorised(
-            ta=air_temperature,
-            rh=relative_humidity,
-            tr=mean_radiant_temperature,
-            vel=np.clip([wind_speed], 0, 17)[0],
+        return _utci_scalar(
+            ta=float(air_temperature),
+            rh=float(relative_humidity),
+            tr=float(mean_radiant_temperature),
+            vel=max(0.0, min(17.0, float(wind_speed))),
         )
 
     if all((isinstance(i, pd.DataFrame) for i in _inputs)):
@@ -193,10 +196,10 @@ def utci(
     if all((isinstance(i, pd.Series) for i in _inputs)):
         return pd.Series(
             utci_vectorised(
-                ta=air_temperature,
-                rh=relative_humidity,
-                tr=mean_radiant_temperature,
-                vel=wind_speed.clip(lower=0, upper=17),
+                ta=air_temperature.values,
+                rh=relative_humidity.values,
+                tr=mean_radiant_temperature.values,
+                vel=wind_speed.clip(lower=0, upper=17).values,
             ),
             name="Universal Thermal Climate Index (C)",
             index=_inputs[0].index,
@@ -213,9 +216,9 @@ def utci(
     try:
         # assume numpy array
         return utci_vectorised(
-            ta=air_temperature,
-            rh=relative_humidity,
-            tr=mean_radiant_temperature,
+            ta=np.asarray(air_temperature),
+            rh=np.asarray(relative_humidity),
+            tr=np.asarray(mean_radiant_temperature),
             vel=np.clip(wind_speed, 0, 17),
         )
     except Exception as e:
@@ -224,6 +227,85 @@ def utci(
         )
 
 
+def _to_numpy_with_hoy_index(
+    collection: HourlyContinuousCollection,
+) -> Tuple[NDArray[np.float64], Dict[float, int]]:
+    """Convert a collection into a values array and a mapping from hour-of-year to
+        position in that array, so that it can be filtered by multiple analysis
+        periods without re-conversion.
+
+    Args:
+        collection (HourlyContinuousCollection):
+            A ladybug data collection.
+
+    Returns:
+        Tuple[NDArray[np.float64], Dict[float, int]]:
+            The collection values and a {hoy: index} lookup into them.
+    """
+    return np.array(collection.values), {
+        hoy: n for n, hoy in enumerate(collection.header.analysis_period.hoys)
+    }
+
+
+def _analysis_period_indices(
+    hoy_index: Dict[float, int], analysis_period: AnalysisPeriod
+) -> NDArray[np.intp]:
+    """Get the positions of the hours within an analysis period from a {hoy: index}
+        lookup, ignoring any hours that are not in the lookup.
+
+    Args:
+        hoy_index (Dict[float, int]):
+            A lookup from hour-of-year to position, from _to_numpy_with_hoy_index.
+        analysis_period (AnalysisPeriod):
+            The analysis period to get positions for.
+
+    Returns:
+        NDArray[np.intp]:
+            An array of positions that can be used to index the collection values.
+    """
+    return np.fromiter(
+        (hoy_index[hoy] for hoy in analysis_period.hoys if hoy in hoy_index),
+        dtype=np.intp,
+    )
+
+
+def _comfort_counts(
+    values: NDArray[np.float64], comfort_limits: Tuple[float, float] = (9, 26)
+) -> NDArray[np.int64]:
+    """Count the number of values below, within and above the given comfort limits
+        in a single pass.
+
+    Args:
+        values (NDArray[np.float64]):
+            A 1D array of UTCI values, or a 2D array with one set of UTCI values per
+            row.
+        comfort_limits (Tuple[float, float], optional):
+            Bespoke comfort limits. Defaults to (9, 26).
+
+    Returns:
+        NDArray[np.int64]:
+            The number of cold (x < low), comfortable (low ≤ x ≤ high) and hot
+            (x > high) values, as an array of shape (3,) for 1D values, or (3, n)
+            for 2D values.
+    """
+    limit_low, limit_high = comfort_limits
+    if limit_low > limit_high:
+        limit_low, limit_high = limit_high, limit_low
+    is_1d = np.ndim(values) == 1
+    values = np.atleast_2d(values)
+    n_rows = values.shape[0]
+
+    # NaN values fall into a fourth bucket so that they are not counted at all, and
+    # each row is offset into its own set of four buckets
+    buckets = (values >= limit_low).astype(np.intp) + (values > limit_high)
+    buckets += 3 * np.isnan(values)
+    buckets += 4 * np.arange(n_rows)[:, np.newaxis]
+    counts = np.bincount(buckets.ravel(), minlength=4 * n_rows)
+    counts = counts.reshape(n_rows, 4)[:, :3].T
+
+    return counts[:, 0] if is_1d else counts
+
+
 def compare_utci_collections(
     baseline: HourlyContinuousCollection,
     comparable: HourlyContinuousCollection,
@@ -259,23 +341,16 @@ def compare_utci_collections(
 
     ap_description = describe_analysis_period(analysis_period)
 
-    col_baseline = baseline.filter_by_analysis_period(analysis_period)
-    series_baseline = collection_to_series(col_baseline)
-    col_comparable = comparable.filter_by_analysis_period(analysis_period)
-    series_comparable = collection_to_series(col_comparable)
-
-    # total_number_of_hours = len(col_baseline)
-    comfortable_hours_baseline = (
-        (series_baseline >= 9) & (series_baseline <= 26)
-    ).sum()
-    hot_hours_baseline = (series_baseline > 26).sum()
-    cold_hours_baseline = (series_baseline < 9).sum()
+    values_baseline, hoy_index = _to_numpy_with_hoy_index(baseline)
+    values_comparable = np.array(comparable.values)
+    idx = _analysis_period_indices(hoy_index, analysis_period)
 
-    comfortable_hours_comparable = (
-        (series_comparable >= 9) & (series_comparable <= 26)
-    ).sum()
-    hot_hours_comparable = (series_comparable > 26).sum()
-    cold_hours_comparable = (series_comparable < 9).sum()
+    # count both collections in a single pass, giving (category, collection) counts
+    (
+        (cold_hours_baseline, cold_hours_comparable),
+        (comfortable_hours_baseline, comfortable_hours_comparable),
+        (hot_hours_baseline, hot_hours_comparable),
+    ) = _comfort_counts(np.stack([values_baseline[idx], values_comparable[idx]]))
 
     comfortable_hours_difference = (
         comfortable_hours_baseline - comfortable_hours_comparable
@@ -336,15 +411,16 @@ def describe_as_dataframe(
         f"Cold Stress [x < {limit_low}]",
     ]
 
+    values, hoy_index = _to_numpy_with_hoy_index(universal_thermal_climate_index)
+
     dfs = []
     for analysis_period in analysis_periods:
-        col = universal_thermal_climate_index.filter_by_analysis_period(analysis_period)
-        series = collection_to_series(col)
+        period_values = values[_analysis_period_indices(hoy_index, analysis_period)]
 
-        total_number_of_hours = len(series)
-        comfortable_hours = ((series >= limit_low) & (series <= limit_high)).sum()
-        hot_hours = (series > limit_high).sum()
-        cold_hours = (series < limit_low).sum()
+        total_number_of_hours = len(period_values)
+        cold_hours, comfortable_hours, hot_hours = _comfort_counts(
+            period_values, (limit_low, limit_high)
+        )
         comfortable_hours_percentage = comfortable_hours / total_number_of_hours
         hot_hours_percentage = hot_hours / total_number_of_hours
         cold_hours_percentage = cold_hours / total_number_of_hours
@@ -396,16 +472,16 @@ def summarise_utci(
 
     ap_description = describe_analysis_period(analysis_period, include_timestep=False)
 
-    col = universal_thermal_climate_index.filter_by_analysis_period(analysis_period)
-    series = collection_to_series(col)
+    values, hoy_index = _to_numpy_with_hoy_index(universal_thermal_climate_index)
+    period_values = values[_analysis_period_indices(hoy_index, analysis_period)]
 
     limit_low = min(comfort_limits)
     limit_high = max(comfort_limits)
 
-    total_number_of_hours = len(series)
-    comfortable_hours = ((series >= limit_low) & (series <= limit_high)).sum()
-    hot_hours = (series > limit_high).sum()
-    cold_hours = (series < limit_low).sum()
+    total_number_of_hours = len(period_values)
+    cold_hours, comfortable_hours, hot_hours = _comfort_counts(
+        period_values, (limit_low, limit_high)
+    )
 
     statements = [
         f"In this summary, thermal comfort or periods experiencing no thermal stress, are UTCI values of between {limit_low}°C and {limit_high}°C.",
@@ -458,20 +534,187 @@ def describe_monthly(
         utci_series, simplified=simplified, comfort_limits=comfort_limits
     )
 
-    # groupby month
+    # groupby month, using the row totals of the counts (which exclude NaN in the same
+    # way as a groupby count) to get the density without a second groupby
     df_summary = (
         utci_categories.groupby(utci_categories.index.month).value_counts().unstack()
     )
     if density:
-        df_summary = (
-            df_summary.T / utci_categories.groupby(utci_categories.index.month).count()
-        ).T
+        df_summary = df_summary.div(df_summary.sum(axis=1), axis=0)
 
     df_summary.index = [calendar.month_abbr[i] for i in df_summary.index]
 
     return df_summary
 
 
+# data below extracted from https://doi.org/10.7163/GPol.0199 in the format {MET: [UTCI, ΔUTCI]}
+_MET_RATE_UTCI_DELTAS = {
+    4.8: [
+        [-50, 71.81581439393939],
+        [-46.47239263803681, 71.5127840909091],
+        [-42.94478527607362, 71.36126893939394],
+        [-38.95705521472392, 70.14914772727273],
+        [-34.96932515337423, 67.421875],
+        [-30.521472392638035, 64.69460227272728],
+        [-26.993865030674847, 61.66429924242425],
+        [-23.006134969325153, 58.33096590909091],
+        [-17.944785276073617, 52.87642045454545],
+        [-12.576687116564415, 48.63399621212122],
+        [-6.441717791411044, 43.63399621212122],
+        [-1.380368098159508, 40.300662878787875],
+        [4.29447852760736, 35.755208333333336],
+        [9.815950920245399, 30.906723484848484],
+        [15.490797546012274, 26.512784090909093],
+        [23.00613496932516, 20.755208333333336],
+        [28.06748466257669, 16.967329545454547],
+        [30.98159509202455, 15.452178030303031],
+        [35.889570552147234, 12.573390151515156],
+        [42.63803680981596, 9.846117424242422],
+        [50, 6.967329545454547],
+    ],
+    4.0: [
+        [-50, 46.05823863636364],
+        [-47.69938650306749, 47.421875],
+        [-45.0920245398773, 48.63399621212122],
+        [-43.86503067484662, 50.60369318181819],
+        [-40.1840490797546, 51.96732954545455],
+        [-36.04294478527608, 51.36126893939394],
+        [-33.74233128834356, 50.906723484848484],
+        [-30.67484662576687, 49.543087121212125],
+        [-27.300613496932513, 47.87642045454545],
+        [-24.846625766871163, 46.36126893939394],
+        [-23.159509202453986, 44.99763257575758],
+        [-20.39877300613497, 42.87642045454545],
+        [-16.871165644171782, 39.69460227272728],
+        [-14.11042944785276, 37.573390151515156],
+        [-11.04294478527607, 35.60369318181819],
+        [-7.515337423312886, 34.24005681818182],
+        [-3.374233128834355, 32.27035984848485],
+        [1.0736196319018418, 29.84611742424243],
+        [4.141104294478531, 28.02793560606061],
+        [7.055214723926383, 25.45217803030303],
+        [9.969325153374236, 23.482481060606062],
+        [13.036809815950924, 21.664299242424242],
+        [16.41104294478528, 19.543087121212125],
+        [19.631901840490798, 17.27035984848485],
+        [22.852760736196316, 14.846117424242422],
+        [26.22699386503068, 12.724905303030305],
+        [29.601226993865026, 11.664299242424242],
+        [33.28220858895706, 9.846117424242422],
+        [36.65644171779141, 8.785511363636367],
+        [39.87730061349693, 8.330965909090907],
+        [42.63803680981596, 7.421875],
+        [46.012269938650306, 6.664299242424242],
+        [50, 5.452178030303031],
+    ],
+    3.4: [
+        [-50, 27.724905303030305],
+        [-47.239263803680984, 28.785511363636367],
+        [-44.47852760736196, 29.543087121212125],
+        [-41.717791411042946, 30.45217803030303],
+        [-38.34355828220859, 31.05823863636364],
+        [-35.2760736196319, 31.05823863636364],
+        [-33.43558282208589, 31.361268939393938],
+        [-30.98159509202454, 31.815814393939398],
+        [-28.220858895705522, 31.967329545454547],
+        [-26.380368098159508, 31.05823863636364],
+        [-24.846625766871163, 30.300662878787882],
+        [-23.006134969325153, 29.694602272727273],
+        [-21.165644171779142, 28.482481060606062],
+        [-18.558282208588956, 26.967329545454547],
+        [-16.411042944785272, 25.755208333333336],
+        [-14.11042944785276, 24.39157196969697],
+        [-11.65644171779141, 23.02793560606061],
+        [-8.742331288343557, 23.179450757575758],
+        [-5.828220858895705, 23.330965909090914],
+        [-2.4539877300613497, 22.573390151515156],
+        [0.6134969325153392, 21.361268939393938],
+        [3.374233128834355, 19.846117424242422],
+        [6.74846625766871, 17.876420454545453],
+        [9.662576687116562, 16.512784090909093],
+        [12.883435582822088, 14.846117424242422],
+        [16.104294478527606, 14.088541666666664],
+        [19.631901840490798, 11.815814393939398],
+        [22.085889570552155, 10.300662878787882],
+        [24.84662576687117, 8.785511363636367],
+        [28.52760736196319, 8.027935606060609],
+        [31.44171779141105, 7.1188446969696955],
+        [34.20245398773007, 6.058238636363637],
+        [37.269938650306756, 5.755208333333336],
+        [40.03067484662577, 5.452178030303031],
+        [42.94478527607362, 4.846117424242426],
+        [46.012269938650306, 4.088541666666668],
+        [50, 3.9370265151515156],
+    ],
+    2.3: [
+        [-50, -0.15151515151515227],
+        [50, 0],
+    ],
+    1.1: [
+        [-50, -27.87878787878788],
+        [-48.15950920245399, -26.96969696969697],
+        [-45.858895705521476, -26.21212121212121],
+        [-44.6319018404908, -24.09090909090909],
+        [-42.484662576687114, -21.96969696969697],
+        [-39.57055214723926, -19.848484848484848],
+        [-36.04294478527608, -19.242424242424242],
+        [-32.20858895705521, -20],
+        [-29.447852760736197, -21.363636363636363],
+        [-25.460122699386503, -23.03030303030303],
+        [-22.54601226993865, -24.848484848484848],
+        [-19.32515337423313, -26.666666666666668],
+        [-16.257668711656443, -28.484848484848484],
+        [-13.34355828220859, -30.151515151515152],
+        [-9.509202453987726, -30.90909090909091],
+        [-5.981595092024541, -31.060606060606062],
+        [-3.067484662576689, -29.393939393939394],
+        [-1.380368098159508, -27.272727272727273],
+        [0, -24.848484848484848],
+        [1.0736196319018418, -21.666666666666668],
+        [2.760736196319016, -18.78787878787879],
+        [4.141104294478531, -15.909090909090908],
+        [6.74846625766871, -13.484848484848484],
+        [9.969325153374236, -11.818181818181818],
+        [13.190184049079754, -11.363636363636363],
+        [16.257668711656436, -9.242424242424242],
+        [19.785276073619627, -9.696969696969697],
+        [23.00613496932516, -10.303030303030303],
+        [26.380368098159508, -9.242424242424242],
+        [29.447852760736197, -7.272727272727273],
+        [32.515337423312886, -6.363636363636363],
+        [35.582822085889575, -5.303030303030301],
+        [38.650306748466264, -5.151515151515152],
+        [41.25766871165645, -4.3939393939393945],
+        [44.018404907975466, -3.787878787878789],
+        [46.31901840490798, -3.333333333333332],
+        [50, -3.6363636363636367],
+    ],
+}
+
+
+@lru_cache(maxsize=1)
+def _met_rate_delta_grid() -> (
+    Tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+):
+    """Densify each MET rate [UTCI] vs [ΔUTCI] relationship onto a common (regular)
+        UTCI axis. This is only built once, on first use.
+
+    Returns:
+        Tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+            The sorted MET rates, the common UTCI axis and the (n_met_rates, n_utci)
+            ΔUTCI grid.
+    """
+    met_rates = np.array(sorted(_MET_RATE_UTCI_DELTAS.keys()))
+    utci_values = np.linspace(-50, 50, 1000)
+    utci_deltas = np.empty((len(met_rates), len(utci_values)))
+    for n, met_rate in enumerate(met_rates):
+        x, y = np.array(_MET_RATE_UTCI_DELTAS[met_rate]).T
+        utci_deltas[n] = np.interp(utci_values, x, y)
+    for arr in (met_rates, utci_values, utci_deltas):
+        arr.flags.writeable = False
+    return met_rates, utci_values, utci_deltas
+
+
 def met_rate_adjustment(
     utci_collection: HourlyContinuousCollection, met: float
 ) -> HourlyContinuousCollection:
@@ -516,175 +759,28 @@ def met_rate_adjustment(
             "met_rate must be <= 4.8 (representative of a exercise at 5-6km·h-1)."
         )
 
-    # data below extracted from https://doi.org/10.7163/GPol.0199 in the format {MET: [UTCI, ΔUTCI]}
-    data = {
-        4.8: [
-            [-50, 71.81581439393939],
-            [-46.47239263803681, 71.5127840909091],
-            [-42.94478527607362, 71.36126893939394],
-            [-38.95705521472392, 70.14914772727273],
-            [-34.96932515337423, 67.421875],
-            [-30.521472392638035, 64.69460227272728],
-            [-26.993865030674847, 61.66429924242425],
-            [-23.006134969325153, 58.33096590909091],
-            [-17.944785276073617, 52.87642045454545],
-            [-12.576687116564415, 48.63399621212122],
-            [-6.441717791411044, 43.63399621212122],
-            [-1.380368098159508, 40.300662878787875],
-            [4.29447852760736, 35.755208333333336],
-            [9.815950920245399, 30.906723484848484],
-            [15.490797546012274, 26.512784090909093],
-            [23.00613496932516, 20.755208333333336],
-            [28.06748466257669, 16.967329545454547],
-            [30.98159509202455, 15.452178030303031],
-            [35.889570552147234, 12.573390151515156],
-            [42.63803680981596, 9.846117424242422],
-            [50, 6.967329545454547],
-        ],
-        4.0: [
-            [-50, 46.05823863636364],
-            [-47.69938650306749, 47.421875],
-            [-45.0920245398773, 48.63399621212122],
-            [-43.86503067484662, 50.60369318181819],
-            [-40.1840490797546, 51.96732954545455],
-            [-36.04294478527608, 51.36126893939394],
-            [-33.74233128834356, 50.906723484848484],
-            [-30.67484662576687, 49.543087121212125],
-            [-27.300613496932513, 47.87642045454545],
-            [-24.846625766871163, 46.36126893939394],
-            [-23.159509202453986, 44.99763257575758],
-            [-20.39877300613497, 42.87642045454545],
-            [-16.871165644171782, 39.69460227272728],
-            [-14.11042944785276, 37.573390151515156],
-            [-11.04294478527607, 35.60369318181819],
-            [-7.515337423312886, 34.24005681818182],
-            [-3.374233128834355, 32.27035984848485],
-            [1.0736196319018418, 29.84611742424243],
-            [4.141104294478531, 28.02793560606061],
-            [7.055214723926383, 25.45217803030303],
-            [9.969325153374236, 23.482481060606062],
-            [13.036809815950924, 21.664299242424242],
-            [16.41104294478528, 19.543087121212125],
-            [19.631901840490798, 17.27035984848485],
-            [22.852760736196316, 14.846117424242422],
-            [26.22699386503068, 12.724905303030305],
-            [29.601226993865026, 11.664299242424242],
-            [33.28220858895706, 9.846117424242422],
-            [36.65644171779141, 8.785511363636367],
-            [39.87730061349693, 8.330965909090907],
-            [42.63803680981596, 7.421875],
-            [46.012269938650306, 6.664299242424242],
-            [50, 5.452178030303031],
-        ],
-        3.4: [
-            [-50, 27.724905303030305],
-            [-47.239263803680984, 28.785511363636367],
-            [-44.47852760736196, 29.543087121212125],
-            [-41.717791411042946, 30.45217803030303],
-            [-38.34355828220859, 31.05823863636364],
-            [-35.2760736196319, 31.05823863636364],
-            [-33.43558282208589, 31.361268939393938],
-            [-30.98159509202454, 31.815814393939398],
-            [-28.220858895705522, 31.967329545454547],
-            [-26.380368098159508, 31.05823863636364],
-            [-24.846625766871163, 30.300662878787882],
-            [-23.006134969325153, 29.694602272727273],
-            [-21.165644171779142, 28.482481060606062],
-            [-18.558282208588956, 26.967329545454547],
-            [-16.411042944785272, 25.755208333333336],
-            [-14.11042944785276, 24.39157196969697],
-            [-11.65644171779141, 23.02793560606061],
-            [-8.742331288343557, 23.179450757575758],
-            [-5.828220858895705, 23.330965909090914],
-            [-2.4539877300613497, 22.573390151515156],
-            [0.6134969325153392, 21.361268939393938],
-            [3.374233128834355, 19.846117424242422],
-            [6.74846625766871, 17.876420454545453],
-            [9.662576687116562, 16.512784090909093],
-            [12.883435582822088, 14.846117424242422],
-            [16.104294478527606, 14.088541666666664],
-            [19.631901840490798, 11.815814393939398],
-            [22.085889570552155, 10.300662878787882],
-            [24.84662576687117, 8.785511363636367],
-            [28.52760736196319, 8.027935606060609],
-            [31.44171779141105, 7.1188446969696955],
-            [34.20245398773007, 6.058238636363637],
-            [37.269938650306756, 5.755208333333336],
-            [40.03067484662577, 5.452178030303031],
-            [42.94478527607362, 4.846117424242426],
-            [46.012269938650306, 4.088541666666668],
-            [50, 3.9370265151515156],
-        ],
-        2.3: [
-            [-50, -0.15151515151515227],
-            [50, 0],
-        ],
-        1.1: [
-            [-50, -27.87878787878788],
-            [-48.15950920245399, -26.96969696969697],
-            [-45.858895705521476, -26.21212121212121],
-            [-44.6319018404908, -24.09090909090909],
-            [-42.484662576687114, -21.96969696969697],
-            [-39.57055214723926, -19.848484848484848],
-            [-36.04294478527608, -19.242424242424242],
-            [-32.20858895705521, -20],
-            [-29.447852760736197, -21.363636363636363],
-            [-25.460122699386503, -23.03030303030303],
-            [-22.54601226993865, -24.848484848484848],
-            [-19.32515337423313, -26.666666666666668],
-            [-16.257668711656443, -28.484848484848484],
-            [-13.34355828220859, -30.151515151515152],
-            [-9.509202453987726, -30.90909090909091],
-            [-5.981595092024541, -31.060606060606062],
-            [-3.067484662576689, -29.393939393939394],
-            [-1.380368098159508, -27.272727272727273],
-            [0, -24.848484848484848],
-            [1.0736196319018418, -21.666666666666668],
-            [2.760736196319016, -18.78787878787879],
-            [4.141104294478531, -15.909090909090908],
-            [6.74846625766871, -13.484848484848484],
-            [9.969325153374236, -11.818181818181818],
-            [13.190184049079754, -11.363636363636363],
-            [16.257668711656436, -9.242424242424242],
-            [19.785276073619627, -9.696969696969697],
-            [23.00613496932516, -10.303030303030303],
-            [26.380368098159508, -9.242424242424242],
-            [29.447852760736197, -7.272727272727273],
-            [32.515337423312886, -6.363636363636363],
-            [35.582822085889575, -5.303030303030301],
-            [38.650306748466264, -5.151515151515152],
-            [41.25766871165645, -4.3939393939393945],
-            [44.018404907975466, -3.787878787878789],
-            [46.31901840490798, -3.333333333333332],
-            [50, -3.6363636363636367],
-        ],
-    }
-
-    matrix = []
-    for k, v in data.items():
-        x, y = np.array(v).T
-        f = interp1d(x, y)
-        new_x = np.linspace(-50, 50, 1000)
-        new_y = f(new_x)
-        matrix.append(pd.Series(index=new_x, data=new_y, name=k))
-    met_rate, utci_val, utci_delta = (
-        pd.concat(matrix, axis=1).unstack().reset_index().values.T
-    )
+    met_rates, utci_values, utci_deltas = _met_rate_delta_grid()
 
-    # create 2d interpolator between [MET, UTCI] and [ΔUTCI]
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        forecaster = interp2d(met_rate, utci_val, utci_delta)
+    # interpolate linearly between the bounding MET rates to get [UTCI] vs [ΔUTCI] at
+    # the target MET rate
+    n = int(np.clip(np.searchsorted(met_rates, met) - 1, 0, len(met_rates) - 2))
+    weight = (met - met_rates[n]) / (met_rates[n + 1] - met_rates[n])
+    met_utci_deltas = (1 - weight) * utci_deltas[n] + weight * utci_deltas[n + 1]
 
-    # Calculate ΔUTCI
-    original_utci = collection_to_series(utci_collection)
-    utci_delta = [forecaster(met, i)[0] for i in original_utci.values]
+    # Calculate ΔUTCI, holding values outside the UTCI range at their nearest limit
+    original_utci = np.array(utci_collection.values)
+    utci_delta = np.interp(original_utci, utci_values, met_utci_deltas)
 
-    return collection_from_series(original_utci + utci_delta)
+    return utci_collection.get_aligned_collection((original_utci + utci_delta).tolist())
 
 
 def utci_parallel(
-    ta: np.ndarray, tr: np.ndarray, vel: np.ndarray, rh: np.ndarray
+    ta: np.ndarray,
+    tr: np.ndarray,
+    vel: np.ndarray,
+    rh: np.ndarray,
+    progress: bool = True,
+    dtype: np.dtype = None,
 ) -> np.ndarray:
     """Calculate UTCI a bit faster!
 
@@ -697,38 +793,376 @@ def utci_parallel(
             Wind speed 10m above ground level [m/s]
         rh (np.ndarray):
             Relative humidity [%]
+        progress (bool, optional):
+            Show a progress bar when running in an interactive terminal. Defaults
+            to True.
+        dtype (np.dtype, optional):
+            The dtype to calculate each block in, e.g. np.float32 for large grids.
+            Defaults to None, which leaves inputs as given.
 
     Returns:
         np.ndarray:
             UTCI values.
     """
 
-    if ta.shape != tr.shape != vel.shape != rh.shape:
+    if len({i.shape for i in (ta, tr, vel, rh)}) != 1:
         raise ValueError("Input arrays must be of the same shape.")
-    if any(
-        [
-            len(ta.shape) != 2,
-            len(tr.shape) != 2,
-            len(vel.shape) != 2,
-            len(rh.shape) != 2,
-        ]
-    ):
+    if ta.ndim != 2:
         raise ValueError("Input arrays must be of shape (n, m).")
 
-    with ProcessPoolExecutor() as executor:
+    # split into one contiguous block of rows per thread - NumPy releases the GIL
+    # during array arithmetic, so threads avoid the cost of pickling data between
+    # processes
+    n_blocks = min(len(ta), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=n_blocks) as executor:
         results = list(
             tqdm(
-                executor.map(utci_vectorised, ta, tr, vel, rh),
-                total=len(ta),
+                executor.map(
+                    partial(utci_vectorised, dtype=dtype),
+                    np.array_split(ta, n_blocks),
+                    np.array_split(tr, n_blocks),
+                    np.array_split(vel, n_blocks),
+                    np.array_split(rh, n_blocks),
+                ),
+                total=n_blocks,
                 desc="Calculating UTCI: ",
+                disable=not (progress and sys.stderr.isatty()),
             )
         )
 
-    return np.concatenate(results).reshape(ta.shape)
+    return np.concatenate(results)
+
+
+# coefficients of the 6th order polynomial approximation of UTCI - UTCI minus air
+# temperature - nested by [pa_pr power][d_tr power][vel power][ta power]
+_UTCI_COEFFICIENTS = (
+    (  # pa_pr ** 0
+        (  # d_tr ** 0
+            (
+                0.607562052,
+                -0.0227712343,
+                8.06470249e-4,
+                -1.54271372e-4,
+                -3.24651735e-6,
+                7.32602852e-8,
+                1.35959073e-9,
+            ),  # vel ** 0
+            (
+                -2.25836520,
+                0.0880326035,
+                0.00216844454,
+                -1.53347087e-5,
+                -5.72983704e-7,
+                -2.55090145e-9,
+            ),  # vel ** 1
+            (
+                -0.751269505,
+                -0.00408350271,
+                -5.21670675e-5,
+                1.94544667e-6,
+                1.14099531e-8,
+            ),  # vel ** 2
+            (0.158137256, -6.57263143e-5, 2.22697524e-7, -4.16117031e-8),  # vel ** 3
+            (-0.0127762753, 9.66891875e-6, 2.52785852e-9),  # vel ** 4
+            (4.56306672e-4, -1.74202546e-7),  # vel ** 5
+            (-5.91491269e-6,),  # vel ** 6
+        ),
+        (  # d_tr ** 1
+            (
+                0.398374029,
+                1.83945314e-4,
+                -1.73754510e-4,
+                -7.60781159e-7,
+                3.77830287e-8,
+                5.43079673e-10,
+            ),  # vel ** 0
+            (
+                -0.0200518269,
+                8.92859837e-4,
+                3.45433048e-6,
+                -3.77925774e-7,
+                -1.69699377e-9,
+            ),  # vel ** 1
+            (1.69992415e-4, -4.99204314e-5, 2.47417178e-7, 1.07596466e-8),  # vel ** 2
+            (8.49242932e-5, 1.35191328e-6, -6.21531254e-9),  # vel ** 3
+            (-4.99410301e-6, -1.89489258e-8),  # vel ** 4
+            (8.15300114e-8,),  # vel ** 5
+        ),
+        (  # d_tr ** 2
+            (
+                7.55043090e-4,
+                -5.65095215e-5,
+                -4.52166564e-7,
+                2.46688878e-8,
+                2.42674348e-10,
+            ),  # vel ** 0
+            (1.54547250e-4, 5.24110970e-6, -8.75874982e-8, -1.50743064e-9),  # vel ** 1
+            (-1.56236307e-5, -1.33895614e-7, 2.49709824e-9),  # vel ** 2
+            (6.51711721e-7, 1.94960053e-9),  # vel ** 3
+            (-1.00361113e-8,),  # vel ** 4
+        ),
+        (  # d_tr ** 3
+            (-1.21206673e-5, -2.18203660e-7, 7.51269482e-9, 9.79063848e-11),  # vel ** 0
+            (1.25006734e-6, -1.81584736e-9, -3.52197671e-10),  # vel ** 1
+            (-3.36514630e-8, 1.35908359e-10),  # vel ** 2
+            (4.17032620e-10,),  # vel ** 3
+        ),
+        (  # d_tr ** 4
+            (-1.30369025e-9, 4.13908461e-10, 9.22652254e-12),  # vel ** 0
+            (-5.08220384e-9, -2.24730961e-11),  # vel ** 1
+            (1.17139133e-10,),  # vel ** 2
+        ),
+        (  # d_tr ** 5
+            (6.62154879e-10, 4.03863260e-13),  # vel ** 0
+            (1.95087203e-12,),  # vel ** 1
+        ),
+        ((-4.73602469e-12,),),  # d_tr ** 6  # vel ** 0
+    ),
+    (  # pa_pr ** 1
+        (  # d_tr ** 0
+            (
+                5.12733497,
+                -0.312788561,
+                -0.0196701861,
+                9.99690870e-4,
+                9.51738512e-6,
+                -4.66426341e-7,
+            ),  # vel ** 0
+            (
+                0.548050612,
+                -0.00330552823,
+                -0.00164119440,
+                -5.16670694e-6,
+                9.52692432e-7,
+            ),  # vel ** 1
+            (-0.0429223622, 0.00500845667, 1.00601257e-6, -1.81748644e-6),  # vel ** 2
+            (-1.25813502e-3, -1.79330391e-4, 2.34994441e-6),  # vel ** 3
+            (1.29735808e-4, 1.29064870e-6),  # vel ** 4
+            (-2.28558686e-6,),  # vel ** 5
+        ),
+        (  # d_tr ** 1
+            (
+                -0.0369476348,
+                0.00162325322,
+                -3.14279680e-5,
+                2.59835559e-6,
+                -4.77136523e-8,
+            ),  # vel ** 0
+            (8.64203390e-3, -6.87405181e-4, -9.13863872e-6, 5.15916806e-7),  # vel ** 1
+            (-3.59217476e-5, 3.28696511e-5, -7.10542454e-7),  # vel ** 2
+            (-1.24382300e-5, -7.38584400e-9),  # vel ** 3
+            (2.20609296e-7,),  # vel ** 4
+        ),
+        (  # d_tr ** 2
+            (-7.32469180e-4, -1.87381964e-5, 4.80925239e-6, -8.75492040e-8),  # vel ** 0
+            (2.77862930e-5, -5.06004592e-6, 1.14325367e-7),  # vel ** 1
+            (2.53016723e-6, -1.72857035e-8),  # vel ** 2
+            (-3.95079398e-8,),  # vel ** 3
+        ),
+        (  # d_tr ** 3
+            (-3.59413173e-7, 7.04388046e-7, -1.89309167e-8),  # vel ** 0
+            (-4.79768731e-7, 7.96079978e-9),  # vel ** 1
+            (1.62897058e-9,),  # vel ** 2
+        ),
+        (  # d_tr ** 4
+            (3.94367674e-8, -1.18566247e-9),  # vel ** 0
+            (3.34678041e-10,),  # vel ** 1
+        ),
+        ((-1.15606447e-10,),),  # d_tr ** 5  # vel ** 0
+    ),
+    (  # pa_pr ** 2
+        (  # d_tr ** 0
+            (
+                -2.80626406,
+                0.548712484,
+                -0.00399428410,
+                -9.54009191e-4,
+                1.93090978e-5,
+            ),  # vel ** 0
+            (-0.308806365, 0.0116952364, 4.95271903e-4, -1.90710882e-5),  # vel ** 1
+            (0.00210787756, -6.98445738e-4, 2.30109073e-5),  # vel ** 2
+            (4.17856590e-4, -1.27043871e-5),  # vel ** 3
+            (-3.04620472e-6,),  # vel ** 4
+        ),
+        (  # d_tr ** 1
+            (0.0514507424, -0.00432510997, 8.99281156e-5, -7.14663943e-7),  # vel ** 0
+            (-2.66016305e-4, 2.63789586e-4, -7.01199003e-6),  # vel ** 1
+            (-1.06823306e-4, 3.61341136e-6),  # vel ** 2
+            (2.29748967e-7,),  # vel ** 3
+        ),
+        (  # d_tr ** 2
+            (3.04788893e-4, -6.42070836e-5, 1.16257971e-6),  # vel ** 0
+            (7.68023384e-6, -5.47446896e-7),  # vel ** 1
+            (-3.59937910e-8,),  # vel ** 2
+        ),
+        (  # d_tr ** 3
+            (-4.36497725e-6, 1.68737969e-7),  # vel ** 0
+            (2.67489271e-8,),  # vel ** 1
+        ),
+        ((3.23926897e-9,),),  # d_tr ** 4  # vel ** 0
+    ),
+    (  # pa_pr ** 3
+        (  # d_tr ** 0
+            (-0.0353874123, -0.221201190, 0.0155126038, -2.63917279e-4),  # vel ** 0
+            (0.0453433455, -0.00432943862, 1.45389826e-4),  # vel ** 1
+            (2.17508610e-4, -6.66724702e-5),  # vel ** 2
+            (3.33217140e-5,),  # vel ** 3
+        ),
+        (  # d_tr ** 1
+            (-0.00226921615, 3.80261982e-4, -5.45314314e-9),  # vel ** 0
+            (-7.96355448e-4, 2.53458034e-5),  # vel ** 1
+            (-6.31223658e-6,),  # vel ** 2
+        ),
+        (  # d_tr ** 2
+            (3.02122035e-4, -4.77403547e-6),  # vel ** 0
+            (1.73825715e-6,),  # vel ** 1
+        ),
+        ((-4.09087898e-7,),),  # d_tr ** 3  # vel ** 0
+    ),
+    (  # pa_pr ** 4
+        (  # d_tr ** 0
+            (0.614155345, -0.0616755931, 0.00133374846),  # vel ** 0
+            (0.00355375387, -5.13027851e-4),  # vel ** 1
+            (1.02449757e-4,),  # vel ** 2
+        ),
+        (  # d_tr ** 1
+            (-0.00148526421, -4.11469183e-5),  # vel ** 0
+            (-6.80434415e-6,),  # vel ** 1
+        ),
+        ((-9.77675906e-6,),),  # d_tr ** 2  # vel ** 0
+    ),
+    (  # pa_pr ** 5
+        (  # d_tr ** 0
+            (0.0882773108, -0.00301859306),  # vel ** 0
+            (0.00104452989,),  # vel ** 1
+        ),
+        ((2.47090539e-4,),),  # d_tr ** 1  # vel ** 0
+    ),
+    (((0.00148348065,),),),  # pa_pr ** 6  # d_tr ** 0  # vel ** 0
+)
+
+
+def _horner(x: Any, coefficients: Tuple[Any]) -> Any:
+    """Evaluate a polynomial using Horner's method.
+
+    Args:
+        x (Any):
+            The value/s at which to evaluate the polynomial.
+        coefficients (Tuple[Any]):
+            The polynomial coefficients, in ascending order of power.
+
+    Returns:
+        Any:
+            The evaluated polynomial.
+    """
+    if len(coefficients) == 1:
+        return coefficients[0]
+
+    if isinstance(x, np.ndarray):
+        # start from a new array with the full broadcast shape of x and the
+        # coefficients, then accumulate in-place to avoid allocating per term
+        shape = np.broadcast_shapes(np.shape(x), *(np.shape(c) for c in coefficients))
+        result = x * coefficients[-1] + coefficients[-2]
+        if result.shape != shape:
+            result = np.broadcast_to(result, shape).copy()
+        for coefficient in coefficients[-3::-1]:
+            result *= x
+            result += coefficient
+        return result
+
+    result = coefficients[-1]
+    for coefficient in coefficients[-2::-1]:
+        result = result * x + coefficient
+    return result
+
+
+def _utci_polynomial(ta: Any, vel: Any, d_tr: Any, pa_pr: Any) -> Any:
+    """Evaluate the UTCI polynomial approximation as nested Horner-form polynomials, so
+        that each power of each variable is only applied once per term group.
+
+    Args:
+        ta (Any): Air temperature [C]
+        vel (Any): Wind speed 10 m above ground level [m/s]
+        d_tr (Any): Difference between mean radiant and air temperature [C]
+        pa_pr (Any): Partial vapour pressure [kPa]
+
+    Returns:
+        Any: The offset between UTCI and air temperature.
+    """
+    return _horner(
+        pa_pr,
+        [
+            _horner(
+                d_tr,
+                [
+                    _horner(vel, [_horner(ta, c_vel) for c_vel in c_d_tr])
+                    for c_d_tr in c_pa_pr
+                ],
+            )
+            for c_pa_pr in _UTCI_COEFFICIENTS
+        ],
+    )
+
+
+# saturation vapour pressure coefficients for tk ** -2 to tk ** 4
+_SATURATION_VAPOUR_PRESSURE_COEFFICIENTS = (
+    -2836.5744,
+    -6028.076559,
+    19.54263612,
+    -0.02737830188,
+    0.000016261698,
+    7.0229056e-10,
+    -1.8680009e-13,
+)
+
+
+def _saturation_vapour_pressure_exponent(tk: Any, log_tk: Any) -> Any:
+    """Return the natural log of saturation vapour pressure [Pa] over water, with
+        the negative and positive powers of temperature each in Horner form.
+
+    Args:
+        tk (Any): Air temperature [K]
+        log_tk (Any): The natural log of air temperature [K]
+
+    Returns:
+        Any: The natural log of saturation vapour pressure [Pa]
+    """
+    g = _SATURATION_VAPOUR_PRESSURE_COEFFICIENTS
+    return 2.7150305 * log_tk + (g[0] / tk + g[1]) / tk + _horner(tk, g[2:])
+
+
+def _utci_scalar(ta: float, tr: float, vel: float, rh: float) -> float:
+    """Calculate UTCI for a single set of scalar inputs, using plain Python floats to
+        avoid the overhead of creating and dispatching many single-element arrays.
+
+    Args:
+        ta (float): Air temperature [C]
+        tr (float): Mean radiant temperature [C]
+        vel (float): Wind speed 10 m above ground level [m/s]
+        rh (float): Relative humidity [%]
+
+    Returns:
+        float: The Universal Thermal Climate Index (UTCI) for the input conditions.
+    """
+    tk = ta + 273.15  # air temp in K
+    es = math.exp(_saturation_vapour_pressure_exponent(tk, math.log(tk))) * 0.01
+    pa_pr = es * (rh / 100.0) / 10.0  # partial vapor pressure in kPa
+    d_tr = tr - ta  # difference between radiant and air temperature
+
+    return ta + _utci_polynomial(ta, vel, d_tr, pa_pr)
+
+
+# number of values to evaluate at a time in utci_vectorised - small enough for the
+# intermediate arrays of each block to stay in CPU cache
+_UTCI_BLOCK_SIZE = 16384
 
 
 def utci_vectorised(
-    ta: np.ndarray, tr: np.ndarray, vel: np.ndarray, rh: np.ndarray
+    ta: np.ndarray,
+    tr: np.ndarray,
+    vel: np.ndarray,
+    rh: np.ndarray,
+    dtype: np.dtype = None,
 ) -> np.ndarray:
     """This method is a vectorised version of the universal_thermal_climate_index method defined in ladybug-tools
     https://github.com/ladybug-tools/ladybug-comfort/blob/master/ladybug_comfort/utci.py
@@ -738,250 +1172,61 @@ def utci_vectorised(
         tr (np.ndarray): Mean radiant temperature [C]
         vel (np.ndarray): Wind speed 10 m above ground level [m/s]
         rh (np.ndarray): Relative humidity [%]
+        dtype (np.dtype, optional): The dtype to cast inputs to before calculation. Use
+            np.float32 to halve memory use on large grids, at the cost of up to
+            ~0.02C difference from float64 results. Defaults to None, which leaves
+            inputs as given.
 
     Returns:
         np.ndarray: The Universal Thermal Climate Index (UTCI) for the input conditions as approximated by a 4-D polynomial
     """
 
-    g = (
-        -2836.5744,
-        -6028.076559,
-        19.54263612,
-        -0.02737830188,
-        0.000016261698,
-        7.0229056e-10,
-        -1.8680009e-13,
-    )
+    if dtype is not None:
+        ta, tr, vel, rh = (np.asarray(i, dtype=dtype) for i in (ta, tr, vel, rh))
+
+    _inputs = (ta, tr, vel, rh)
+    if (
+        all(isinstance(i, np.ndarray) for i in _inputs)
+        and len({i.shape for i in _inputs}) == 1
+        and ta.size > _UTCI_BLOCK_SIZE
+    ):
+        # evaluate large arrays in cache-sized blocks, so the intermediate arrays are
+        # reused from cache rather than streamed to and from main memory
+        flat_inputs = [i.reshape(-1) for i in _inputs]
+        utci_approx = np.empty(ta.size, dtype=np.result_type(*_inputs, 1.0))
+        for start in range(0, ta.size, _UTCI_BLOCK_SIZE):
+            block = slice(start, start + _UTCI_BLOCK_SIZE)
+            utci_approx[block] = _utci_block(*(i[block] for i in flat_inputs))
+        return utci_approx.reshape(ta.shape)
+
+    return _utci_block(ta, tr, vel, rh)
+
+
+def _utci_block(ta: Any, tr: Any, vel: Any, rh: Any) -> Any:
+    """Evaluate UTCI for a single block of (broadcastable) inputs.
+
+    Args:
+        ta (Any): Air temperature [C]
+        tr (Any): Mean radiant temperature [C]
+        vel (Any): Wind speed 10 m above ground level [m/s]
+        rh (Any): Relative humidity [%]
+
+    Returns:
+        Any: The Universal Thermal Climate Index (UTCI) for the input conditions.
+    """
     tk = ta + 273.15  # air temp in K
-    es = 2.7150305 * np.log(tk)
-    for i, x in enumerate(g):
-        es = es + (x * (tk ** (i - 2)))
-    es = np.exp(es) * 0.01
+    es = np.exp(_saturation_vapour_pressure_exponent(tk, np.log(tk))) * 0.01
     eh_pa = es * (rh / 100.0)  # partial vapor pressure
     pa_pr = eh_pa / 10.0  # convert vapour pressure to kPa
     d_tr = tr - ta  # difference between radiant and air temperature
 
-    utci_approx = (
-        ta
-        + 0.607562052
-        + -0.0227712343 * ta
-        + 8.06470249e-4 * ta * ta
-        + -1.54271372e-4 * ta * ta * ta
-        + -3.24651735e-6 * ta * ta * ta * ta
-        + 7.32602852e-8 * ta * ta * ta * ta * ta
-        + 1.35959073e-9 * ta * ta * ta * ta * ta * ta
-        + -2.25836520 * vel
-        + 0.0880326035 * ta * vel
-        + 0.00216844454 * ta * ta * vel
-        + -1.53347087e-5 * ta * ta * ta * vel
-        + -5.72983704e-7 * ta * ta * ta * ta * vel
-        + -2.55090145e-9 * ta * ta * ta * ta * ta * vel
-        + -0.751269505 * vel * vel
-        + -0.00408350271 * ta * vel * vel
-        + -5.21670675e-5 * ta * ta * vel * vel
-        + 1.94544667e-6 * ta * ta * ta * vel * vel
-        + 1.14099531e-8 * ta * ta * ta * ta * vel * vel
-        + 0.158137256 * vel * vel * vel
-        + -6.57263143e-5 * ta * vel * vel * vel
-        + 2.22697524e-7 * ta * ta * vel * vel * vel
-        + -4.16117031e-8 * ta * ta * ta * vel * vel * vel
-        + -0.0127762753 * vel * vel * vel * vel
-        + 9.66891875e-6 * ta * vel * vel * vel * vel
-        + 2.52785852e-9 * ta * ta * vel * vel * vel * vel
-        + 4.56306672e-4 * vel * vel * vel * vel * vel
-        + -1.74202546e-7 * ta * vel * vel * vel * vel * vel
-        + -5.91491269e-6 * vel * vel * vel * vel * vel * vel
-        + 0.398374029 * d_tr
-        + 1.83945314e-4 * ta * d_tr
-        + -1.73754510e-4 * ta * ta * d_tr
-        + -7.60781159e-7 * ta * ta * ta * d_tr
-        + 3.77830287e-8 * ta * ta * ta * ta * d_tr
-        + 5.43079673e-10 * ta * ta * ta * ta * ta * d_tr
-        + -0.0200518269 * vel * d_tr
-        + 8.92859837e-4 * ta * vel * d_tr
-        + 3.45433048e-6 * ta * ta * vel * d_tr
-        + -3.77925774e-7 * ta * ta * ta * vel * d_tr
-        + -1.69699377e-9 * ta * ta * ta * ta * vel * d_tr
-        + 1.69992415e-4 * vel * vel * d_tr
-        + -4.99204314e-5 * ta * vel * vel * d_tr
-        + 2.47417178e-7 * ta * ta * vel * vel * d_tr
-        + 1.07596466e-8 * ta * ta * ta * vel * vel * d_tr
-        + 8.49242932e-5 * vel * vel * vel * d_tr
-        + 1.35191328e-6 * ta * vel * vel * vel * d_tr
-        + -6.21531254e-9 * ta * ta * vel * vel * vel * d_tr
-        + -4.99410301e-6 * vel * vel * vel * vel * d_tr
-        + -1.89489258e-8 * ta * vel * vel * vel * vel * d_tr
-        + 8.15300114e-8 * vel * vel * vel * vel * vel * d_tr
-        + 7.55043090e-4 * d_tr * d_tr
-        + -5.65095215e-5 * ta * d_tr * d_tr
-        + -4.52166564e-7 * ta * ta * d_tr * d_tr
-        + 2.46688878e-8 * ta * ta * ta * d_tr * d_tr
-        + 2.42674348e-10 * ta * ta * ta * ta * d_tr * d_tr
-        + 1.54547250e-4 * vel * d_tr * d_tr
-        + 5.24110970e-6 * ta * vel * d_tr * d_tr
-        + -8.75874982e-8 * ta * ta * vel * d_tr * d_tr
-        + -1.50743064e-9 * ta * ta * ta * vel * d_tr * d_tr
-        + -1.56236307e-5 * vel * vel * d_tr * d_tr
-        + -1.33895614e-7 * ta * vel * vel * d_tr * d_tr
-        + 2.49709824e-9 * ta * ta * vel * vel * d_tr * d_tr
-        + 6.51711721e-7 * vel * vel * vel * d_tr * d_tr
-        + 1.94960053e-9 * ta * vel * vel * vel * d_tr * d_tr
-        + -1.00361113e-8 * vel * vel * vel * vel * d_tr * d_tr
-        + -1.21206673e-5 * d_tr * d_tr * d_tr
-        + -2.18203660e-7 * ta * d_tr * d_tr * d_tr
-        + 7.51269482e-9 * ta * ta * d_tr * d_tr * d_tr
-        + 9.79063848e-11 * ta * ta * ta * d_tr * d_tr * d_tr
-        + 1.25006734e-6 * vel * d_tr * d_tr * d_tr
-        + -1.81584736e-9 * ta * vel * d_tr * d_tr * d_tr
-        + -3.52197671e-10 * ta * ta * vel * d_tr * d_tr * d_tr
-        + -3.36514630e-8 * vel * vel * d_tr * d_tr * d_tr
-        + 1.35908359e-10 * ta * vel * vel * d_tr * d_tr * d_tr
-        + 4.17032620e-10 * vel * vel * vel * d_tr * d_tr * d_tr
-        + -1.30369025e-9 * d_tr * d_tr * d_tr * d_tr
-        + 4.13908461e-10 * ta * d_tr * d_tr * d_tr * d_tr
-        + 9.22652254e-12 * ta * ta * d_tr * d_tr * d_tr * d_tr
-        + -5.08220384e-9 * vel * d_tr * d_tr * d_tr * d_tr
-        + -2.24730961e-11 * ta * vel * d_tr * d_tr * d_tr * d_tr
-        + 1.17139133e-10 * vel * vel * d_tr * d_tr * d_tr * d_tr
-        + 6.62154879e-10 * d_tr * d_tr * d_tr * d_tr * d_tr
-        + 4.03863260e-13 * ta * d_tr * d_tr * d_tr * d_tr * d_tr
-        + 1.95087203e-12 * vel * d_tr * d_tr * d_tr * d_tr * d_tr
-        + -4.73602469e-12 * d_tr * d_tr * d_tr * d_tr * d_tr * d_tr
-        + 5.12733497 * pa_pr
-        + -0.312788561 * ta * pa_pr
-        + -0.0196701861 * ta * ta * pa_pr
-        + 9.99690870e-4 * ta * ta * ta * pa_pr
-        + 9.51738512e-6 * ta * ta * ta * ta * pa_pr
-        + -4.66426341e-7 * ta * ta * ta * ta * ta * pa_pr
-        + 0.548050612 * vel * pa_pr
-        + -0.00330552823 * ta * vel * pa_pr
-        + -0.00164119440 * ta * ta * vel * pa_pr
-        + -5.16670694e-6 * ta * ta * ta * vel * pa_pr
-        + 9.52692432e-7 * ta * ta * ta * ta * vel * pa_pr
-        + -0.0429223622 * vel * vel * pa_pr
-        + 0.00500845667 * ta * vel * vel * pa_pr
-        + 1.00601257e-6 * ta * ta * vel * vel * pa_pr
-        + -1.81748644e-6 * ta * ta * ta * vel * vel * pa_pr
-        + -1.25813502e-3 * vel * vel * vel * pa_pr
-        + -1.79330391e-4 * ta * vel * vel * vel * pa_pr
-        + 2.34994441e-6 * ta * ta * vel * vel * vel * pa_pr
-        + 1.29735808e-4 * vel * vel * vel * vel * pa_pr
-        + 1.29064870e-6 * ta * vel * vel * vel * vel * pa_pr
-        + -2.28558686e-6 * vel * vel * vel * vel * vel * pa_pr
-        + -0.0369476348 * d_tr * pa_pr
-        + 0.00162325322 * ta * d_tr * pa_pr
-        + -3.14279680e-5 * ta * ta * d_tr * pa_pr
-        + 2.59835559e-6 * ta * ta * ta * d_tr * pa_pr
-        + -4.77136523e-8 * ta * ta * ta * ta * d_tr * pa_pr
-        + 8.64203390e-3 * vel * d_tr * pa_pr
-        + -6.87405181e-4 * ta * vel * d_tr * pa_pr
-        + -9.13863872e-6 * ta * ta * vel * d_tr * pa_pr
-        + 5.15916806e-7 * ta * ta * ta * vel * d_tr * pa_pr
-        + -3.59217476e-5 * vel * vel * d_tr * pa_pr
-        + 3.28696511e-5 * ta * vel * vel * d_tr * pa_pr
-        + -7.10542454e-7 * ta * ta * vel * vel * d_tr * pa_pr
-        + -1.24382300e-5 * vel * vel * vel * d_tr * pa_pr
-        + -7.38584400e-9 * ta * vel * vel * vel * d_tr * pa_pr
-        + 2.20609296e-7 * vel * vel * vel * vel * d_tr * pa_pr
-        + -7.32469180e-4 * d_tr * d_tr * pa_pr
-        + -1.87381964e-5 * ta * d_tr * d_tr * pa_pr
-        + 4.80925239e-6 * ta * ta * d_tr * d_tr * pa_pr
-        + -8.75492040e-8 * ta * ta * ta * d_tr * d_tr * pa_pr
-        + 2.77862930e-5 * vel * d_tr * d_tr * pa_pr
-        + -5.06004592e-6 * ta * vel * d_tr * d_tr * pa_pr
-        + 1.14325367e-7 * ta * ta * vel * d_tr * d_tr * pa_pr
-        + 2.53016723e-6 * vel * vel * d_tr * d_tr * pa_pr
-        + -1.72857035e-8 * ta * vel * vel * d_tr * d_tr * pa_pr
-        + -3.95079398e-8 * vel * vel * vel * d_tr * d_tr * pa_pr
-        + -3.59413173e-7 * d_tr * d_tr * d_tr * pa_pr
-        + 7.04388046e-7 * ta * d_tr * d_tr * d_tr * pa_pr
-        + -1.89309167e-8 * ta * ta * d_tr * d_tr * d_tr * pa_pr
-        + -4.79768731e-7 * vel * d_tr * d_tr * d_tr * pa_pr
-        + 7.96079978e-9 * ta * vel * d_tr * d_tr * d_tr * pa_pr
-        + 1.62897058e-9 * vel * vel * d_tr * d_tr * d_tr * pa_pr
-        + 3.94367674e-8 * d_tr * d_tr * d_tr * d_tr * pa_pr
-        + -1.18566247e-9 * ta * d_tr * d_tr * d_tr * d_tr * pa_pr
-        + 3.34678041e-10 * vel * d_tr * d_tr * d_tr * d_tr * pa_pr
-        + -1.15606447e-10 * d_tr * d_tr * d_tr * d_tr * d_tr * pa_pr
-        + -2.80626406 * pa_pr * pa_pr
-        + 0.548712484 * ta * pa_pr * pa_pr
-        + -0.00399428410 * ta * ta * pa_pr * pa_pr
-        + -9.54009191e-4 * ta * ta * ta * pa_pr * pa_pr
-        + 1.93090978e-5 * ta * ta * ta * ta * pa_pr * pa_pr
-        + -0.308806365 * vel * pa_pr * pa_pr
-        + 0.0116952364 * ta * vel * pa_pr * pa_pr
-        + 4.95271903e-4 * ta * ta * vel * pa_pr * pa_pr
-        + -1.90710882e-5 * ta * ta * ta * vel * pa_pr * pa_pr
-        + 0.00210787756 * vel * vel * pa_pr * pa_pr
-        + -6.98445738e-4 * ta * vel * vel * pa_pr * pa_pr
-        + 2.30109073e-5 * ta * ta * vel * vel * pa_pr * pa_pr
-        + 4.17856590e-4 * vel * vel * vel * pa_pr * pa_pr
-        + -1.27043871e-5 * ta * vel * vel * vel * pa_pr * pa_pr
-        + -3.04620472e-6 * vel * vel * vel * vel * pa_pr * pa_pr
-        + 0.0514507424 * d_tr * pa_pr * pa_pr
-        + -0.00432510997 * ta * d_tr * pa_pr * pa_pr
-        + 8.99281156e-5 * ta * ta * d_tr * pa_pr * pa_pr
-        + -7.14663943e-7 * ta * ta * ta * d_tr * pa_pr * pa_pr
-        + -2.66016305e-4 * vel * d_tr * pa_pr * pa_pr
-        + 2.63789586e-4 * ta * vel * d_tr * pa_pr * pa_pr
-        + -7.01199003e-6 * ta * ta * vel * d_tr * pa_pr * pa_pr
-        + -1.06823306e-4 * vel * vel * d_tr * pa_pr * pa_pr
-        + 3.61341136e-6 * ta * vel * vel * d_tr * pa_pr * pa_pr
-        + 2.29748967e-7 * vel * vel * vel * d_tr * pa_pr * pa_pr
-        + 3.04788893e-4 * d_tr * d_tr * pa_pr * pa_pr
-        + -6.42070836e-5 * ta * d_tr * d_tr * pa_pr * pa_pr
-        + 1.16257971e-6 * ta * ta * d_tr * d_tr * pa_pr * pa_pr
-        + 7.68023384e-6 * vel * d_tr * d_tr * pa_pr * pa_pr
-        + -5.47446896e-7 * ta * vel * d_tr * d_tr * pa_pr * pa_pr
-        + -3.59937910e-8 * vel * vel * d_tr * d_tr * pa_pr * pa_pr
-        + -4.36497725e-6 * d_tr * d_tr * d_tr * pa_pr * pa_pr
-        + 1.68737969e-7 * ta * d_tr * d_tr * d_tr * pa_pr * pa_pr
-        + 2.67489271e-8 * vel * d_tr * d_tr * d_tr * pa_pr * pa_pr
-        + 3.23926897e-9 * d_tr * d_tr * d_tr * d_tr * pa_pr * pa_pr
-        + -0.0353874123 * pa_pr * pa_pr * pa_pr
-        + -0.221201190 * ta * pa_pr * pa_pr * pa_pr
-        + 0.0155126038 * ta * ta * pa_pr * pa_pr * pa_pr
-        + -2.63917279e-4 * ta * ta * ta * pa_pr * pa_pr * pa_pr
-        + 0.0453433455 * vel * pa_pr * pa_pr * pa_pr
-        + -0.00432943862 * ta * vel * pa_pr * pa_pr * pa_pr
-        + 1.45389826e-4 * ta * ta * vel * pa_pr * pa_pr * pa_pr
-        + 2.17508610e-4 * vel * vel * pa_pr * pa_pr * pa_pr
-        + -6.66724702e-5 * ta * vel * vel * pa_pr * pa_pr * pa_pr
-        + 3.33217140e-5 * vel * vel * vel * pa_pr * pa_pr * pa_pr
-        + -0.00226921615 * d_tr * pa_pr * pa_pr * pa_pr
-        + 3.80261982e-4 * ta * d_tr * pa_pr * pa_pr * pa_pr
-        + -5.45314314e-9 * ta * ta * d_tr * pa_pr * pa_pr * pa_pr
-        + -7.96355448e-4 * vel * d_tr * pa_pr * pa_pr * pa_pr
-        + 2.53458034e-5 * ta * vel * d_tr * pa_pr * pa_pr * pa_pr
-        + -6.31223658e-6 * vel * vel * d_tr * pa_pr * pa_pr * pa_pr
-        + 3.02122035e-4 * d_tr * d_tr * pa_pr * pa_pr * pa_pr
-        + -4.77403547e-6 * ta * d_tr * d_tr * pa_pr * pa_pr * pa_pr
-        + 1.73825715e-6 * vel * d_tr * d_tr * pa_pr * pa_pr * pa_pr
-        + -4.09087898e-7 * d_tr * d_tr * d_tr * pa_pr * pa_pr * pa_pr
-        + 0.614155345 * pa_pr * pa_pr * pa_pr * pa_pr
-        + -0.0616755931 * ta * pa_pr * pa_pr * pa_pr * pa_pr
-        + 0.00133374846 * ta * ta * pa_pr * pa_pr * pa_pr * pa_pr
-        + 0.00355375387 * vel * pa_pr * pa_pr * pa_pr * pa_pr
-        + -5.13027851e-4 * ta * vel * pa_pr * pa_pr * pa_pr * pa_pr
-        + 1.02449757e-4 * vel * vel * pa_pr * pa_pr * pa_pr * pa_pr
-        + -0.00148526421 * d_tr * pa_pr * pa_pr * pa_pr * pa_pr
-        + -4.11469183e-5 * ta * d_tr * pa_pr * pa_pr * pa_pr * pa_pr
-        + -6.80434415e-6 * vel * d_tr * pa_pr * pa_pr * pa_pr * pa_pr
-        + -9.77675906e-6 * d_tr * d_tr * pa_pr * pa_pr * pa_pr * pa_pr
-        + 0.0882773108 * pa_pr * pa_pr * pa_pr * pa_pr * pa_pr
-        + -0.00301859306 * ta * pa_pr * pa_pr * pa_pr * pa_pr * pa_pr
-        + 0.00104452989 * vel * pa_pr * pa_pr * pa_pr * pa_pr * pa_pr
-        + 2.47090539e-4 * d_tr * pa_pr * pa_pr * pa_pr * pa_pr * pa_pr
-        + 0.00148348065 * pa_pr * pa_pr * pa_pr * pa_pr * pa_pr * pa_pr
-    )
-
-    return utci_approx
+    return ta + _utci_polynomial(ta, vel, d_tr, pa_pr)
 
 
 def utci_shade_benefit_categories(
     unshaded_utci: pd.Series,
     shaded_utci: pd.Series,
-    comfort_limits: Tuple[float] = (9, 26),
+    comfort_limits: Tuple[float, float] = (9, 26),
 ) -> pd.Series:
     """Determine shade-gap analysis category, indicating where shade is not beneificial.
 
@@ -990,7 +1235,7 @@ def utci_shade_benefit_categories(
             A series containing unshaded UTCI values.
         shaded_utci (pd.Series):
             A series containing shaded UTCI values.
-        comfort_limits (Tuple[float], optional):
+        comfort_limits (Tuple[float, float], optional):
             The range within which "comfort" is achieved. Defaults to (9, 26).
 
     Returns:
@@ -1005,27 +1250,62 @@ def utci_shade_benefit_categories(
         )
 
     # get limits
-    low, high = min(comfort_limits), max(comfort_limits)
-
-    # get distance to comfort (degrees from edge of "comfortable")
-    distance_from_comfort_unshaded = abs(
-        np.where(
-            unshaded_utci < low,
-            unshaded_utci - low,
-            np.where(unshaded_utci > high, unshaded_utci - high, 0),
-        )
+    low, high = comfort_limits
+    if low > high:
+        low, high = high, low
+
+    # construct categorical series from the category codes. Categories are sorted and
+    # unused ones dropped, matching the categories that pd.Categorical would infer from
+    # the equivalent strings.
+    codes = _shade_benefit_codes(
+        unshaded_utci.to_numpy(), shaded_utci.to_numpy(), low, high
     )
-    distance_from_comfort_shaded = abs(
-        np.where(
-            shaded_utci < low,
-            shaded_utci - low,
-            np.where(shaded_utci > high, shaded_utci - high, 0),
-        )
+
+    return pd.Series(
+        pd.Categorical.from_codes(
+            codes, categories=_SHADE_BENEFIT_CATEGORIES
+        ).remove_unused_categories(),
+        index=unshaded_utci.index,
     )
 
+
+_SHADE_BENEFIT_CATEGORIES = (
+    "Comfortable with shade",
+    "Comfortable without shade",
+    "Shade is beneficial",
+    "Shade is detrimental",
+    "Undefined",
+)
+
+
+def _shade_benefit_codes(
+    unshaded: NDArray[np.float64], shaded: NDArray[np.float64], low: float, high: float
+) -> NDArray[np.int8]:
+    """Get shade-benefit category codes for raw arrays of UTCI values, for use in loops
+        over many points where the Series/Categorical wrapping can be done once at the
+        end.
+
+    Args:
+        unshaded (NDArray[np.float64]):
+            An array of unshaded UTCI values.
+        shaded (NDArray[np.float64]):
+            An array of shaded UTCI values.
+        low (float):
+            The lower comfort limit.
+        high (float):
+            The upper comfort limit.
+
+    Returns:
+        NDArray[np.int8]:
+            Codes indexing into _SHADE_BENEFIT_CATEGORIES.
+    """
+    # get distance to comfort (degrees from edge of "comfortable")
+    distance_from_comfort_unshaded = np.abs(unshaded - np.clip(unshaded, low, high))
+    distance_from_comfort_shaded = np.abs(shaded - np.clip(shaded, low, high))
+
     # get boolean mask where comfortable
-    comfortable_unshaded = unshaded_utci.between(low, high)
-    comfortable_shaded = shaded_utci.between(low, high)
+    comfortable_unshaded = (unshaded >= low) & (unshaded <= high)
+    comfortable_shaded = (shaded >= low) & (shaded <= high)
 
     # get masks for each category
     comfortable_without_shade = comfortable_unshaded
@@ -1037,22 +1317,17 @@ def utci_shade_benefit_categories(
         distance_from_comfort_unshaded > distance_from_comfort_shaded
     )
 
-    # construct categorical series
-    shade_categories = np.where(
-        comfortable_without_shade,
-        "Comfortable without shade",
-        np.where(
+    # assign each value a category code in a single pass
+    return np.select(
+        [
+            comfortable_without_shade,
             comfortable_with_shade,
-            "Comfortable with shade",
-            np.where(
-                shade_has_negative_impact,
-                "Shade is detrimental",
-                np.where(shade_has_positive_impact, "Shade is beneficial", "Undefined"),
-            ),
-        ),
-    )
-
-    return pd.Series(shade_categories, index=unshaded_utci.index)
+            shade_has_negative_impact,
+            shade_has_positive_impact,
+        ],
+        [1, 0, 3, 2],
+        default=4,
+    ).astype(np.int8)
 
 
 def distance_to_comfortable(
@@ -1173,25 +1448,12 @@ def feasible_utci_limits(
         epw.horizontal_infrared_radiation_intensity,
         epw.dry_bulb_temperature,
     ).mean_radiant_temperature
-    dbt_evap, rh_evap = np.array(
-        [
-            evaporative_cooling_effect(
-                dry_bulb_temperature=_dbt,
-                relative_humidity=_rh,
-                evaporative_cooling_effectiveness=0.5,
-                atmospheric_pressure=_atm,
-            )
-            for _dbt, _rh, _atm in list(
-                zip(
-                    *[
-                        epw.dry_bulb_temperature,
-                        epw.relative_humidity,
-                        epw.atmospheric_station_pressure,
-                    ]
-                )
-            )
-        ]
-    ).T
+    dbt_evap, rh_evap = evaporative_cooling_effect(
+        dry_bulb_temperature=epw.dry_bulb_temperature.values,
+        relative_humidity=epw.relative_humidity.values,
+        evaporative_cooling_effectiveness=0.5,
+        atmospheric_pressure=epw.atmospheric_station_pressure.values,
+    )
     dbt_evap = epw.dry_bulb_temperature.get_aligned_collection(dbt_evap)
     rh_evap = epw.relative_humidity.get_aligned_collection(rh_evap)
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import ast
 import base64
 import colorsys
 import contextlib
@@ -10,21 +11,19 @@ import math
 import re
 import urllib.request
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from ladybug.datatype.temperature import WetBulbTemperature
 from ladybug.epw import (EPW, AnalysisPeriod, HourlyContinuousCollection,
                          Location)
 from ladybug.psychrometrics import wet_bulb_from_db_rh
-from ladybug.skymodel import (calc_horizontal_infrared, calc_sky_temperature,
-                              estimate_illuminance_from_irradiance,
-                              get_extra_radiation, zhang_huang_solar,
+from ladybug.skymodel import (estimate_illuminance_from_irradiance,
                               zhang_huang_solar_split)
 from ladybug.sunpath import Sunpath
 from matplotlib.colors import cnames, colorConverter, to_rgb
@@ -35,6 +34,24 @@ from scipy.stats import exponweib
 from tqdm import tqdm
 
 
+def _srgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    """Convert gamma-encoded sRGB channel values into linear light.
+
+    Args:
+        rgb (np.ndarray):
+            An array of sRGB channel values, between 0 and 1.
+
+    Returns:
+        np.ndarray:
+            The linearised channel values.
+    """
+    linear = rgb / 12.92
+    # only raise the channels above the linear threshold to the (costly) fractional power
+    high = rgb > 0.03928
+    linear[high] = ((rgb[high] + 0.055) / 1.055) ** 2.4
+    return linear
+
+
 def relative_luminance(color: Any):
     """Calculate the relative luminance of a color according to W3C standards
 
@@ -46,8 +63,12 @@ def relative_luminance(color: Any):
     -------
     luminance : float(s) between 0 and 1
     """
-    rgb = colorConverter.to_rgba_array(color)[:, :3]
-    rgb = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    if isinstance(color, str) or (
+        isinstance(color, tuple) and all(isinstance(i, (int, float)) for i in color)
+    ):
+        return _single_color_relative_luminance(color)
+
+    rgb = _srgb_to_linear(colorConverter.to_rgba_array(color)[:, :3])
     lum = rgb.dot([0.2126, 0.7152, 0.0722])
     try:
         return lum.item()
@@ -55,6 +76,22 @@ def relative_luminance(color: Any):
         return lum
 
 
+@lru_cache(maxsize=512)
+def _single_color_relative_luminance(color: Union[str, Tuple[float]]) -> float:
+    """Calculate (and cache) the relative luminance of a single hashable color.
+
+    Args:
+        color (Union[str, Tuple[float]]):
+            A hex code, html color name or rgb(a)-tuple.
+
+    Returns:
+        float:
+            The relative luminance, between 0 and 1.
+    """
+    rgb = _srgb_to_linear(np.array(to_rgb(color)))
+    return float(rgb.dot([0.2126, 0.7152, 0.0722]))
+
+
 def contrasting_color(color: Any):
     """Calculate the contrasting color for a given color.
 
@@ -105,17 +142,22 @@ def animation(
 
     image_files = [Path(i) for i in image_files]
 
-    images = [Image.open(i) for i in image_files]
+    with Image.open(image_files[0]) as first_image:
+        # create white background
+        background = Image.new("RGBA", first_image.size, (255, 255, 255))
+        first_frame = Image.alpha_composite(background, first_image)
 
-    # create white background
-    background = Image.new("RGBA", images[0].size, (255, 255, 255))
+    def _frames():
+        # decode and composite each subsequent image only as it is written, rather
+        # than holding every decoded frame in memory at once
+        for image_file in image_files[1:]:
+            with Image.open(image_file) as image:
+                yield Image.alpha_composite(background, image)
 
-    images = [Image.alpha_composite(background, i) for i in images]
-
-    images[0].save(
+    first_frame.save(
         output_gif,
         save_all=True,
-        append_images=images[1:],
+        append_images=_frames(),
         optimize=False,
         duration=ms_per_image,
         loop=0,
@@ -130,6 +172,192 @@ def chunks(lst: List[Any], chunksize: int):
         yield lst[i : i + chunksize]
 
 
+def _horizontal_infrared(
+    sky_cover: np.ndarray, dry_bulb: np.ndarray, dew_point: np.ndarray
+) -> np.ndarray:
+    """A vectorised version of ladybug.skymodel.calc_horizontal_infrared.
+
+    Args:
+        sky_cover (np.ndarray):
+            Opaque sky cover in tenths (0 = clear; 10 = completely overcast).
+        dry_bulb (np.ndarray):
+            Dry bulb temperature in C.
+        dew_point (np.ndarray):
+            Dew point temperature in C.
+
+    Returns:
+        np.ndarray:
+            Horizontal infrared radiation intensity in W/m2.
+    """
+    sky_emiss = (0.787 + (0.764 * np.log((dew_point + 273.15) / 273.15))) * (
+        1 + sky_cover * (0.022 + sky_cover * (-0.0035 + sky_cover * 0.00028))
+    )
+    return sky_emiss * 5.6697e-8 * (dry_bulb + 273.15) ** 4
+
+
+def _sky_temperature(horiz_ir: np.ndarray) -> np.ndarray:
+    """A vectorised version of ladybug.skymodel.calc_sky_temperature, for a source
+        emissivity of 1.
+
+    Args:
+        horiz_ir (np.ndarray):
+            Horizontal infrared radiation intensity in W/m2.
+
+    Returns:
+        np.ndarray:
+            Sky temperature in C.
+    """
+    return ((horiz_ir / 5.6697e-8) ** 0.25) - 273.15
+
+
+def _zhang_huang_solar(
+    alt: np.ndarray,
+    cloud_cover: np.ndarray,
+    relative_humidity: np.ndarray,
+    dry_bulb_present: np.ndarray,
+    dry_bulb_t3_hrs: np.ndarray,
+    wind_speed: np.ndarray,
+    irr_0: float = 1355,
+) -> np.ndarray:
+    """A vectorised version of ladybug.skymodel.zhang_huang_solar.
+
+    Args:
+        alt (np.ndarray):
+            Solar altitude in degrees.
+        cloud_cover (np.ndarray):
+            Sky cloud cover in tenths (0 = clear; 10 = completely overcast).
+        relative_humidity (np.ndarray):
+            Relative humidity in percent.
+        dry_bulb_present (np.ndarray):
+            Dry bulb temperature at the time of interest in C.
+        dry_bulb_t3_hrs (np.ndarray):
+            Dry bulb temperature three hours before the time of interest in C.
+        wind_speed (np.ndarray):
+            Wind speed in m/s.
+        irr_0 (float, optional):
+            Extraterrestrial solar constant in W/m2. Defaults to 1355.
+
+    Returns:
+        np.ndarray:
+            Global horizontal radiation in W/m2.
+    """
+    cc = cloud_cover / 10.0
+    glob_ir = (
+        (
+            irr_0
+            * np.sin(np.radians(alt))
+            * (
+                0.5598
+                + (0.4982 * cc)
+                + (-0.6762 * cc**2)
+                + (0.02842 * (dry_bulb_present - dry_bulb_t3_hrs))
+                + (-0.00317 * relative_humidity)
+                + (0.014 * wind_speed)
+            )
+        )
+        - 17.853
+    ) / 0.843
+    # night time and negative values are zero, but NaN inputs remain NaN
+    return np.where((alt > 0) & ~(glob_ir < 0), glob_ir, 0)
+
+
+def _extra_radiation(doy: np.ndarray, solar_constant: float = 1366.1) -> np.ndarray:
+    """A vectorised version of ladybug.skymodel.get_extra_radiation.
+
+    Args:
+        doy (np.ndarray):
+            Days of the year.
+        solar_constant (float, optional):
+            The solar constant. Defaults to 1366.1.
+
+    Returns:
+        np.ndarray:
+            Extraterrestrial radiation in W/m2.
+    """
+    b = (2.0 * np.pi / 365.0) * (np.asarray(doy) - 1)
+    return solar_constant * (
+        1.00011
+        + 0.034221 * np.cos(b)
+        + 0.00128 * np.sin(b)
+        + 0.000719 * np.cos(2 * b)
+        + 7.7e-05 * np.sin(2 * b)
+    )
+
+
+_ASOS_SKY_COVER_OKTAS = {
+    "   ": 0,
+    "CLR": 0,
+    "NCD": 0,
+    "NSC": 0,
+    "SKC": 0,
+    "///": 0,
+    "FEW": 1.5,
+    "SCT": 3.5,
+    "BKN": 6,
+    "OVC": 8,
+    "VV ": 8,
+    "VV": 8,
+}
+
+
+def _process_asos_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Post-process a chunk of raw ASOS records into EPW-like units and variables.
+
+    Args:
+        chunk (pd.DataFrame):
+            A time-indexed chunk of the ASOS CSV, as returned by the IEM mesonet service.
+
+    Returns:
+        pd.DataFrame:
+            The chunk, converted and renamed, with sky cover, HIR and sky temperature added.
+    """
+
+    # Post-process data into right units
+    chunk["sknt"] = chunk.sknt / 1.94384  # convert knots to m/s
+    # convert inches of mercury (Hg) to Pa
+    chunk["alti"] = chunk.alti * 3386.38866667
+    chunk["vsby"] = chunk["vsby"] * 1.60934  # convert miles to kilometres
+
+    # Get sky clearness, gathering oktas for each layer from its sky cover code (with
+    # missing and unrecognised codes treated as clear)
+    sky_cover_codes = list(_ASOS_SKY_COVER_OKTAS)
+    sky_cover_oktas = np.array(list(_ASOS_SKY_COVER_OKTAS.values()) + [0])
+    layer_oktas = [
+        sky_cover_oktas[pd.Categorical(chunk[i], categories=sky_cover_codes).codes]
+        for i in ["skyc1", "skyc2", "skyc3"]
+    ]
+    chunk["opaque_sky_cover"] = np.mean(layer_oktas, axis=0) / 8 * 10
+    chunk.drop(["skyc1", "skyc2", "skyc3"], axis=1, inplace=True)
+
+    # Rename headers
+    renamer = {
+        "lon": "longitude",
+        "lat": "latitude",
+        "elevation": "elevation",
+        "tmpc": "dry_bulb_temperature",
+        "dwpc": "dew_point_temperature",
+        "relh": "relative_humidity",
+        "drct": "wind_direction",
+        "sknt": "wind_speed",
+        "alti": "atmospheric_station_pressure",
+        "p01m": "liquid_precipitation_depth",
+        "vsby": "visibility",
+    }
+    chunk.rename(columns=renamer, inplace=True)
+
+    # Calculate HIR and sky temperature
+    chunk["horizontal_infrared_radiation_intensity"] = _horizontal_infrared(
+        chunk.opaque_sky_cover.to_numpy(),
+        chunk.dry_bulb_temperature.to_numpy(),
+        chunk.dew_point_temperature.to_numpy(),
+    )
+    chunk["sky_temperature"] = _sky_temperature(
+        chunk.horizontal_infrared_radiation_intensity.to_numpy()
+    )
+
+    return chunk
+
+
 def scrape_weather(
     station: str,
     start_date: str = "1970-01-01",
@@ -166,72 +394,24 @@ def scrape_weather(
 
     # Scrape data from source website (https://mesonet.agron.iastate.edu/request/download.phtml)
     uri = f"https://mesonet.agron.iastate.edu/cgi-bin/request/asos.py?station={station}&year1={start_date.year}&month1={start_date.month}&day1={start_date.day}&year2={end_date.year}&month2={end_date.month}&day2={end_date.day}&tz=Etc%2FUTC&format=onlycomma&latlon=yes&elev=yes&missing=null&trace=null&direct=no&data=tmpc&data=dwpc&data=relh&data=drct&data=sknt&data=alti&data=p01m&data=vsby&data=skyc1&data=skyc2&data=skyc3"
-    df = pd.read_csv(
-        uri,
-        header=0,
-        index_col="valid",
-        parse_dates=True,
-        na_values=["M", "null"],
-        low_memory=False,
-    )
-
-    # Post-process data into right units
-    df["sknt"] = df.sknt / 1.94384  # convert knots to m/s
-    # convert inches of mercury (Hg) to Pa
-    df["alti"] = df.alti * 3386.38866667
-    df["vsby"] = df["vsby"] * 1.60934  # convert miles to kilometres
-
-    # Get sky clearness
-    rplc = {
-        "   ": 0,
-        "CLR": 0,
-        "NCD": 0,
-        "NSC": 0,
-        "SKC": 0,
-        "///": 0,
-        "FEW": 1.5,
-        "SCT": 3.5,
-        "BKN": 6,
-        "OVC": 8,
-        "VV ": 8,
-        "VV": 8,
-    }
-
-    for i in ["skyc1", "skyc2", "skyc3"]:
-        df[i] = df[i].fillna("NSC").replace(rplc) / 8 * 10
-    df["opaque_sky_cover"] = df[["skyc1", "skyc2", "skyc3"]].mean(axis=1)
-    df.drop(["skyc1", "skyc2", "skyc3"], axis=1, inplace=True)
-
-    # Rename headers
-    renamer = {
-        "lon": "longitude",
-        "lat": "latitude",
-        "elevation": "elevation",
-        "tmpc": "dry_bulb_temperature",
-        "dwpc": "dew_point_temperature",
-        "relh": "relative_humidity",
-        "drct": "wind_direction",
-        "sknt": "wind_speed",
-        "alti": "atmospheric_station_pressure",
-        "p01m": "liquid_precipitation_depth",
-        "vsby": "visibility",
-    }
-    df.rename(columns=renamer, inplace=True)
-    df.index.name = None
 
-    # Calculate HIR and sky temperature
-    df["horizontal_infrared_radiation_intensity"] = [
-        calc_horizontal_infrared(
-            row.opaque_sky_cover, row.dry_bulb_temperature, row.dew_point_temperature
-        )
-        for row in df.itertuples()
-    ]
-    df["sky_temperature"] = [
-        calc_sky_temperature(
-            row.horizontal_infrared_radiation_intensity, source_emissivity=1
+    # stream the response, post-processing each chunk as it arrives rather than parsing
+    # the whole (possibly multi-decade) record before any processing starts
+    with urllib.request.urlopen(uri) as response:
+        df = pd.concat(
+            [
+                _process_asos_chunk(chunk)
+                for chunk in pd.read_csv(
+                    response,
+                    header=0,
+                    index_col="valid",
+                    parse_dates=True,
+                    na_values=["M", "null"],
+                    chunksize=50_000,
+                )
+            ]
         )
-        for row in df.itertuples()
-    ]
+    df.index.name = None
 
     # Calculate sun locations
     loc = Location(
@@ -240,44 +420,44 @@ def scrape_weather(
         elevation=df.elevation.values[0],
         city=f"ICAO-{df.station.values[0]}",
     )
+    sunpath = Sunpath.from_location(loc)
     altitude_in_radians = []
     azimuth_in_radians = []
     for i in df.index:
-        sunpath = Sunpath.from_location(loc).calculate_sun_from_date_time(i)
-        altitude_in_radians.append(sunpath.altitude_in_radians)
-        azimuth_in_radians.append(sunpath.azimuth_in_radians)
+        sun = sunpath.calculate_sun_from_date_time(i)
+        altitude_in_radians.append(sun.altitude_in_radians)
+        azimuth_in_radians.append(sun.azimuth_in_radians)
     df["solar_altitude"] = altitude_in_radians
     df["solar_azimuth"] = azimuth_in_radians
 
+    # convert once, for reuse by each of the irradiance and illuminance models
+    solar_altitude_degrees = df.solar_altitude.to_numpy() * 180 / math.pi
+    day_of_year = df.index.day_of_year.to_numpy()
+
     # Calculate irradiance and illuminance
     df["temp_offset_3"] = df.dry_bulb_temperature.shift(3)
     dir_norm, dif_horiz = zhang_huang_solar_split(
-        df.solar_altitude * 180 / math.pi,
-        df.index.day_of_year,
-        df.opaque_sky_cover,
-        df.relative_humidity,
-        df.dry_bulb_temperature,
-        df.temp_offset_3,
-        df.wind_speed,
-        df.atmospheric_station_pressure,
+        solar_altitude_degrees,
+        day_of_year,
+        df.opaque_sky_cover.to_numpy(),
+        df.relative_humidity.to_numpy(),
+        df.dry_bulb_temperature.to_numpy(),
+        df.temp_offset_3.to_numpy(),
+        df.wind_speed.to_numpy(),
+        df.atmospheric_station_pressure.to_numpy(),
     )
     df["direct_normal_radiation"] = dir_norm
     df["diffuse_horizontal_radiation"] = dif_horiz
-    df["global_horizontal_radiation"] = [
-        zhang_huang_solar(
-            row.solar_altitude * 180 / math.pi,
-            row.opaque_sky_cover,
-            row.relative_humidity,
-            row.dry_bulb_temperature,
-            row.temp_offset_3,
-            row.wind_speed,
-            irr_0=1355,
-        )
-        for row in df.itertuples()
-    ]
-    df["extraterrestrial_horizontal_radiation"] = [
-        get_extra_radiation(i) for i in df.index.day_of_year
-    ]
+    df["global_horizontal_radiation"] = _zhang_huang_solar(
+        solar_altitude_degrees,
+        df.opaque_sky_cover.to_numpy(),
+        df.relative_humidity.to_numpy(),
+        df.dry_bulb_temperature.to_numpy(),
+        df.temp_offset_3.to_numpy(),
+        df.wind_speed.to_numpy(),
+        irr_0=1355,
+    )
+    df["extraterrestrial_horizontal_radiation"] = _extra_radiation(day_of_year)
     df["extraterrestrial_horizontal_radiation"] = df[
         "extraterrestrial_horizontal_radiation"
     ].where(df.global_horizontal_radiation != 0, 0)
@@ -285,18 +465,17 @@ def scrape_weather(
     df["diffuse_horizontal_radiation"].fillna(0, inplace=True)
     df["global_horizontal_radiation"].fillna(0, inplace=True)
 
-    vals = []
-    for _, row in df.iterrows():
-        vals.append(
-            estimate_illuminance_from_irradiance(
-                row.solar_altitude * 180 / math.pi,
-                row.global_horizontal_radiation,
-                row.direct_normal_radiation,
-                row.diffuse_horizontal_radiation,
-                row.dew_point_temperature,
-            )
+    vals = [
+        estimate_illuminance_from_irradiance(*row)
+        for row in zip(
+            solar_altitude_degrees,
+            df.global_horizontal_radiation.to_numpy(),
+            df.direct_normal_radiation.to_numpy(),
+            df.diffuse_horizontal_radiation.to_numpy(),
+            df.dew_point_temperature.to_numpy(),
         )
-    gh_ill, dn_ill, dh_ill, z_lum = list(zip(*vals))
+    ]
+    gh_ill, dn_ill, dh_ill, z_lum = np.asarray(vals, dtype=float).reshape(-1, 4).T
     df["direct_normal_illuminance"] = dn_ill
     df["diffuse_horizontal_illuminance"] = dh_ill
     df["global_horizontal_illuminance"] = gh_ill
@@ -312,7 +491,9 @@ def scrape_weather(
     return df
 
 
-def rolling_window(array: List[Any], window: int):
+def rolling_window(
+    array: List[Any], window: int, contiguous: bool = False
+) -> np.ndarray:
     """Throwaway function here to roll a window along a list.
 
     Args:
@@ -320,38 +501,51 @@ def rolling_window(array: List[Any], window: int):
             A 1D list of some kind.
         window (int):
             The size of the window to apply to the list.
+        contiguous (bool, optional):
+            Return a contiguous, writable copy of the windows rather than a read-only
+            view onto the input. Defaults to False.
 
     Example:
         For an input list like [0, 1, 2, 3, 4, 5, 6, 7, 8],
         returns [[0, 1], [1, 2], [2, 3], [3, 4], [4, 5], [5, 6], [6, 7], [7, 8]]
 
     Returns:
-        List[List[Any]]:
-            The resulting, "windowed" list.
+        np.ndarray:
+            The resulting (n - window + 1, window) array of windows. This is a read-only
+            view onto the input unless contiguous is set.
     """
 
     if window > len(array):
         raise ValueError("Array length must be larger than window size.")
 
-    a: np.ndarray = np.array(array)
-    shape = a.shape[:-1] + (a.shape[-1] - window + 1, window)
-    strides = a.strides + (a.strides[-1],)  # pylint: disable=unsubscriptable-object
-    return np.lib.stride_tricks.as_strided(a, shape=shape, strides=strides)
+    windows = np.lib.stride_tricks.sliding_window_view(
+        np.asarray(array), window, axis=-1
+    )
+    if contiguous:
+        return np.ascontiguousarray(windows)
+    return windows
+
+
+_PROXIMITY_DECAY_PROFILES = {
+    "linear": lambda t: 1 - t,
+    "parabolic": lambda t: 1 - t * t,
+    "sigmoid": lambda t: 0.5 * (1 + np.cos(np.pi * t)),
+}
 
 
 def proximity_decay(
     value: float,
-    distance_to_value: float,
+    distance_to_value: Union[float, np.ndarray],
     max_distance: float,
     decay_method: str = "linear",
-) -> float:
+) -> Union[float, np.ndarray]:
     """Calculate the "decayed" value based on proximity (up to a maximum distance).
 
     Args:
         value (float):
             The value to be distributed.
-        distance_to_value (float):
-            A distance at which to return the magnitude.
+        distance_to_value (Union[float, np.ndarray]):
+            A distance (or array of distances) at which to return the magnitude.
         max_distance (float):
             The maximum distance to which magnitude is to be distributed. Beyond this, the input
             value is 0.
@@ -359,20 +553,20 @@ def proximity_decay(
             A type of distribution (the shape of the distribution profile). Defaults to "linear".
 
     Returns:
-        float:
-            The value at the given distance.
+        Union[float, np.ndarray]:
+            The value at the given distance (or distances).
     """
 
-    distance_to_value = np.interp(distance_to_value, [0, max_distance], [0, 1])
+    try:
+        profile = _PROXIMITY_DECAY_PROFILES[decay_method]
+    except KeyError as exc:
+        raise ValueError(f"Unknown curve type: {decay_method}") from exc
 
-    if decay_method == "linear":
-        return (1 - distance_to_value) * value
-    if decay_method == "parabolic":
-        return (-(distance_to_value**2) + 1) * value
-    if decay_method == "sigmoid":
-        return (1 - (0.5 * (np.sin(distance_to_value * np.pi - np.pi / 2) + 1))) * value
+    distance_to_value = np.clip(
+        np.asarray(distance_to_value, dtype=float) / max_distance, 0, 1
+    )
 
-    raise ValueError(f"Unknown curve type: {decay_method}")
+    return profile(distance_to_value) * value
 
 
 def base64_to_image(base64_string: str, image_path: Path) -> Path:
@@ -425,10 +619,10 @@ def image_to_base64(image_path: Path, html: bool = False) -> str:
 
     # load image and convert to base64 string
     with open(image_path, "rb") as image_file:
-        base64_string = base64.b64encode(image_file.read()).decode("utf-8")
+        base64_string = base64.b64encode(image_file.read()).decode("ascii")
 
     if html:
-        content_type = f"data:image/{image_path.suffix.replace('.', '')}"
+        content_type = f"data:image/{image_path.suffix[1:]}"
         content_encoding = "utf-8"
         return f"{content_type};charset={content_encoding};base64,{base64_string}"
 
@@ -449,10 +643,10 @@ def figure_to_base64(figure: Figure, html: bool = False) -> str:
             A base64 string encoding of the input figure object.
     """
 
-    buffer = io.BytesIO()
-    figure.savefig(buffer)
-    buffer.seek(0)
-    base64_string = base64.b64encode(buffer.read()).decode("utf-8")
+    # encode directly from a view of the in-memory PNG, rather than reading a copy of it
+    with io.BytesIO() as buffer:
+        figure.savefig(buffer, format="png")
+        base64_string = base64.b64encode(buffer.getbuffer()).decode("ascii")
 
     if html:
         content_type = "data:image/png"
@@ -477,11 +671,9 @@ def figure_to_image(fig: Figure) -> Image:
     # draw the renderer
     fig.canvas.draw()
 
-    # Get the RGBA buffer from the figure
-    w, h = fig.canvas.get_width_height()
-    buf = np.frombuffer(fig.canvas.tostring_argb(), dtype=np.uint8)
-    buf.shape = (w, h, 4)
-    buf = np.roll(buf, 3, axis=2)
+    # Get the RGBA buffer from the figure, as a (height, width, 4) array (copied, so
+    # that the image is unaffected by later redraws of the figure)
+    buf = np.array(fig.canvas.buffer_rgba())
 
     return Image.fromarray(buf)
 
@@ -531,17 +723,14 @@ def decay_rate_smoother(
     # Find periods of major transition (where values vary significantly)
     transition_index = series.diff() < difference_threshold
 
-    # Get boolean index for all periods within window from the transition indices
-    ewm_mask = []
-    n = 0
-    for i in transition_index:
-        if i:
-            n = 0
-        if n < transition_window:
-            ewm_mask.append(True)
-        else:
-            ewm_mask.append(False)
-        n += 1
+    # Get boolean index for all periods within window from the transition indices,
+    # counting the number of values since the most recent transition (or since the
+    # start of the series, where no transition has occurred yet)
+    idx = np.arange(len(transition_index))
+    last_transition = np.maximum.accumulate(
+        np.where(transition_index.to_numpy(), idx, 0)
+    )
+    ewm_mask = (idx - last_transition) < transition_window
 
     # Run an EWM to get the smoothed values following changes to values
     ewm_smoothed: pd.Series = series.ewm(span=ewm_span).mean()
@@ -552,91 +741,109 @@ def decay_rate_smoother(
     return new_series
 
 
-def cardinality(direction_angle: float, directions: int = 16):
+_CARDINAL_DIRECTIONS = {
+    4: ["N", "E", "S", "W"],
+    8: ["N", "NE", "E", "SE", "S", "SW", "W", "NW"],
+    16: [
+        "N",
+        "NNE",
+        "NE",
+        "ENE",
+        "E",
+        "ESE",
+        "SE",
+        "SSE",
+        "S",
+        "SSW",
+        "SW",
+        "WSW",
+        "W",
+        "WNW",
+        "NW",
+        "NNW",
+    ],
+    32: [
+        "N",
+        "NbE",
+        "NNE",
+        "NEbN",
+        "NE",
+        "NEbE",
+        "ENE",
+        "EbN",
+        "E",
+        "EbS",
+        "ESE",
+        "SEbE",
+        "SE",
+        "SEbS",
+        "SSE",
+        "SbE",
+        "S",
+        "SbW",
+        "SSW",
+        "SWbS",
+        "SW",
+        "SWbW",
+        "WSW",
+        "WbS",
+        "W",
+        "WbN",
+        "WNW",
+        "NWbW",
+        "NW",
+        "NWbN",
+        "NNW",
+        "NbW",
+    ],
+}
+
+
+_CARDINAL_DIRECTION_ANGLES = dict(
+    zip(_CARDINAL_DIRECTIONS[32], np.arange(0, 360, 11.25))
+)
+
+
+def cardinality(
+    direction_angle: Union[float, np.ndarray], directions: int = 16
+) -> Union[str, np.ndarray]:
     """Returns the cardinal orientation of a given angle, where that angle is related to north at
         0 degrees.
     Args:
-        direction_angle (float):
+        direction_angle (Union[float, np.ndarray]):
             The angle to north in degrees (+Ve is interpreted as clockwise from north at 0.0
-            degrees).
+            degrees). An array of angles returns an array of cardinal directions.
         directions (int):
             The number of cardinal directions into which angles shall be binned (This value should
             be one of 4, 8, 16 or 32, and is centred about "north").
     Returns:
-        int:
+        Union[str, np.ndarray]:
             The cardinal direction the angle represents.
     """
 
-    if direction_angle > 360 or direction_angle < 0:
+    if directions not in _CARDINAL_DIRECTIONS:
         raise ValueError(
-            "The angle entered is beyond the normally expected range for an orientation in degrees."
+            f'The input "directions" must be one of {list(_CARDINAL_DIRECTIONS.keys())}.'
         )
 
-    cardinal_directions = {
-        4: ["N", "E", "S", "W"],
-        8: ["N", "NE", "E", "SE", "S", "SW", "W", "NW"],
-        16: [
-            "N",
-            "NNE",
-            "NE",
-            "ENE",
-            "E",
-            "ESE",
-            "SE",
-            "SSE",
-            "S",
-            "SSW",
-            "SW",
-            "WSW",
-            "W",
-            "WNW",
-            "NW",
-            "NNW",
-        ],
-        32: [
-            "N",
-            "NbE",
-            "NNE",
-            "NEbN",
-            "NE",
-            "NEbE",
-            "ENE",
-            "EbN",
-            "E",
-            "EbS",
-            "ESE",
-            "SEbE",
-            "SE",
-            "SEbS",
-            "SSE",
-            "SbE",
-            "S",
-            "SbW",
-            "SSW",
-            "SWbS",
-            "SW",
-            "SWbW",
-            "WSW",
-            "WbS",
-            "W",
-            "WbN",
-            "WNW",
-            "NWbW",
-            "NW",
-            "NWbN",
-            "NNW",
-            "NbW",
-        ],
-    }
+    if np.ndim(direction_angle) > 0:
+        angles = np.asarray(direction_angle, dtype=np.float64)
+        # written as a positive check so that NaN angles are rejected too
+        if not np.all((angles >= 0) & (angles <= 360)):
+            raise ValueError(
+                "The angle entered is beyond the normally expected range for an orientation in degrees."
+            )
+        val = np.floor((angles / (360 / directions)) + 0.5).astype(np.intp)
+        return np.array(_CARDINAL_DIRECTIONS[directions])[val % directions]
 
-    if directions not in cardinal_directions:
+    if direction_angle > 360 or direction_angle < 0:
         raise ValueError(
-            f'The input "directions" must be one of {list(cardinal_directions.keys())}.'
+            "The angle entered is beyond the normally expected range for an orientation in degrees."
         )
 
     val = int((direction_angle / (360 / directions)) + 0.5)
 
-    arr = cardinal_directions[directions]
+    arr = _CARDINAL_DIRECTIONS[directions]
 
     return arr[(val % directions)]
 
@@ -652,47 +859,14 @@ def angle_from_cardinal(cardinal_direction: str) -> float:
         float:
             The angle associated with the cardinal direction.
     """
-    cardinal_directions = [
-        "N",
-        "NbE",
-        "NNE",
-        "NEbN",
-        "NE",
-        "NEbE",
-        "ENE",
-        "EbN",
-        "E",
-        "EbS",
-        "ESE",
-        "SEbE",
-        "SE",
-        "SEbS",
-        "SSE",
-        "SbE",
-        "S",
-        "SbW",
-        "SSW",
-        "SWbS",
-        "SW",
-        "SWbW",
-        "WSW",
-        "WbS",
-        "W",
-        "WbN",
-        "WNW",
-        "NWbW",
-        "NW",
-        "NWbN",
-        "NNW",
-        "NbW",
-    ]
-    if cardinal_direction not in cardinal_directions:
+    if cardinal_direction not in _CARDINAL_DIRECTION_ANGLES:
         raise ValueError(f"{cardinal_direction} is not a known cardinal_direction.")
-    angles = np.arange(0, 360, 11.25)
 
-    lookup = dict(zip(cardinal_directions, angles))
+    return _CARDINAL_DIRECTION_ANGLES[cardinal_direction]
+
 
-    return lookup[cardinal_direction]
+# the angle of north ([0, 1]) anticlockwise from the X-axis, in radians
+_NORTH_ANGLE = math.pi / 2
 
 
 def angle_from_north(vector: List[float]) -> float:
@@ -700,22 +874,24 @@ def angle_from_north(vector: List[float]) -> float:
 
     Args:
         vector (List[float]):
-            A vector of length 2.
+            A vector of length 2, or a pair of arrays of X and Y components.
 
     Returns:
         float:
             The angle between vector and north in degrees clockwise from [0, 1].
     """
-    north = [0, 1]
-    angle1 = np.arctan2(*north[::-1])
-    angle2 = np.arctan2(*vector[::-1])
-    return np.rad2deg((angle1 - angle2) % (2 * np.pi))
+    x, y = vector
+    if np.ndim(x) == 0:
+        return math.degrees((_NORTH_ANGLE - math.atan2(y, x)) % (2 * math.pi))
+    return np.rad2deg((_NORTH_ANGLE - np.arctan2(y, x)) % (2 * np.pi))
+
+
+_UNSAFE_PATH_CHARACTERS = re.compile(r"[^.A-Za-z0-9_-]")
 
 
 def sanitise_string(string: str) -> str:
     """Sanitise a string so that only path-safe characters remain."""
-    keep_characters = r"[^.A-Za-z0-9_-]"
-    return re.sub(keep_characters, "_", string).replace("__", "_").rstrip()
+    return _UNSAFE_PATH_CHARACTERS.sub("_", string).replace("__", "_").rstrip()
 
 
 def stringify_df_header(columns: List[Any]) -> List[str]:
@@ -734,11 +910,11 @@ def unstringify_df_header(columns: List[str]) -> List[Any]:
     evaled = []
     for i in columns:
         try:
-            evaled.append(eval(i))  # pylint: disable=eval-used
-        except NameError:
+            evaled.append(ast.literal_eval(i))
+        except (ValueError, SyntaxError):
             evaled.append(i)
 
-    if all("(" in i for i in str(evaled)):
+    if evaled and all(isinstance(i, tuple) for i in evaled):
         return pd.MultiIndex.from_tuples(evaled)
     return evaled
 
@@ -767,12 +943,15 @@ def store_dataset(
         raise ValueError('This method only currently works for "*.parquet" files.')
 
     if downcast:
-        # downcast dataframe type to save on storage
-        for col, _type in dataframe.dtypes.items():
-            if _type == "float64":
-                dataframe[col] = dataframe[col].astype(np.float32)
-            if _type == "int64":
-                dataframe[col] = dataframe[col].astype(np.int16)
+        # downcast dataframe type to save on storage, in a single astype call
+        downcast_types = {"float64": np.float32, "int64": np.int16}
+        dataframe = dataframe.astype(
+            {
+                col: downcast_types[str(_type)]
+                for col, _type in dataframe.dtypes.items()
+                if str(_type) in downcast_types
+            }
+        )
 
     # prepare dataframe for storage as parquet
     dataframe.columns = stringify_df_header(dataframe.columns)
@@ -800,11 +979,19 @@ def load_dataset(target_path: Path, upcast: bool = True) -> pd.DataFrame:
     df = pd.read_parquet(target_path)
 
     if upcast:
-        for col, _type in dict(df.dtypes).items():
-            if _type == "float32":
-                df[col].astype(np.float64)
-            elif _type in ["int32", "int16", "int8"]:
-                df[col].astype(np.int64)
+        upcast_types = {
+            "float32": np.float64,
+            "int32": np.int64,
+            "int16": np.int64,
+            "int8": np.int64,
+        }
+        df = df.astype(
+            {
+                col: upcast_types[str(_type)]
+                for col, _type in df.dtypes.items()
+                if str(_type) in upcast_types
+            }
+        )
 
     df.columns = unstringify_df_header(df.columns)
 
@@ -850,124 +1037,120 @@ class OpenMeteoVariable(Enum):
     @classmethod
     def from_string(cls, name: str) -> OpenMeteoVariable:
         """."""
-        d = {
-            "time": cls.TIME,
-            "temperature_2m": cls.TEMPERATURE_2M,
-            "dewpoint_2m": cls.DEWPOINT_2M,
-            "relativehumidity_2m": cls.RELATIVEHUMIDITY_2M,
-            "surface_pressure": cls.SURFACE_PRESSURE,
-            "shortwave_radiation": cls.SHORTWAVE_RADIATION,
-            "direct_radiation": cls.DIRECT_RADIATION,
-            "diffuse_radiation": cls.DIFFUSE_RADIATION,
-            "winddirection_10m": cls.WINDDIRECTION_10M,
-            "windspeed_10m": cls.WINDSPEED_10M,
-            "cloudcover": cls.CLOUDCOVER,
-            "weathercode": cls.WEATHERCODE,
-            "precipitation": cls.PRECIPITATION,
-            "rain": cls.RAIN,
-            "snowfall": cls.SNOWFALL,
-            "cloudcover_low": cls.CLOUDCOVER_LOW,
-            "cloudcover_mid": cls.CLOUDCOVER_MID,
-            "cloudcover_high": cls.CLOUDCOVER_HIGH,
-            "direct_normal_irradiance": cls.DIRECT_NORMAL_IRRADIANCE,
-            "windspeed_100m": cls.WINDSPEED_100M,
-            "winddirection_100m": cls.WINDDIRECTION_100M,
-            "windgusts_10m": cls.WINDGUSTS_10M,
-            "et0_fao_evapotranspiration": cls.ET0_FAO_EVAPOTRANSPIRATION,
-            "vapor_pressure_deficit": cls.VAPOR_PRESSURE_DEFICIT,
-            "soil_temperature_0_to_7cm": cls.SOIL_TEMPERATURE_0_TO_7CM,
-            "soil_temperature_7_to_28cm": cls.SOIL_TEMPERATURE_7_TO_28CM,
-            "soil_temperature_28_to_100cm": cls.SOIL_TEMPERATURE_28_TO_100CM,
-            "soil_temperature_100_to_255cm": cls.SOIL_TEMPERATURE_100_TO_255CM,
-            "soil_moisture_0_to_7cm": cls.SOIL_MOISTURE_0_TO_7CM,
-            "soil_moisture_7_to_28cm": cls.SOIL_MOISTURE_7_TO_28CM,
-            "soil_moisture_28_to_100cm": cls.SOIL_MOISTURE_28_TO_100CM,
-            "soil_moisture_100_to_255cm": cls.SOIL_MOISTURE_100_TO_255CM,
-        }
         try:
-            return d[name]
-        except KeyError as e:
+            return cls(name)
+        except ValueError as e:
             raise KeyError(e, f"{name} is not a known variable name.")
 
     @property
     def conversion_name(self) -> str:
         """Convert the enum value into a Ladybug dataype string representation (for this toolkit)."""
-        d = {
-            self.TIME.value: "Time (datetime)",
-            self.TEMPERATURE_2M.value: "Dry Bulb Temperature (C)",
-            self.DEWPOINT_2M.value: "Dew Point Temperature (C)",
-            self.RELATIVEHUMIDITY_2M.value: "Relative Humidity (%)",
-            self.SURFACE_PRESSURE.value: "Atmospheric Station Pressure (Pa)",
-            self.SHORTWAVE_RADIATION.value: "Global Horizontal Radiation (Wh/m2)",
-            self.DIRECT_RADIATION.value: "Direct Horizontal Radiation (Wh/m2)",
-            self.DIFFUSE_RADIATION.value: "Diffuse Horizontal Radiation (Wh/m2)",
-            self.WINDDIRECTION_10M.value: "Wind Direction (degrees)",
-            self.WINDSPEED_10M.value: "Wind Speed (m/s)",
-            self.CLOUDCOVER.value: "Opaque Sky Cover (tenths)",
-            self.WEATHERCODE.value: "Present Weather Codes (codes)",
-            self.PRECIPITATION.value: "Precipitable Water (mm)",
-            self.RAIN.value: "Liquid Precipitation Depth (mm)",
-            self.SNOWFALL.value: "Snow Depth (cm)",
-            self.CLOUDCOVER_LOW.value: "Cloud Cover @<2km (tenths)",
-            self.CLOUDCOVER_MID.value: "Cloud Cover @2-6km (tenths)",
-            self.CLOUDCOVER_HIGH.value: "Cloud Cover @>6km (tenths)",
-            self.DIRECT_NORMAL_IRRADIANCE.value: "Direct Normal Radiation (Wh/m2)",
-            self.WINDSPEED_100M.value: "Wind Speed @100m (m/s)",
-            self.WINDDIRECTION_100M.value: "Wind Direction @100m (degrees)",
-            self.WINDGUSTS_10M.value: "Wind Gusts (m/s)",
-            self.ET0_FAO_EVAPOTRANSPIRATION.value: "Evapotranspiration (mm/inch)",
-            self.VAPOR_PRESSURE_DEFICIT.value: "Vapor Pressure Deficit (Pa)",
-            self.SOIL_TEMPERATURE_0_TO_7CM.value: "Soil Temperature @0-7cm (C)",
-            self.SOIL_TEMPERATURE_7_TO_28CM.value: "Soil Temperature @7-28cm (C)",
-            self.SOIL_TEMPERATURE_28_TO_100CM.value: "Soil Temperature @28-100cm (C)",
-            self.SOIL_TEMPERATURE_100_TO_255CM.value: "Soil Temperature @100-255cm (C)",
-            self.SOIL_MOISTURE_0_TO_7CM.value: "Soil Moisture @0-7cm (fraction)",
-            self.SOIL_MOISTURE_7_TO_28CM.value: "Soil Moisture @7-28cm (fraction)",
-            self.SOIL_MOISTURE_28_TO_100CM.value: "Soil Moisture @28-100cm (fraction)",
-            self.SOIL_MOISTURE_100_TO_255CM.value: "Soil Moisture @100-255cm (fraction)",
-        }
-
-        return d[self.value]
+        return _OPEN_METEO_CONVERSION_NAMES[self]
 
     @property
     def conversion_factor(self) -> float:
         """Factors to multiple returned data from OpenMeteo by to give EPW standard units."""
-        d = {
-            self.TIME.value: None,
-            self.TEMPERATURE_2M.value: 1,
-            self.DEWPOINT_2M.value: 1,
-            self.RELATIVEHUMIDITY_2M.value: 1,
-            self.SURFACE_PRESSURE.value: 100,
-            self.SHORTWAVE_RADIATION.value: 1,
-            self.DIRECT_RADIATION.value: 1,
-            self.DIFFUSE_RADIATION.value: 1,
-            self.WINDDIRECTION_10M.value: 1,
-            self.WINDSPEED_10M.value: 1 / 3.6,
-            self.CLOUDCOVER.value: 0.1,
-            self.WEATHERCODE.value: None,
-            self.PRECIPITATION.value: 1,
-            self.RAIN.value: 1,
-            self.SNOWFALL.value: 1,
-            self.CLOUDCOVER_LOW.value: 0.1,
-            self.CLOUDCOVER_MID.value: 0.1,
-            self.CLOUDCOVER_HIGH.value: 0.1,
-            self.DIRECT_NORMAL_IRRADIANCE.value: 1,
-            self.WINDSPEED_100M.value: 1 / 3.6,
-            self.WINDDIRECTION_100M.value: 1,
-            self.WINDGUSTS_10M.value: 1 / 3.6,
-            self.ET0_FAO_EVAPOTRANSPIRATION.value: 1,
-            self.VAPOR_PRESSURE_DEFICIT.value: 0.001,
-            self.SOIL_TEMPERATURE_0_TO_7CM.value: 1,
-            self.SOIL_TEMPERATURE_7_TO_28CM.value: 1,
-            self.SOIL_TEMPERATURE_28_TO_100CM.value: 1,
-            self.SOIL_TEMPERATURE_100_TO_255CM.value: 1,
-            self.SOIL_MOISTURE_0_TO_7CM.value: 1,
-            self.SOIL_MOISTURE_7_TO_28CM.value: 1,
-            self.SOIL_MOISTURE_28_TO_100CM.value: 1,
-            self.SOIL_MOISTURE_100_TO_255CM.value: 1,
-        }
+        return _OPEN_METEO_CONVERSION_FACTORS[self]
+
+
+# Ladybug datatype string representations of each OpenMeteo variable (for this toolkit)
+_OPEN_METEO_CONVERSION_NAMES = {
+    OpenMeteoVariable.TIME: "Time (datetime)",
+    OpenMeteoVariable.TEMPERATURE_2M: "Dry Bulb Temperature (C)",
+    OpenMeteoVariable.DEWPOINT_2M: "Dew Point Temperature (C)",
+    OpenMeteoVariable.RELATIVEHUMIDITY_2M: "Relative Humidity (%)",
+    OpenMeteoVariable.SURFACE_PRESSURE: "Atmospheric Station Pressure (Pa)",
+    OpenMeteoVariable.SHORTWAVE_RADIATION: "Global Horizontal Radiation (Wh/m2)",
+    OpenMeteoVariable.DIRECT_RADIATION: "Direct Horizontal Radiation (Wh/m2)",
+    OpenMeteoVariable.DIFFUSE_RADIATION: "Diffuse Horizontal Radiation (Wh/m2)",
+    OpenMeteoVariable.WINDDIRECTION_10M: "Wind Direction (degrees)",
+    OpenMeteoVariable.WINDSPEED_10M: "Wind Speed (m/s)",
+    OpenMeteoVariable.CLOUDCOVER: "Opaque Sky Cover (tenths)",
+    OpenMeteoVariable.WEATHERCODE: "Present Weather Codes (codes)",
+    OpenMeteoVariable.PRECIPITATION: "Precipitable Water (mm)",
+    OpenMeteoVariable.RAIN: "Liquid Precipitation Depth (mm)",
+    OpenMeteoVariable.SNOWFALL: "Snow Depth (cm)",
+    OpenMeteoVariable.CLOUDCOVER_LOW: "Cloud Cover @<2km (tenths)",
+    OpenMeteoVariable.CLOUDCOVER_MID: "Cloud Cover @2-6km (tenths)",
+    OpenMeteoVariable.CLOUDCOVER_HIGH: "Cloud Cover @>6km (tenths)",
+    OpenMeteoVariable.DIRECT_NORMAL_IRRADIANCE: "Direct Normal Radiation (Wh/m2)",
+    OpenMeteoVariable.WINDSPEED_100M: "Wind Speed @100m (m/s)",
+    OpenMeteoVariable.WINDDIRECTION_100M: "Wind Direction @100m (degrees)",
+    OpenMeteoVariable.WINDGUSTS_10M: "Wind Gusts (m/s)",
+    OpenMeteoVariable.ET0_FAO_EVAPOTRANSPIRATION: "Evapotranspiration (mm/inch)",
+    OpenMeteoVariable.VAPOR_PRESSURE_DEFICIT: "Vapor Pressure Deficit (Pa)",
+    OpenMeteoVariable.SOIL_TEMPERATURE_0_TO_7CM: "Soil Temperature @0-7cm (C)",
+    OpenMeteoVariable.SOIL_TEMPERATURE_7_TO_28CM: "Soil Temperature @7-28cm (C)",
+    OpenMeteoVariable.SOIL_TEMPERATURE_28_TO_100CM: "Soil Temperature @28-100cm (C)",
+    OpenMeteoVariable.SOIL_TEMPERATURE_100_TO_255CM: "Soil Temperature @100-255cm (C)",
+    OpenMeteoVariable.SOIL_MOISTURE_0_TO_7CM: "Soil Moisture @0-7cm (fraction)",
+    OpenMeteoVariable.SOIL_MOISTURE_7_TO_28CM: "Soil Moisture @7-28cm (fraction)",
+    OpenMeteoVariable.SOIL_MOISTURE_28_TO_100CM: "Soil Moisture @28-100cm (fraction)",
+    OpenMeteoVariable.SOIL_MOISTURE_100_TO_255CM: "Soil Moisture @100-255cm (fraction)",
+}
+
+# factors to multiply data returned from OpenMeteo by to give EPW standard units
+_OPEN_METEO_CONVERSION_FACTORS = {
+    OpenMeteoVariable.TIME: None,
+    OpenMeteoVariable.TEMPERATURE_2M: 1,
+    OpenMeteoVariable.DEWPOINT_2M: 1,
+    OpenMeteoVariable.RELATIVEHUMIDITY_2M: 1,
+    OpenMeteoVariable.SURFACE_PRESSURE: 100,
+    OpenMeteoVariable.SHORTWAVE_RADIATION: 1,
+    OpenMeteoVariable.DIRECT_RADIATION: 1,
+    OpenMeteoVariable.DIFFUSE_RADIATION: 1,
+    OpenMeteoVariable.WINDDIRECTION_10M: 1,
+    OpenMeteoVariable.WINDSPEED_10M: 1 / 3.6,
+    OpenMeteoVariable.CLOUDCOVER: 0.1,
+    OpenMeteoVariable.WEATHERCODE: None,
+    OpenMeteoVariable.PRECIPITATION: 1,
+    OpenMeteoVariable.RAIN: 1,
+    OpenMeteoVariable.SNOWFALL: 1,
+    OpenMeteoVariable.CLOUDCOVER_LOW: 0.1,
+    OpenMeteoVariable.CLOUDCOVER_MID: 0.1,
+    OpenMeteoVariable.CLOUDCOVER_HIGH: 0.1,
+    OpenMeteoVariable.DIRECT_NORMAL_IRRADIANCE: 1,
+    OpenMeteoVariable.WINDSPEED_100M: 1 / 3.6,
+    OpenMeteoVariable.WINDDIRECTION_100M: 1,
+    OpenMeteoVariable.WINDGUSTS_10M: 1 / 3.6,
+    OpenMeteoVariable.ET0_FAO_EVAPOTRANSPIRATION: 1,
+    OpenMeteoVariable.VAPOR_PRESSURE_DEFICIT: 0.001,
+    OpenMeteoVariable.SOIL_TEMPERATURE_0_TO_7CM: 1,
+    OpenMeteoVariable.SOIL_TEMPERATURE_7_TO_28CM: 1,
+    OpenMeteoVariable.SOIL_TEMPERATURE_28_TO_100CM: 1,
+    OpenMeteoVariable.SOIL_TEMPERATURE_100_TO_255CM: 1,
+    OpenMeteoVariable.SOIL_MOISTURE_0_TO_7CM: 1,
+    OpenMeteoVariable.SOIL_MOISTURE_7_TO_28CM: 1,
+    OpenMeteoVariable.SOIL_MOISTURE_28_TO_100CM: 1,
+    OpenMeteoVariable.SOIL_MOISTURE_100_TO_255CM: 1,
+}
+
+
+@lru_cache(maxsize=16)
+def _fetch_openmeteo(query_string: str) -> Dict[str, Any]:
+    """Download (and cache) the JSON response for an Open-Meteo query, with each hourly
+        variable converted to a NumPy array. The cached response is shared between calls,
+        so should not be modified.
+
+    Args:
+        query_string (str):
+            The full Open-Meteo API query URL.
+
+    Returns:
+        Dict[str, Any]:
+            The decoded JSON response.
+    """
+    with urllib.request.urlopen(query_string) as url:
+        data = json.load(url)
 
-        return d[self.value]
+    # replace the (boxed) Python lists of values with compact arrays, so that the parsed
+    # lists can be freed rather than being held in the cache
+    data["hourly"] = {
+        k: np.array(v) if k == "time" else np.array(v, dtype=np.float64)
+        for k, v in data["hourly"].items()
+    }
+
+    return data
 
 
 def scrape_openmeteo(
@@ -1007,40 +1190,38 @@ def scrape_openmeteo(
     var_strings = ",".join([i.value for i in variables if i.name.lower() != "time"])
     query_string = f"https://archive-api.open-meteo.com/v1/era5?latitude={latitude}&longitude={longitude}&start_date={start_date:%Y-%m-%d}&end_date={end_date:%Y-%m-%d}&hourly={var_strings}"
 
-    with urllib.request.urlopen(query_string) as url:
-        data = json.load(url)
+    data = _fetch_openmeteo(query_string)
 
-    if not convert_units:
-        headers = [f"{k} ({v})" for (k, v) in data["hourly_units"].items()]
-    else:
-        headers = [
-            OpenMeteoVariable.from_string(k).conversion_name
-            for (k, v) in data["hourly_units"].items()
-        ]
-
-    if not convert_units:
-        values = [v for k, v in data["hourly"].items()]
-    else:
-        values = []
-        for k, v in data["hourly"].items():
-            en = OpenMeteoVariable.from_string(k)
-            if en.conversion_factor is None:
-                values.append(v)
-            else:
-                values.append([i * en.conversion_factor for i in v])
-    df = pd.DataFrame(np.array(values).T, columns=headers)
-    df = df.set_index(df.columns[0])
-    df.index = pd.to_datetime(df.index)
-    return df
+    columns = {}
+    for k, v in data["hourly"].items():
+        if not convert_units:
+            columns[f"{k} ({data['hourly_units'][k]})"] = v
+            continue
+        en = OpenMeteoVariable.from_string(k)
+        if en.conversion_factor is None:
+            columns[en.conversion_name] = v
+        else:
+            columns[en.conversion_name] = (
+                np.asarray(v, dtype=np.float64) * en.conversion_factor
+            )
+    # the first column returned is the time, which is parsed directly into the index
+    index_name = next(iter(columns))
+    index = pd.to_datetime(columns.pop(index_name)).rename(index_name)
+    return pd.DataFrame(columns, index=index)
 
 
 def weibull_directional(
-    binned_data: Dict[Tuple[float, float], List[float]]
+    binned_data: Dict[Tuple[float, float], List[float]], parallel: bool = False
 ) -> pd.DataFrame:
     """Calculate the weibull coefficients for a given set of binned data in the form {(low, high): [speeds], (low, high): [speeds]}, binned by the number of directions specified.
     Args:
         binned_data (Dict[Tuple[float, float], List[float]]):
             A dictionary of binned wind speed data.
+        parallel (bool, optional):
+            Set to True to fit each bin in a separate process. This is only worthwhile
+            where each bin holds a lot of data, as starting the worker processes has a
+            cost of its own (and on Windows, requires the calling script to be guarded by
+            if __name__ == "__main__"). Defaults to False.
     Returns:
         pd.DataFrame:
             A DataFrame with (direction_bin_low, direction_bin_high) as index, and weibull coefficients as columns.
@@ -1048,11 +1229,22 @@ def weibull_directional(
     warnings.warn(
         "This method was written by someone who doesn't actually know what thesse values mean. PLease don't trust them!"
     )
-    d = {}
-    for (low, high), speeds in tqdm(
-        binned_data.items(), desc="Calculating Weibull shape parameters"
-    ):
-        d[(low, high)] = weibull_pdf(speeds)
+    speeds = [np.asarray(i, dtype=np.float64) for i in binned_data.values()]
+    if parallel:
+        with ProcessPoolExecutor() as executor:
+            results = list(
+                tqdm(
+                    executor.map(weibull_pdf, speeds),
+                    total=len(speeds),
+                    desc="Calculating Weibull shape parameters",
+                )
+            )
+    else:
+        results = [
+            weibull_pdf(i)
+            for i in tqdm(speeds, desc="Calculating Weibull shape parameters")
+        ]
+    d = dict(zip(binned_data.keys(), results))
 
     return pd.DataFrame.from_dict(d, orient="index", columns=["x", "k", "λ", "α"])
 
@@ -1074,9 +1266,8 @@ def weibull_pdf(wind_speeds: List[float]) -> Tuple[float]:
             CFD - scale, c
             scipy - kurtosis
     """
-    ws = np.array(wind_speeds)
-    ws = ws[ws != 0]
-    ws = ws[~np.isnan(ws)]
+    ws = np.asarray(wind_speeds, dtype=np.float64)
+    ws = ws[(ws != 0) & ~np.isnan(ws)]
     try:
         return exponweib.fit(ws, floc=0, f0=1)
     except ValueError as exc:
@@ -1084,46 +1275,42 @@ def weibull_pdf(wind_speeds: List[float]) -> Tuple[float]:
         return (1, np.nan, 0, np.nan)  # type: ignore
 
 
-def circular_weighted_mean(angles: List[float], weights: List[float]):
+def circular_weighted_mean(angles: List[float], weights: List[float] = None):
     """Get the average angle from a set of weighted angles.
 
     Args:
         angles (List[float]):
             A collection of equally weighted wind directions, in degrees from North (0).
-        weights (List[float]):
-            A collection of weights, which must sum to 1.
+        weights (List[float], optional):
+            A collection of weights, which must sum to 1. Defaults to None, which weights
+            each angle equally.
 
     Returns:
         float:
             An average wind direction.
     """
 
-    angles = np.array(angles)
-    weights = np.array(weights)
+    angles = np.asarray(angles, dtype=np.float64)
+
+    if weights is None:
+        weights = np.ones_like(angles) / len(angles)
+    weights = np.asarray(weights, dtype=np.float64)
 
     if angles.shape != weights.shape:
         raise ValueError("weights must be the same size as angles.")
 
-    if np.any(angles < 0) or np.any(angles > 360):
+    if np.any((angles < 0) | (angles > 360)):
         raise ValueError("Input angles exist outside of expected range (0-360).")
 
-    if weights is None:
-        weights = np.ones_like(angles) / len(angles)
-
-    if sum(weights) != 1:
+    if not np.isclose(weights.sum(), 1):
         raise ValueError("weights must total 1.")
 
-    x = y = 0.0
-    for angle, weight in zip(angles, weights):
-        x += np.cos(np.radians(angle)) * weight
-        y += np.sin(np.radians(angle)) * weight
+    # resultant of the weighted unit vectors for each angle
+    radians = np.radians(angles)
+    x = np.cos(radians) @ weights
+    y = np.sin(radians) @ weights
 
-    mean = np.degrees(np.arctan2(y, x))
-
-    if mean < 0:
-        mean = 360 + mean
-
-    return mean
+    return np.mod(np.degrees(np.arctan2(y, x)), 360)
 
 
 def wind_direction_average(angles: List[float]) -> float:
@@ -1138,28 +1325,19 @@ def wind_direction_average(angles: List[float]) -> float:
             An average angle.
     """
 
-    angles = np.array(angles)  # type: ignore
+    angles = np.asarray(angles, dtype=np.float64)
 
-    if np.any(angles < 0) or np.any(angles > 360):  # type: ignore
+    if np.any((angles < 0) | (angles > 360)):
         raise ValueError("Input angles exist outside of expected range (0-360).")
 
     if len(angles) == 0:
         return np.NaN
 
-    angles = np.radians(angles)  # type: ignore
+    # the mean of the unit vectors has the same direction as their sum
+    radians = np.radians(angles)
+    average_angle = np.arctan2(np.sin(radians).sum(), np.cos(radians).sum())
 
-    average_angle = np.round(
-        np.arctan2(
-            (1 / len(angles) * np.sin(angles)).sum(),
-            (1 / len(angles) * np.cos(angles)).sum(),
-        ),
-        2,
-    )
-
-    if average_angle < 0:
-        average_angle = (np.pi * 2) - -average_angle
-
-    return np.degrees(average_angle)
+    return np.degrees(average_angle % (2 * np.pi))
 
 
 def wind_speed_at_height(
@@ -1223,17 +1401,17 @@ def wind_speed_at_height(
 
 
 def temperature_at_height(
-    reference_value: float,
+    reference_value: Union[float, np.ndarray],
     reference_height: float,
     target_height: float,
     **kwargs,
-) -> float:
+) -> Union[float, np.ndarray]:
     """Estimate the dry-bulb temperature at a given height from a referenced
         dry-bulb temperature at another height.
 
     Args:
-        reference_temperature (float):
-            The temperature to translate.
+        reference_temperature (Union[float, np.ndarray]):
+            The temperature, or array of temperatures, to translate.
         reference_height (float):
             The height of the reference temperature.
         target_height (float):
@@ -1250,8 +1428,8 @@ def temperature_at_height(
             conditions (or 6.5C per 1km). This would be nearer 0.0098C/m if cloudy/moist air conditions.
 
     Returns:
-        float:
-            A translated air temperature.
+        Union[float, np.ndarray]:
+            A translated air temperature, or array of translated air temperatures.
     """
 
     if (target_height > 8000) or (reference_height > 8000):
@@ -1381,10 +1559,9 @@ def dry_bulb_temperature_at_height(
         HourlyContinuousCollection: A resulting dry-bulb temperature collection.
     """
     dbt_collection = copy.copy(epw.dry_bulb_temperature)
-    dbt_collection.values = [
-        temperature_at_height(i, 10, target_height)
-        for i in epw.dry_bulb_temperature.values
-    ]
+    dbt_collection.values = temperature_at_height(
+        np.array(epw.dry_bulb_temperature.values), 10, target_height
+    ).tolist()
     return dbt_collection
 
 
@@ -1406,10 +1583,13 @@ def tile_images(
             A PIL image of the tiled images.
     """
 
-    imgs = np.array([Path(i) for i in np.array(imgs).flatten()])
-
-    # open images if paths passed
-    imgs = [Image.open(img) if isinstance(img, Path) else img for img in imgs]
+    # flatten nested (row-by-row) inputs, and open images if paths passed
+    flat_imgs = []
+    for img in imgs:
+        flat_imgs.extend(img if isinstance(img, (list, tuple, np.ndarray)) else [img])
+    imgs = [
+        Image.open(img) if isinstance(img, (str, Path)) else img for img in flat_imgs
+    ]
 
     if len(imgs) != rows * cols:
         raise ValueError(
@@ -1422,14 +1602,14 @@ def tile_images(
         if img.size != (w, h):
             raise ValueError("All images must have the same dimensions")
 
-    w, h = imgs[0].size
-    grid = Image.new("RGBA", size=(cols * w, rows * h))
-
+    # copy each tile directly into its block of a single pixel buffer
+    grid = np.empty((rows * h, cols * w, 4), dtype=np.uint8)
     for i, img in enumerate(imgs):
-        grid.paste(img, box=(i % cols * w, i // cols * h))
+        row, col = divmod(i, cols)
+        grid[row * h : (row + 1) * h, col * w : (col + 1) * w] = img.convert("RGBA")
         img.close()
 
-    return grid
+    return Image.fromarray(grid, "RGBA")
 
 
 def validate_timeseries(
@@ -1462,12 +1642,11 @@ def validate_timeseries(
     if not isinstance(obj.index, pd.DatetimeIndex):
         raise TypeError("series must have a datetime index")
     if is_annual:
-        if (obj.index.day_of_year.nunique() != 365) or (
-            obj.index.day_of_year.nunique() != 366
-        ):
+        n_days = (obj.index.max().normalize() - obj.index.min().normalize()).days + 1
+        if n_days not in (365, 366):
             raise ValueError("series is not annual")
     if is_hourly:
-        if obj.index.hour.nunique() != 24:
+        if (len(obj) < 2) or np.any(np.diff(obj.index.asi8) != 3_600_000_000_000):
             raise ValueError("series is not hourly")
     if is_contiguous:
         if not obj.index.is_monotonic_increasing:
@@ -1493,14 +1672,92 @@ def lighten_color(color: Union[str, Tuple], amount: float = 0.5) -> Tuple[float]
     >> lighten_color('#F034A3', 0.6)
     >> lighten_color((.3,.55,.1), 0.5)
     """
+    if not isinstance(color, str):
+        color = tuple(color)
+    return _lighten_single_color(color, amount)
+
+
+@lru_cache(maxsize=256)
+def _lighten_single_color(
+    color: Union[str, Tuple[float]], amount: float
+) -> Tuple[float]:
+    """Lighten (and cache the result for) a single hashable color.
+
+    Args:
+        color (Union[str, Tuple[float]]):
+            A color-like string or rgb(a)-tuple.
+        amount (float):
+            The amount of lightening to apply.
+
+    Returns:
+        Tuple[float]:
+            An RGB value.
+    """
     try:
         c = cnames[color]
     except KeyError:
         c = color
+    if amount == 1:
+        return to_rgb(c)
     c = colorsys.rgb_to_hls(*to_rgb(c))
     return colorsys.hls_to_rgb(c[0], 1 - amount * (1 - c[1]), c[2])
 
 
+def lighten_colors(colors: List[Any], amount: float = 0.5) -> np.ndarray:
+    """Lighten a sequence of colors by multiplying (1-luminosity) by the given amount, in a
+        single vectorised pass (equivalent to calling lighten_color on each).
+
+    Args:
+        colors (List[Any]):
+            A sequence of matplotlib colors (or an (N, 3|4) array of RGB(A) values).
+        amount (float):
+            The amount of lightening to apply.
+
+    Returns:
+        np.ndarray:
+            An (N, 3) array of RGB values.
+    """
+    rgb = colorConverter.to_rgba_array(colors)[:, :3]
+    if amount == 1:
+        return rgb
+
+    # convert RGB to HLS (as per colorsys.rgb_to_hls)
+    maxc = rgb.max(axis=1)
+    minc = rgb.min(axis=1)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    lightness = sumc / 2
+    grey = rangec == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        saturation = np.where(
+            lightness <= 0.5, rangec / sumc, rangec / (2 - maxc - minc)
+        )
+        rc, gc, bc = ((maxc[:, None] - rgb) / rangec[:, None]).T
+    hue = np.where(
+        rgb[:, 0] == maxc,
+        bc - gc,
+        np.where(rgb[:, 1] == maxc, 2 + rc - bc, 4 + gc - rc),
+    )
+    hue = np.where(grey, 0, (hue / 6) % 1)
+    saturation = np.where(grey, 0, saturation)
+
+    # lighten, then convert HLS back to RGB (as per colorsys.hls_to_rgb)
+    lightness = 1 - amount * (1 - lightness)
+    m2 = np.where(
+        lightness <= 0.5,
+        lightness * (1 + saturation),
+        lightness + saturation - (lightness * saturation),
+    )
+    m1 = 2 * lightness - m2
+    hues = (hue[:, None] + [1 / 3, 0, -1 / 3]) % 1
+    m1, m2 = m1[:, None], m2[:, None]
+    return np.select(
+        [hues < 1 / 6, hues < 0.5, hues < 2 / 3],
+        [m1 + (m2 - m1) * hues * 6, m2, m1 + (m2 - m1) * (2 / 3 - hues) * 6],
+        m1,
+    )
+
+
 def triangulation_area(triang: Triangulation) -> float:
     """Calculate the area of a matplotlib Triangulation.
 
@@ -1513,20 +1770,10 @@ def triangulation_area(triang: Triangulation) -> float:
             The area of the Triangulation in the units given.
     """
 
-    triangles = triang.triangles
+    t0, t1, t2 = triang.triangles.T
     x, y = triang.x, triang.y
-    a, _ = triangles.shape
-    i = np.arange(a)
-    area = np.sum(
-        np.abs(
-            0.5
-            * (
-                (x[triangles[i, 1]] - x[triangles[i, 0]])
-                * (y[triangles[i, 2]] - y[triangles[i, 0]])
-                - (x[triangles[i, 2]] - x[triangles[i, 0]])
-                * (y[triangles[i, 1]] - y[triangles[i, 0]])
-            )
-        )
+    area = 0.5 * np.sum(
+        np.abs((x[t1] - x[t0]) * (y[t2] - y[t0]) - (x[t2] - x[t0]) * (y[t1] - y[t0]))
     )
 
     return area
@@ -1576,60 +1823,222 @@ def create_triangulation(
     ytri = y[triang.triangles] - np.roll(y[triang.triangles], 1, axis=1)
     maxi = np.max(np.sqrt(xtri**2 + ytri**2), axis=1)
 
-    # Iterate triangulation masking until a possible mask is found
-    count = 0
-    fig, ax = plt.subplots(1, 1)
+    # Iterate triangulation masking until a possible mask is found, updating the mask
+    # in-place rather than copying the triangulation for each attempt (on an axes that
+    # isn't managed by pyplot, so it needn't be closed afterwards)
+    ax = Figure().add_subplot()
     synthetic_values = range(len(x))
-    success = False
-    while not success:
+    sorted_maxi = np.sort(maxi)
+    count = 0
+    while True:
         count += 1
+        triang.set_mask(maxi > alpha)
         try:
-            tr = copy.deepcopy(triang)
-            tr.set_mask(maxi > alpha)
-            ax.tricontour(tr, synthetic_values)
-            success = True
+            ax.tricontour(triang, synthetic_values)
         except ValueError:
-            alpha += increment
+            # step alpha on by as many increments as needed to unmask at least one more
+            # triangle, skipping increments that would just retry an identical mask
+            n_unmasked = np.searchsorted(sorted_maxi, alpha, side="right")
+            if n_unmasked == len(sorted_maxi):
+                raise ValueError(
+                    "Could not create a valid triangulation mask, even with no triangles masked."
+                ) from None
+            alpha += max(1, np.ceil((sorted_maxi[n_unmasked] - alpha) / increment)) * (
+                increment
+            )
         else:
             break
         if count > max_iterations:
             raise ValueError(
                 f"Could not create a valid triangulation mask within {max_iterations}"
             )
-    plt.close(fig)
-    triang.set_mask(maxi > alpha)
     return triang
 
 
+def _saturated_vapor_pressure(t_kelvin: np.ndarray) -> np.ndarray:
+    """A vectorised version of ladybug.psychrometrics.saturated_vapor_pressure.
+
+    Args:
+        t_kelvin (np.ndarray):
+            Dry bulb temperature in K.
+
+    Returns:
+        np.ndarray:
+            Saturated vapor pressure in Pa.
+    """
+    t = t_kelvin
+    ln_p_ws = np.where(
+        t <= 273.15,
+        -5.6745359e03 / t
+        + 6.3925247
+        - 9.677843e-03 * t
+        + 6.2215701e-07 * t**2
+        + 2.0747825e-09 * t**3
+        - 9.484024e-13 * t**4
+        + 4.1635019 * np.log(t),
+        -5.8002206e03 / t
+        + 1.3914993
+        - 4.8640239e-02 * t
+        + 4.1764768e-05 * t**2
+        - 1.4452093e-08 * t**3
+        + 6.5459673 * np.log(t),
+    )
+    return np.exp(ln_p_ws)
+
+
+def _dew_point_from_db_rh(db_temp: np.ndarray, rel_humid: np.ndarray) -> np.ndarray:
+    """A vectorised version of ladybug.psychrometrics.dew_point_from_db_rh, iterating
+        each value until it converges (to 0.1C) or reaches the iteration limit.
+
+    Args:
+        db_temp (np.ndarray):
+            Dry bulb temperature in C.
+        rel_humid (np.ndarray):
+            Relative humidity in %.
+
+    Returns:
+        np.ndarray:
+            Dew point temperature in C.
+    """
+    with np.errstate(divide="ignore"):
+        ln_vp = np.log(_saturated_vapor_pressure(db_temp + 273.15) * (rel_humid / 100))
+
+    td = db_temp.copy()
+    active = np.isfinite(ln_vp)
+    for _ in range(101):
+        if not active.any():
+            break
+        t = td[active] + 273.15
+        d_ln_p_ws = np.where(
+            t <= 273.15,
+            5.6745359e03 / t**2
+            - 9.677843e-03
+            + 2 * 6.2215701e-07 * t
+            + 3 * 2.0747825e-09 * t**2
+            - 4 * 9.484024e-13 * t**3
+            + 4.1635019 / t,
+            5.8002206e03 / t**2
+            - 4.8640239e-02
+            + 2 * 4.1764768e-05 * t
+            - 3 * 1.4452093e-08 * t**2
+            + 6.5459673 / t,
+        )
+        td_iter = td[active]
+        td_new = td_iter - (np.log(_saturated_vapor_pressure(t)) - ln_vp[active]) / (
+            d_ln_p_ws
+        )
+        td[active] = td_new
+        active[active] = np.abs(td_new - td_iter) > 0.1
+
+    # a relative humidity of 0 gives a dew point of absolute zero
+    return np.where(np.isneginf(ln_vp), -273.15, np.minimum(td, db_temp))
+
+
+def _wet_bulb_from_db_rh(
+    db_temp: np.ndarray, rel_humid: np.ndarray, b_press: np.ndarray
+) -> np.ndarray:
+    """A vectorised version of ladybug.psychrometrics.wet_bulb_from_db_rh, bisecting
+        each value until its bounds are within 0.1C or it reaches the iteration limit.
+
+    Args:
+        db_temp (np.ndarray):
+            Dry bulb temperature in C.
+        rel_humid (np.ndarray):
+            Relative humidity in %.
+        b_press (np.ndarray):
+            Air pressure in Pa.
+
+    Returns:
+        np.ndarray:
+            Wet bulb temperature in C.
+    """
+    db_temp, rel_humid, b_press = np.broadcast_arrays(
+        np.asarray(db_temp, dtype=float),
+        np.asarray(rel_humid, dtype=float),
+        np.asarray(b_press, dtype=float),
+    )
+
+    p_w = _saturated_vapor_pressure(db_temp + 273.15) * (rel_humid / 100)
+    humid_ratio = (p_w * 0.621945) / (b_press - p_w)
+
+    wb_temp_sup = db_temp.copy()
+    wb_temp_inf = _dew_point_from_db_rh(db_temp, rel_humid)
+    wb_temp = (wb_temp_inf + wb_temp_sup) / 2
+
+    active = (wb_temp_sup - wb_temp_inf) > 0.1
+    for _ in range(100):
+        if not active.any():
+            break
+        db, wb, press = db_temp[active], wb_temp[active], b_press[active]
+        p_ws = _saturated_vapor_pressure(wb + 273.15)
+        p_ws_star = 0.621945 * p_ws / (press - p_ws)
+        w_star = np.where(
+            wb >= 0,
+            ((2501.0 - 2.326 * wb) * p_ws_star - 1.006 * (db - wb))
+            / (2501.0 + 1.86 * db - 4.186 * wb),
+            ((2830.0 - 0.24 * wb) * p_ws_star - 1.006 * (db - wb))
+            / (2830.0 + 1.86 * db - 2.1 * wb),
+        )
+        above = w_star > humid_ratio[active]
+        sup, inf = wb_temp_sup[active], wb_temp_inf[active]
+        sup[above] = wb[above]
+        inf[~above] = wb[~above]
+        wb_temp_sup[active], wb_temp_inf[active] = sup, inf
+        wb_temp[active] = (sup + inf) / 2
+        active[active] = (sup - inf) > 0.1
+
+    return wb_temp
+
+
 def evaporative_cooling_effect(
-    dry_bulb_temperature: float,
-    relative_humidity: float,
-    evaporative_cooling_effectiveness: float,
-    atmospheric_pressure: float = None,
-) -> List[float]:
+    dry_bulb_temperature: Union[float, np.ndarray],
+    relative_humidity: Union[float, np.ndarray],
+    evaporative_cooling_effectiveness: Union[float, np.ndarray],
+    atmospheric_pressure: Union[float, np.ndarray] = None,
+) -> List[Union[float, np.ndarray]]:
     """
     For the inputs, calculate the effective DBT and RH values for the evaporative cooling
     effectiveness given.
 
     Args:
-        dry_bulb_temperature (float):
+        dry_bulb_temperature (Union[float, np.ndarray]):
             A dry bulb temperature in degrees Celsius.
-        relative_humidity (float):
+        relative_humidity (Union[float, np.ndarray]):
             A relative humidity in percent (0-100).
-        evaporative_cooling_effectiveness (float):
+        evaporative_cooling_effectiveness (Union[float, np.ndarray]):
             The evaporative cooling effectiveness. This should be a value between 0 (no effect)
             and 1 (saturated air).
-        atmospheric_pressure (float, optional):
+        atmospheric_pressure (Union[float, np.ndarray], optional):
             A pressure in Pa. Default is pressure at sea level (101325 Pa).
 
     Returns:
-        effective_dry_bulb_temperature, effective_relative_humidity (List[float]):
-            A list of two values for the effective dry bulb temperature and relative humidity.
+        effective_dry_bulb_temperature, effective_relative_humidity (List[Union[float, np.ndarray]]):
+            A list of two values (or arrays of values, where arrays are input) for the effective
+            dry bulb temperature and relative humidity.
     """
 
     if atmospheric_pressure is None:
         atmospheric_pressure = 101325
 
+    inputs = [
+        dry_bulb_temperature,
+        relative_humidity,
+        evaporative_cooling_effectiveness,
+        atmospheric_pressure,
+    ]
+    if any(np.ndim(i) > 0 for i in inputs):
+        dbt, rh, ece, atm = np.broadcast_arrays(
+            *(np.asarray(i, dtype=float) for i in inputs)
+        )
+        wet_bulb_temperature = _wet_bulb_from_db_rh(dbt, rh, atm)
+        new_dbt = dbt - ((dbt - wet_bulb_temperature) * ece)
+        new_rh = (rh * (1 - ece)) + ece * 100
+        saturated = new_rh > 100
+        return [
+            np.where(saturated, wet_bulb_temperature, new_dbt),
+            np.where(saturated, 100, new_rh),
+        ]
+
     wet_bulb_temperature = wet_bulb_from_db_rh(
         dry_bulb_temperature, relative_humidity, atmospheric_pressure
     )
@@ -1672,18 +2081,16 @@ def evaporative_cooling_effect_collection(
     ):
         raise ValueError("evaporative_cooling_effectiveness must be between 0 and 1.")
 
-    wbt = HourlyContinuousCollection.compute_function_aligned(
-        wet_bulb_from_db_rh,
-        [
-            epw.dry_bulb_temperature,
-            epw.relative_humidity,
-            epw.atmospheric_station_pressure,
-        ],
-        WetBulbTemperature(),
-        "C",
+    dbt_values = np.array(epw.dry_bulb_temperature.values)
+    wbt = _wet_bulb_from_db_rh(
+        dbt_values,
+        np.array(epw.relative_humidity.values),
+        np.array(epw.atmospheric_station_pressure.values),
     )
     dbt = epw.dry_bulb_temperature.duplicate()
-    dbt = dbt - ((dbt - wbt) * evaporative_cooling_effectiveness)
+    dbt.values = (
+        dbt_values - ((dbt_values - wbt) * evaporative_cooling_effectiveness)
+    ).tolist()
     dbt.header.metadata[
         "evaporative_cooling"
     ] = f"{evaporative_cooling_effectiveness:0.0%}"
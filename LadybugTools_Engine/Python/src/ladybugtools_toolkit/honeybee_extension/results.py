@@ -1,12 +1,16 @@
+import contextlib
 import datetime
+import sqlite3
 import warnings
 from pathlib import Path
-from typing import Callable, List, Union
+from typing import Callable, Iterator, List, Optional, Union
 
 import numpy as np
 import pandas as pd
+from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.sql import SQLiteResult
 
+from ..ladybug_extension.analysis_period import analysis_period_to_datetimes
 from ..ladybug_extension.datacollection import collection_to_series
 
 
@@ -168,11 +172,144 @@ def load_res(res_files: Union[str, Path, List[Union[str, Path]]]) -> pd.DataFram
     return load_files(load_res_file, res_files)
 
 
-def load_sql_file(sql_file: Union[str, Path]) -> pd.DataFrame:
+def _sql_element(variable: str, index_group: str) -> str:
+    """Determine the element type for an EnergyPlus output variable, following
+        the same logic as ladybug.sql.SQLiteResult.
+
+    Args:
+        variable (str): The name of the EnergyPlus output variable.
+        index_group (str): The IndexGroup of the output variable.
+
+    Returns:
+        str: The element type ("Surface", "System", "Zone" or "Unknown").
+    """
+    element = "Surface" if "Surface" in variable else index_group
+    if element not in ["Surface", "System", "Zone"]:
+        warnings.warn(f"Could not determine element type for {variable}")
+        return "Unknown"
+    return element
+
+
+def _sql_hourly_dictionary(cursor: sqlite3.Cursor) -> Optional[List[tuple]]:
+    """Return the ReportDataDictionary rows from an EnergyPlus SQL file, provided the
+        file contains only annual hourly results.
+
+    Args:
+        cursor (sqlite3.Cursor): A cursor for an open EnergyPlus .sql file.
+
+    Returns:
+        Optional[List[tuple]]: A list of (ReportDataDictionaryIndex, IndexGroup,
+            KeyValue, Name, ReportingFrequency, Units) rows, or None if the file
+            contains data that cannot be read directly (e.g. non-hourly or multiple
+            run-period results), in which case callers must fall back to another reader.
+    """
+
+    dictionary_rows = cursor.execute(
+        "SELECT ReportDataDictionaryIndex, IndexGroup, KeyValue, Name, ReportingFrequency, Units "
+        "FROM ReportDataDictionary ORDER BY ReportDataDictionaryIndex"
+    ).fetchall()
+    if len(dictionary_rows) == 0 or any(row[4] != "Hourly" for row in dictionary_rows):
+        return None
+
+    n_times = cursor.execute(
+        "SELECT COUNT(DISTINCT TimeIndex) FROM ReportData"
+    ).fetchone()[0]
+    if n_times != 8760:
+        return None
+
+    return dictionary_rows
+
+
+def _sql_hourly_dataframe(
+    sql_file: Path, cursor: sqlite3.Cursor, dictionary_rows: List[tuple], subset: bool
+) -> pd.DataFrame:
+    """Read the values for the given ReportDataDictionary rows directly from an
+        EnergyPlus SQL file into a single preallocated array.
+
+    Args:
+        sql_file (Path): The path to the EnergyPlus .sql file.
+        cursor (sqlite3.Cursor): A cursor for the open EnergyPlus .sql file.
+        dictionary_rows (List[tuple]): The rows returned by _sql_hourly_dictionary
+            for which values should be read.
+        subset (bool): Set to True if dictionary_rows is a subset of the variables in
+            the file, in which case only those variables are selected.
+
+    Returns:
+        pd.DataFrame: A pandas DataFrame with hourly values along rows and variables
+            along columns.
+    """
+
+    # read all values in (time, variable) order into a single buffer
+    n_times = 8760
+    n_vars = len(dictionary_rows)
+    cursor.arraysize = 8192
+    if subset:
+        cursor.execute(
+            "SELECT Value FROM ReportData WHERE ReportDataDictionaryIndex IN "
+            f"({', '.join('?' * n_vars)}) ORDER BY TimeIndex, ReportDataDictionaryIndex",
+            [row[0] for row in dictionary_rows],
+        )
+    else:
+        cursor.execute(
+            "SELECT Value FROM ReportData ORDER BY TimeIndex, ReportDataDictionaryIndex"
+        )
+    values = np.fromiter(
+        (row[0] for row in cursor), dtype=np.float64, count=n_times * n_vars
+    ).reshape(n_times, n_vars)
+
+    headers = []
+    for n, (_, index_group, key_value, variable, _, unit) in enumerate(
+        dictionary_rows
+    ):
+        if unit == "J":
+            values[:, n] /= 3600000
+            unit = "kWh"
+        headers.append(
+            (
+                sql_file.as_posix(),
+                _sql_element(variable, index_group),
+                key_value,
+                f"{variable} ({unit})",
+            )
+        )
+
+    return pd.DataFrame(
+        values,
+        index=analysis_period_to_datetimes(AnalysisPeriod()),
+        columns=pd.MultiIndex.from_tuples(headers),
+    )
+
+
+def _load_sql_file_fast(sql_file: Path) -> Optional[pd.DataFrame]:
+    """Return a DataFrame with hourly values along rows and variables along columns,
+        read directly from the EnergyPlus SQL tables into a single preallocated array.
+
+    Args:
+        sql_file (Path): The path to the EnergyPlus .sql file.
+
+    Returns:
+        Optional[pd.DataFrame]: A pandas DataFrame containing the data from the .sql
+            file, or None if the file contains data that cannot be read using this method
+            (e.g. non-hourly or multiple run-period results).
+    """
+
+    with contextlib.closing(sqlite3.connect(sql_file.as_posix())) as conn:
+        cursor = conn.cursor()
+        dictionary_rows = _sql_hourly_dictionary(cursor)
+        if dictionary_rows is None:
+            return None
+        return _sql_hourly_dataframe(sql_file, cursor, dictionary_rows, subset=False)
+
+
+def load_sql_file(sql_file: Union[str, Path], fast: bool = False) -> pd.DataFrame:
     """Return a DataFrame with hourly values along rows and variables along columns.
 
     Args:
         sql_file (Union[str, Path]): The path to the EnergyPlus .sql file.
+        fast (bool, optional): Set to True to read values directly from the SQL tables
+            into a single array rather than via Ladybug data collections. This only
+            applies to annual hourly results, other files will be loaded using the
+            default method. Defaults to False.
 
     Returns:
         pd.DataFrame: A pandas DataFrame containing the data from the .sql file.
@@ -180,6 +317,11 @@ def load_sql_file(sql_file: Union[str, Path]) -> pd.DataFrame:
 
     sql_file = Path(sql_file)
 
+    if fast:
+        df = _load_sql_file_fast(sql_file)
+        if df is not None:
+            return df
+
     sql_obj = SQLiteResult(sql_file.as_posix())
 
     def _flatten(container):
@@ -240,6 +382,49 @@ def load_sql(sql_files: Union[str, Path, List[Union[str, Path]]]) -> pd.DataFram
     return load_files(load_sql_file, sql_files)
 
 
+def load_sql_chunks(
+    sql_files: Union[str, Path, List[Union[str, Path]]], chunk_cols: int = 64
+) -> Iterator[pd.DataFrame]:
+    """Load a single EnergyPlus .sql file, or list of EnergyPlus .sql files, yielding
+        DataFrames containing up to chunk_cols variables each. This limits peak memory
+        use compared to load_sql when files contain a large number of outputs.
+
+    Args:
+        sql_files (Union[str, Path, List[Union[str, Path]]]): A single .sql file, or a list of .sql files.
+        chunk_cols (int, optional): The maximum number of variables (columns) in each
+            yielded DataFrame. Defaults to 64.
+
+    Yields:
+        pd.DataFrame: A DataFrame containing a subset of the data from the input .sql files.
+    """
+
+    if chunk_cols < 1:
+        raise ValueError("chunk_cols must be greater than 0.")
+
+    if isinstance(sql_files, (str, Path)):
+        sql_files = [sql_files]
+
+    for sql_file in sql_files:
+        sql_file = Path(sql_file)
+        with contextlib.closing(sqlite3.connect(sql_file.as_posix())) as conn:
+            cursor = conn.cursor()
+            dictionary_rows = _sql_hourly_dictionary(cursor)
+            if dictionary_rows is not None:
+                for i in range(0, len(dictionary_rows), chunk_cols):
+                    yield _sql_hourly_dataframe(
+                        sql_file,
+                        cursor,
+                        dictionary_rows[i : i + chunk_cols],
+                        subset=True,
+                    )
+                continue
+
+        # fall back to loading the whole file for results that cannot be read directly
+        df = load_sql_file(sql_file)
+        for i in range(0, len(df.columns), chunk_cols):
+            yield df.iloc[:, i : i + chunk_cols]
+
+
 def load_sun_up_hours(
     sun_up_hours_file: Union[str, Path], year: int = 2017
 ) -> pd.DatetimeIndex:
@@ -71,15 +71,21 @@ def analysis_period_from_datetimes(datetimes: List[datetime]) -> AnalysisPeriod:
         AnalysisPeriod: An AnalysisPeriod object.
     """
 
-    inferred_timestep = (60 * 60) / (datetimes[1] - datetimes[0]).seconds
+    start, end = datetimes[0], datetimes[-1]
+    step = (datetimes[1] - datetimes[0]).total_seconds()
+    if (step <= 0) or (end < start):
+        raise ValueError("The datetimes must be in order from earliest to latest.")
+
+    inferred_timestep = (60 * 60) / step
 
     analysis_period = AnalysisPeriod.from_start_end_datetime(
-        lb_datetime_from_datetime(min(datetimes)),
-        lb_datetime_from_datetime(max(datetimes)),
+        lb_datetime_from_datetime(start),
+        lb_datetime_from_datetime(end),
         inferred_timestep,
     )
 
-    if len(analysis_period.datetimes) != len(datetimes):
+    # len() counts the period's timesteps without building each of its datetimes
+    if len(analysis_period) != len(datetimes):
         raise ValueError(
             f"The number of datetimes ({len(datetimes)}) does not match the number of datetimes in "
             "the AnalysisPeriod ({len(analysis_period.datetimes)}), which probably means your "
@@ -1,5 +1,8 @@
+import calendar
 from datetime import datetime
+from typing import Iterable, List
 
+import numpy as np
 from ladybug.dt import DateTime
 
 
@@ -24,6 +27,42 @@ def lb_datetime_to_datetime(lb_datetime: DateTime) -> datetime:
     )
 
 
+def lb_datetimes_to_datetimes(lb_datetimes: Iterable[DateTime]) -> np.ndarray:
+    """Convert a sequence of Ladybug DateTime objects into a NumPy datetime64 array.
+
+    Args:
+        lb_datetimes (Iterable[DateTime]):
+            A sequence of Ladybug DateTime objects.
+
+    Returns:
+        np.ndarray:
+            A datetime64[s] array.
+    """
+
+    lb_datetimes = list(lb_datetimes)
+    n_datetimes = len(lb_datetimes)
+    year, month, day, hour, minute, second = (
+        np.fromiter(
+            (
+                v
+                for i in lb_datetimes
+                for v in (i.year, i.month, i.day, i.hour, i.minute, i.second)
+            ),
+            dtype=np.int64,
+            count=n_datetimes * 6,
+        )
+        .reshape(n_datetimes, 6)
+        .T
+    )
+
+    month_start = (
+        (year - 1970).astype("datetime64[Y]") + (month - 1).astype("timedelta64[M]")
+    ).astype("datetime64[s]")
+    seconds = (day - 1) * 86400 + hour * 3600 + minute * 60 + second
+
+    return month_start + seconds.astype("timedelta64[s]")
+
+
 def lb_datetime_from_datetime(date_time: datetime) -> DateTime:
     """Convert a Python datetime object into a Ladybug DateTime object.
 
@@ -36,14 +75,41 @@ def lb_datetime_from_datetime(date_time: datetime) -> DateTime:
             A Ladybug DateTime object.
     """
 
-    leap_year = (date_time.year % 4 == 0 and date_time.year % 100 != 0) or (
-        date_time.year % 400 == 0
-    )
-
     return DateTime(
         month=date_time.month,
         day=date_time.day,
         hour=date_time.hour,
         minute=date_time.minute,
-        leap_year=leap_year,
+        leap_year=calendar.isleap(date_time.year),
     )
+
+
+def lb_datetimes_from_datetimes(date_times: Iterable[datetime]) -> List[DateTime]:
+    """Convert a sequence of Python datetime objects into Ladybug DateTime objects.
+
+    Args:
+        date_times (Iterable[datetime]):
+            A sequence of Python datetime objects.
+
+    Returns:
+        List[DateTime]:
+            A list of Ladybug DateTime objects.
+    """
+
+    leap_years = {}
+    lb_datetimes = []
+    for date_time in date_times:
+        year = date_time.year
+        if year not in leap_years:
+            leap_years[year] = calendar.isleap(year)
+        lb_datetimes.append(
+            DateTime(
+                month=date_time.month,
+                day=date_time.day,
+                hour=date_time.hour,
+                minute=date_time.minute,
+                leap_year=leap_years[year],
+            )
+        )
+
+    return lb_datetimes
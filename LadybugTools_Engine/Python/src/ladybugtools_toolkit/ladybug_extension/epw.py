@@ -6,6 +6,7 @@ import json
 import warnings
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
@@ -46,6 +47,8 @@ from .datacollection import collection_to_series
 from .header import header_to_string as header_to_string
 from .location import location_to_string as location_to_string
 
+_DEGREES_TO_RADIANS = np.pi / 180
+
 
 def epw_to_dataframe(epw: EPW, include_additional: bool = False) -> pd.DataFrame:
     """Create a Pandas DataFrame from an EPW object, with option for including additional metrics.
@@ -348,6 +351,141 @@ def epw_to_dict(epw: EPW) -> Dict[str, Any]:
     return json.loads(json_str)
 
 
+@lru_cache(maxsize=32)
+def _sun_angles(
+    latitude: float, longitude: float, time_zone: float, n_hours: int = 8760
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate hourly solar altitude and azimuth (in degrees) for a non-leap year.
+
+    This is an array form of the NOAA routine used by Ladybug's
+    Sunpath.calculate_sun_from_hoy, giving the same values without creating
+    a Sun object for each hour. Results are cached per location, and the
+    returned arrays are read-only as they are shared between calls.
+
+    Args:
+        latitude (float):
+            Location latitude in degrees.
+        longitude (float):
+            Location longitude in degrees.
+        time_zone (float):
+            Location time zone in hours from UTC.
+        n_hours (int, optional):
+            The number of hours from the start of the year to calculate. Defaults to 8760.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+            Solar altitude and azimuth angles in degrees.
+    """
+    sin_lat, cos_lat = np.sin(np.radians(latitude)), np.cos(np.radians(latitude))
+    hoy = np.arange(n_hours)
+    hour = hoy % 24
+
+    # 42735 is the day count from 01-01-1900 to the start of 2017, as used by Ladybug
+    julian_day = (
+        42735
+        + hoy // 24
+        + 1
+        + 2415018.5
+        + np.array([round(i / 24, 2) for i in range(24)])[hour]
+        - (time_zone / 24)
+    )
+    julian_century = (julian_day - 2451545) / 36525
+
+    geom_mean_long_sun = (
+        280.46646 + julian_century * (36000.76983 + julian_century * 0.0003032)
+    ) % 360
+    geom_mean_anom_sun = 357.52911 + julian_century * (
+        35999.05029 - 0.0001537 * julian_century
+    )
+    eccent_orbit = 0.016708634 - julian_century * (
+        0.000042037 + 0.0000001267 * julian_century
+    )
+
+    # trig terms reused across the declination and equation of time
+    long_sun = np.radians(geom_mean_long_sun)
+    anom_sun = np.radians(geom_mean_anom_sun)
+    sin_anom_sun = np.sin(anom_sun)
+    sin_2_anom_sun = np.sin(2 * anom_sun)
+    omega = np.radians(125.04 - 1934.136 * julian_century)
+
+    sun_eq_of_ctr = (
+        sin_anom_sun
+        * (1.914602 - julian_century * (0.004817 + 0.000014 * julian_century))
+        + sin_2_anom_sun * (0.019993 - 0.000101 * julian_century)
+        + np.sin(np.radians(3 * geom_mean_anom_sun)) * 0.000289
+    )
+    sun_app_long = (
+        geom_mean_long_sun + sun_eq_of_ctr - 0.00569 - 0.00478 * np.sin(omega)
+    )
+    mean_obliq_ecliptic = (
+        23
+        + (
+            26
+            + (
+                21.448
+                - julian_century
+                * (46.815 + julian_century * (0.00059 - julian_century * 0.001813))
+            )
+            / 60
+        )
+        / 60
+    )
+    oblique_corr = mean_obliq_ecliptic + 0.00256 * np.cos(omega)
+    sol_dec = np.arcsin(
+        np.sin(np.radians(oblique_corr)) * np.sin(np.radians(sun_app_long))
+    )
+    sin_dec, cos_dec = np.sin(sol_dec), np.cos(sol_dec)
+    var_y = np.tan(np.radians(oblique_corr / 2)) ** 2
+    eq_of_time = 4 * np.degrees(
+        var_y * np.sin(2 * long_sun)
+        - 2 * eccent_orbit * sin_anom_sun
+        + 4 * eccent_orbit * var_y * sin_anom_sun * np.cos(2 * long_sun)
+        - 0.5 * var_y**2 * np.sin(4 * long_sun)
+        - 1.25 * eccent_orbit**2 * sin_2_anom_sun
+    )
+
+    # solar time in minutes, and the hour angle in degrees from solar noon
+    sol_time = (
+        hour * 60 + eq_of_time + 4 * np.degrees(np.radians(longitude)) - 60 * time_zone
+    ) % 1440
+    hour_angle = sol_time / 4 - 180
+
+    zenith = np.arccos(
+        sin_lat * sin_dec + cos_lat * cos_dec * np.cos(np.radians(hour_angle))
+    )
+    altitude = 90 - np.degrees(zenith)
+
+    # approximate atmospheric refraction correction
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tan_alt = np.tan(np.radians(altitude))
+        atmos_refraction = np.select(
+            [altitude > 85, altitude > 5, altitude > -0.575],
+            [
+                0,
+                58.1 / tan_alt - 0.07 / tan_alt**3 + 0.000086 / tan_alt**5,
+                1735
+                + altitude
+                * (
+                    -518.2 + altitude * (103.4 + altitude * (-12.79 + altitude * 0.711))
+                ),
+            ],
+            -20.772 / tan_alt,
+        )
+    altitude = altitude + atmos_refraction / 3600
+
+    az_init = ((sin_lat * np.cos(zenith)) - sin_dec) / (cos_lat * np.sin(zenith))
+    az_acos = np.degrees(np.arccos(np.clip(az_init, -1, 1)))
+    # afternoon suns lie west of south (180 + a), morning suns east of it (180 - a)
+    azimuth = (180 + np.where(hour_angle > 0, az_acos, -az_acos)) % 360
+    # perfect solar noon, where Ladybug falls back to due north/south
+    azimuth = np.where(np.abs(az_init) > 1, np.where(az_init > 0, 180, 0), azimuth)
+
+    altitude.setflags(write=False)
+    azimuth.setflags(write=False)
+
+    return altitude, azimuth
+
+
 def sun_position_list(epw: EPW) -> List[Sun]:
     """
     Calculate sun positions for a given epw file.
@@ -529,8 +667,14 @@ def solar_azimuth(
             An HourlyContinuousCollection of solar azimuth angles.
     """
 
-    if not sun_position:
-        sun_position = sun_position_collection(epw)
+    if sun_position:
+        values = [i.azimuth for i in sun_position.values]
+    else:
+        location = epw.location
+        _, azimuth = _sun_angles(
+            location.latitude, location.longitude, location.time_zone
+        )
+        values = azimuth.tolist()
 
     return HourlyContinuousCollection(
         Header(
@@ -541,7 +685,26 @@ def solar_azimuth(
             analysis_period=AnalysisPeriod(),
             metadata=epw.dry_bulb_temperature.header.metadata,
         ),
-        [i.azimuth for i in sun_position.values],
+        values,
+    )
+
+
+def _collection_to_radians(
+    collection: HourlyContinuousCollection,
+) -> HourlyContinuousCollection:
+    """Convert a collection of angles in degrees to radians in a single array operation."""
+    header = collection.header
+    values = np.array(collection.values, dtype=float)
+    np.multiply(values, _DEGREES_TO_RADIANS, out=values)
+
+    return HourlyContinuousCollection(
+        Header(
+            data_type=header.data_type,
+            unit="radians",
+            analysis_period=header.analysis_period,
+            metadata=header.metadata,
+        ),
+        values.tolist(),
     )
 
 
@@ -561,10 +724,7 @@ def solar_azimuth_radians(
             An HourlyContinuousCollection of solar azimuth angles.
     """
 
-    collection = solar_azimuth(epw, sun_position)
-    collection = collection.to_unit("radians")
-
-    return collection
+    return _collection_to_radians(solar_azimuth(epw, sun_position))
 
 
 def solar_altitude(
@@ -583,8 +743,14 @@ def solar_altitude(
             An HourlyContinuousCollection of solar altitude angles.
     """
 
-    if not sun_position:
-        sun_position = sun_position_collection(epw)
+    if sun_position:
+        values = [i.altitude for i in sun_position.values]
+    else:
+        location = epw.location
+        altitude, _ = _sun_angles(
+            location.latitude, location.longitude, location.time_zone
+        )
+        values = altitude.tolist()
 
     return HourlyContinuousCollection(
         Header(
@@ -595,7 +761,7 @@ def solar_altitude(
             analysis_period=AnalysisPeriod(),
             metadata=epw.dry_bulb_temperature.header.metadata,
         ),
-        [i.altitude for i in sun_position.values],
+        values,
     )
 
 
@@ -615,10 +781,7 @@ def solar_altitude_radians(
             An HourlyContinuousCollection of solar altitude angles.
     """
 
-    collection = solar_altitude(epw, sun_position)
-    collection = collection.to_unit("radians")
-
-    return collection
+    return _collection_to_radians(solar_altitude(epw, sun_position))
 
 
 def humidity_ratio(epw: EPW) -> HourlyContinuousCollection:
@@ -1431,31 +1594,25 @@ def translate_to_height(epw: EPW, target_height: float, save: bool = False) -> E
 
     # modify TEMPERATURE
     # determine
-    new_epw.dry_bulb_temperature.values = [
-        round(
+    new_epw.dry_bulb_temperature.values = np.round(
+        temperature_at_height(
+            reference_value=np.array(epw.dry_bulb_temperature.values),
+            reference_height=original_height,
+            target_height=target_height,
+        ),
+        2,
+    ).tolist()
+
+    # modify GROUND TEMPERATURE
+    for k, _ in epw.monthly_ground_temperature.items():
+        new_epw.monthly_ground_temperature[k].values = np.round(
             temperature_at_height(
-                reference_value=i,
+                reference_value=np.array(epw.monthly_ground_temperature[k].values),
                 reference_height=original_height,
                 target_height=target_height,
             ),
             2,
-        )
-        for i in epw.dry_bulb_temperature
-    ]
-
-    # modify GROUND TEMPERATURE
-    for k, _ in epw.monthly_ground_temperature.items():
-        new_epw.monthly_ground_temperature[k].values = [
-            round(
-                temperature_at_height(
-                    reference_value=i,
-                    reference_height=original_height,
-                    target_height=target_height,
-                ),
-                2,
-            )
-            for i in epw.monthly_ground_temperature[k]
-        ]
+        ).tolist()
 
     # modify ATMOSPHERIC PRESSURE
     new_epw.atmospheric_station_pressure.values = [
@@ -1554,17 +1711,14 @@ def translate_to_height(epw: EPW, target_height: float, save: bool = False) -> E
 
     # calculate WBT using same method as DBT
     wbt = wet_bulb_temperature(epw)
-    wbt.values = [
-        round(
-            temperature_at_height(
-                reference_value=i,
-                reference_height=original_height,
-                target_height=target_height,
-            ),
-            2,
-        )
-        for i in wbt.values
-    ]
+    wbt.values = np.round(
+        temperature_at_height(
+            reference_value=np.array(wbt.values),
+            reference_height=original_height,
+            target_height=target_height,
+        ),
+        2,
+    ).tolist()
 
     # Calculate RH from wetbulb
     new_epw.relative_humidity.values = [
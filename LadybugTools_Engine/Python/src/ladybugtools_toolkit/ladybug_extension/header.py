@@ -1,9 +1,13 @@
+import re
+
 import pandas as pd
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.datatype import TYPESDICT
 from ladybug.datatype.generic import GenericType
 from ladybug.header import Header
 
+_HEADER_STRING_PATTERN = re.compile(r"^(.+) \(([^()]*)\)$")
+
 
 def header_to_string(header: Header) -> str:
     """Convert a Ladybug header object into a string.
@@ -55,16 +59,14 @@ def header_from_string(string: str, is_leap_year: bool = False) -> Header:
         Header:
             A Ladybug header object."""
 
-    str_elements = string.split(" ")
+    match = _HEADER_STRING_PATTERN.match(string)
 
-    if (len(str_elements) < 2) or ("(" not in string) or (")" not in string):
+    if match is None:
         raise ValueError(
             "The string to be converted into a LB Header must be in the format 'variable (unit)'"
         )
 
-    str_elements = string.split(" ")
-    unit = str_elements[-1].replace("(", "").replace(")", "")
-    data_type = " ".join(str_elements[:-1])
+    data_type, unit = match.groups()
 
     try:
         data_type = TYPESDICT[data_type.replace(" ", "")]()
@@ -4,6 +4,7 @@ import tempfile
 import textwrap
 import warnings
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Union
 
@@ -104,11 +105,30 @@ def colormap_sequential(
                 fixed_colors.append(c)
         else:
             raise KeyError(f"{c} not recognised as a valid color string.")
-    return LinearSegmentedColormap.from_list(
-        f"{'_'.join(fixed_colors)}",
-        list(zip(np.linspace(0, 1, len(fixed_colors)), fixed_colors)),
+
+    # return a copy, so that changes to the returned colormap do not affect the cache
+    return _colormap_sequential(tuple(fixed_colors)).copy()
+
+
+@lru_cache(maxsize=64)
+def _colormap_sequential(colors: Tuple[Any]) -> LinearSegmentedColormap:
+    """Create (and cache) a sequential colormap from a tuple of validated colors.
+
+    Args:
+        colors (Tuple[Any]):
+            A tuple of valid matplotlib colors.
+
+    Returns:
+        LinearSegmentedColormap:
+            A matplotlib colormap, with its lookup table already built.
+    """
+    cmap = LinearSegmentedColormap.from_list(
+        f"{'_'.join(colors)}",
+        list(zip(np.linspace(0, 1, len(colors)), colors)),
         N=256,
     )
+    cmap._init()  # pylint: disable=protected-access
+    return cmap
 
 
 def get_lb_colormap(name: Union[int, str] = "original") -> LinearSegmentedColormap:
@@ -663,8 +683,10 @@ def sunpath(
     all_suns = [
         sunpath_obj.calculate_sun_from_date_time(i) for i in analysis_period.datetimes
     ]
-    suns = [i for i in all_suns if i.altitude > 0]
-    suns_x, suns_y = np.array([sun.position_2d().to_array() for sun in suns]).T
+    sun_up = np.array([i.altitude > 0 for i in all_suns])
+    suns_x, suns_y = np.array(
+        [sun.position_2d().to_array() for sun, up in zip(all_suns, sun_up) if up]
+    ).T
 
     day_suns = []
     for month in [6, 9, 12]:
@@ -672,12 +694,14 @@ def sunpath(
         day_idx = pd.date_range(
             date, date + pd.Timedelta(hours=24), freq="1T", closed="left"
         )
-        _ = []
-        for idx in day_idx:
+        positions = np.empty((len(day_idx), 2))
+        day_sun_up = np.zeros(len(day_idx), dtype=bool)
+        for n, idx in enumerate(day_idx):
             s = sunpath_obj.calculate_sun_from_date_time(idx)
             if s.altitude > 0:
-                _.append(np.array(s.position_2d().to_array()))
-        day_suns.append(np.array(_))
+                day_sun_up[n] = True
+                positions[n] = s.position_2d().to_array()
+        day_suns.append(positions[day_sun_up])
 
     ax.set_aspect("equal")
     ax.set_xlim(-101, 101)
@@ -715,11 +739,7 @@ def sunpath(
     if data_collection is not None:
         new_idx = analysis_period_to_datetimes(analysis_period)
         series = collection_to_series(data_collection)
-        vals = (
-            series.reindex(new_idx)
-            .interpolate()
-            .values[[i.altitude > 0 for i in all_suns]]
-        )
+        vals = series.reindex(new_idx).interpolate().values[sun_up]
         dat = ax.scatter(
             suns_x, suns_y, c=vals, s=sun_size, cmap=cmap, norm=norm, zorder=3
         )
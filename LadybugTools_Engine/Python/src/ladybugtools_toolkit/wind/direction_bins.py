@@ -64,7 +64,7 @@ class DirectionBins:
     @property
     def cardinal_directions(self) -> List[str]:
         """The direction bins as cardinal directions."""
-        return [cardinality(i, directions=32) for i in self.midpoints]
+        return cardinality(self.midpoints, directions=32).tolist()
 
     @staticmethod
     def direction_bin_edges(directions: int, centered: bool) -> List[List[float]]:
@@ -790,20 +790,22 @@ class Wind(BHoMObject):
         return weibull_pdf(self.ws.tolist())
 
     def weibull_directional(
-        self, direction_bins: DirectionBins = DirectionBins()
+        self, direction_bins: DirectionBins = DirectionBins(), parallel: bool = False
     ) -> pd.DataFrame:
         """Calculate directional weibull coefficients for the given number of directions.
 
         Args:
             directions (int, optional):
                 The number of directions into which wind directions should be binned. Defaults to 8.
+            parallel (bool, optional):
+                Set to True to fit each direction bin in a separate process. Defaults to False.
 
         Returns:
             pd.DataFrame:
                 A DataFrame object.
         """
         binned_data = direction_bins.bin_data(self.wd.tolist(), self.ws.tolist())
-        return weibull_directional(binned_data)
+        return weibull_directional(binned_data, parallel=parallel)
 
     def to_height(
         self,
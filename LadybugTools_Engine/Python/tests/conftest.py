@@ -1,7 +1,17 @@
 import shutil
 
+import matplotlib
+
+matplotlib.use("Agg")
+
+# pylint: disable=wrong-import-position
+import matplotlib.pyplot as plt
+import pytest
+
 from . import EXTERNAL_COMFORT_DIRECTORY, SPATIAL_COMFORT_DIRECTORY
 
+# pylint: enable=wrong-import-position
+
 
 def pytest_sessionstart(session):
     """_"""
@@ -11,3 +21,10 @@ def pytest_sessionstart(session):
     if EXTERNAL_COMFORT_DIRECTORY.exists():
         print(f"Removing existing test files from {EXTERNAL_COMFORT_DIRECTORY}")
         shutil.rmtree(EXTERNAL_COMFORT_DIRECTORY)
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """_"""
+    yield
+    plt.close("all")
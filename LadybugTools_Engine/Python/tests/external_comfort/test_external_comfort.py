@@ -83,7 +83,6 @@ def test_plot_utci_day_comfort_metrics():
     typ = Typologies.EAST_SHELTER_WITH_CANOPY.value
     ext_comf = ExternalComfort(sim_res, typ)
     assert isinstance(ext_comf.plot_utci_day_comfort_metrics(), plt.Figure)
-    plt.close("all")
 
 
 def test_plot_utci_heatmap():
@@ -97,7 +96,6 @@ def test_plot_utci_heatmap():
     typ = Typologies.EAST_SHELTER_WITH_CANOPY.value
     ext_comf = ExternalComfort(sim_res, typ)
     assert isinstance(ext_comf.plot_utci_heatmap(), plt.Axes)
-    plt.close("all")
 
 
 def test_plot_utci_heatmap_histogram():
@@ -111,7 +109,6 @@ def test_plot_utci_heatmap_histogram():
     typ = Typologies.EAST_SHELTER_WITH_CANOPY.value
     ext_comf = ExternalComfort(sim_res, typ)
     assert isinstance(ext_comf.plot_utci_heatmap_histogram(), plt.Figure)
-    plt.close("all")
 
 
 def test_plot_utci_distance_to_comfortable():
@@ -125,7 +122,6 @@ def test_plot_utci_distance_to_comfortable():
     typ = Typologies.EAST_SHELTER_WITH_CANOPY.value
     ext_comf = ExternalComfort(sim_res, typ)
     assert isinstance(ext_comf.plot_utci_distance_to_comfortable(), plt.Figure)
-    plt.close("all")
 
 
 def test_plot_dbt_heatmap():
@@ -139,7 +135,6 @@ def test_plot_dbt_heatmap():
     typ = Typologies.EAST_SHELTER_WITH_CANOPY.value
     ext_comf = ExternalComfort(sim_res, typ)
     assert isinstance(ext_comf.plot_dbt_heatmap(), plt.Axes)
-    plt.close("all")
 
 
 def test_plot_rh_heatmap():
@@ -153,7 +148,6 @@ def test_plot_rh_heatmap():
     typ = Typologies.EAST_SHELTER_WITH_CANOPY.value
     ext_comf = ExternalComfort(sim_res, typ)
     assert isinstance(ext_comf.plot_rh_heatmap(), plt.Axes)
-    plt.close("all")
 
 
 def test_plot_ws_heatmap():
@@ -167,7 +161,6 @@ def test_plot_ws_heatmap():
     typ = Typologies.EAST_SHELTER_WITH_CANOPY.value
     ext_comf = ExternalComfort(sim_res, typ)
     assert isinstance(ext_comf.plot_ws_heatmap(), plt.Axes)
-    plt.close("all")
 
 
 def test_plot_mrt_heatmap():
@@ -181,7 +174,6 @@ def test_plot_mrt_heatmap():
     typ = Typologies.EAST_SHELTER_WITH_CANOPY.value
     ext_comf = ExternalComfort(sim_res, typ)
     assert isinstance(ext_comf.plot_mrt_heatmap(), plt.Axes)
-    plt.close("all")
 
 
 def test_to_dict():
@@ -5,6 +5,7 @@ from ladybugtools_toolkit.external_comfort.model import (
     _create_shade_valence,
     _create_shade_zone,
     create_model,
+    equality,
 )
 
 from .. import BASE_IDENTIFIER
@@ -48,3 +49,13 @@ def test_create_model():
         identifier=BASE_IDENTIFIER,
     )
     assert model.identifier == BASE_IDENTIFIER
+
+
+def test_equality():
+    """_"""
+    model0 = create_model(GROUND_MATERIAL.to_lbt(), SHADE_MATERIAL.to_lbt())
+    model1 = create_model(GROUND_MATERIAL.to_lbt(), SHADE_MATERIAL.to_lbt())
+    model2 = create_model(SHADE_MATERIAL.to_lbt(), SHADE_MATERIAL.to_lbt())
+    assert equality(model0, model1)
+    assert not equality(model0, model1, include_identifier=True)
+    assert not equality(model0, model2)
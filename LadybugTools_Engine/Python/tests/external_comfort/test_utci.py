@@ -1,8 +1,18 @@
+import numpy as np
+import pandas as pd
 import pytest
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.epw import EPW
 from ladybug_comfort.collection.utci import UTCI
-from ladybugtools_toolkit.external_comfort.utci import summarise_utci, utci
+from ladybugtools_toolkit.external_comfort.utci import (
+    _UTCI_BLOCK_SIZE,
+    met_rate_adjustment,
+    summarise_utci,
+    utci,
+    utci_parallel,
+    utci_shade_benefit_categories,
+    utci_vectorised,
+)
 
 from .. import EPW_FILE
 
@@ -15,6 +25,12 @@ LB_UTCI_COLLECTION = UTCI(
     EPW_OBJ.wind_speed,
 ).universal_thermal_climate_index
 
+# ladybug_comfort clamps wind speed to 0.5-17 m/s, so inputs are clamped here to compare
+TA = np.array(EPW_OBJ.dry_bulb_temperature.values)
+RH = np.array(EPW_OBJ.relative_humidity.values)
+WS = np.clip(EPW_OBJ.wind_speed.values, 0.5, 17)
+LB_UTCI = np.array(LB_UTCI_COLLECTION.values)
+
 
 def test_utci():
     """_"""
@@ -26,6 +42,61 @@ def test_utci():
     ).mean() == pytest.approx(LB_UTCI_COLLECTION.average, rel=2)
 
 
+def test_utci_scalar():
+    """_"""
+    assert utci(TA[0], RH[0], TA[0], WS[0]) == pytest.approx(LB_UTCI[0], abs=1e-8)
+
+
+def test_utci_vectorised():
+    """_"""
+    assert TA.size < _UTCI_BLOCK_SIZE
+    np.testing.assert_allclose(utci_vectorised(TA, TA, WS, RH), LB_UTCI, atol=1e-8)
+    np.testing.assert_allclose(utci(TA, RH, TA, WS), LB_UTCI, atol=1e-8)
+
+
+def test_utci_vectorised_blocked():
+    """_"""
+    ta, rh, ws, lb_utci = (np.tile(i, (3, 1)) for i in (TA, RH, WS, LB_UTCI))
+    assert ta.size > _UTCI_BLOCK_SIZE
+    np.testing.assert_allclose(utci_vectorised(ta, ta, ws, rh), lb_utci, atol=1e-8)
+
+
+def test_utci_vectorised_float32():
+    """_"""
+    result = utci_vectorised(TA, TA, WS, RH, dtype=np.float32)
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, LB_UTCI, atol=0.05)
+
+
+def test_utci_parallel():
+    """_"""
+    ta, rh, ws, lb_utci = (np.tile(i, (3, 1)) for i in (TA, RH, WS, LB_UTCI))
+    result = utci_parallel(ta, ta, ws, rh, progress=False)
+    assert result.shape == ta.shape
+    np.testing.assert_allclose(result, lb_utci, atol=1e-8)
+
+
+def test_utci_vectorised_broadcasting():
+    """_"""
+    rng = np.random.default_rng(0)
+    ta = rng.uniform(-10, 40, (3, 50))
+    tr = ta + rng.uniform(0, 20, (3, 50))
+    rh = rng.uniform(10, 90, (3, 50))
+    vel = rng.uniform(0.5, 10, 50)
+
+    # a shared 1-D wind speed against a 2-D grid
+    np.testing.assert_allclose(
+        utci_vectorised(ta, tr, vel, rh),
+        utci_vectorised(ta, tr, np.broadcast_to(vel, ta.shape), rh),
+    )
+
+    # a length-1 wind speed array
+    np.testing.assert_allclose(
+        utci_vectorised(ta[0], tr[0], np.array([2.0]), rh[0]),
+        utci_vectorised(ta[0], tr[0], np.full(50, 2.0), rh[0]),
+    )
+
+
 def test_summarise_utci_collection():
     """_"""
     assert (
@@ -34,3 +105,36 @@ def test_summarise_utci_collection():
         )
         == 'In this summary, thermal comfort or periods experiencing no thermal stress, are UTCI values of between 9°C and 26°C. For Jun 01 to Mar 31 between 00:00 and 00:00, "No thermal stress" is expected for 2633 out of a possible 7296 hours (36.1%). "Cold stress" is expected for 4655 hours (63.8%). "Heat stress" is expected for 8 hours (0.1%).'
     )
+
+
+def test_utci_shade_benefit_categories():
+    """_"""
+    unshaded = pd.Series([30, 20, 20, 35, 30, 40])
+    shaded = pd.Series([20, 30, 20, 30, 35, 40])
+    result = utci_shade_benefit_categories(unshaded, shaded, comfort_limits=(9, 26))
+    assert result.dtype == "category"
+    assert result.tolist() == [
+        "Comfortable with shade",
+        "Comfortable without shade",
+        "Comfortable without shade",
+        "Shade is beneficial",
+        "Shade is detrimental",
+        "Undefined",
+    ]
+    assert result.value_counts().to_dict() == {
+        "Comfortable without shade": 2,
+        "Comfortable with shade": 1,
+        "Shade is beneficial": 1,
+        "Shade is detrimental": 1,
+        "Undefined": 1,
+    }
+
+
+def test_met_rate_adjustment():
+    """_"""
+    low = np.array(met_rate_adjustment(LB_UTCI_COLLECTION, 2.3).values)
+    high = np.array(met_rate_adjustment(LB_UTCI_COLLECTION, 3.4).values)
+    middle = np.array(met_rate_adjustment(LB_UTCI_COLLECTION, 2.85).values)
+    np.testing.assert_allclose(middle, (low + high) / 2)
+    with pytest.raises(ValueError):
+        met_rate_adjustment(LB_UTCI_COLLECTION, 1)
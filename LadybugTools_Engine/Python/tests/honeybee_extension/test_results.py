@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 from ladybugtools_toolkit.honeybee_extension.results import (
     load_ill,
@@ -5,6 +6,8 @@ from ladybugtools_toolkit.honeybee_extension.results import (
     load_pts,
     load_res,
     load_sql,
+    load_sql_chunks,
+    load_sql_file,
     make_annual,
 )
 
@@ -27,6 +30,23 @@ def test_load_sql():
     assert load_sql([SQL_FILE]).sum().sum() == pytest.approx(13418.630423320064, rel=1)
 
 
+def test_load_sql_file_fast():
+    """_"""
+    pd.testing.assert_frame_equal(
+        load_sql_file(SQL_FILE, fast=True).sort_index(axis=1),
+        load_sql_file(SQL_FILE).sort_index(axis=1),
+    )
+
+
+def test_load_sql_chunks():
+    """_"""
+    chunks = list(load_sql_chunks([SQL_FILE], chunk_cols=3))
+    assert [len(i.columns) for i in chunks] == [3, 1]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, axis=1).sort_index(axis=1), load_sql([SQL_FILE])
+    )
+
+
 def test_load_res():
     """_"""
     assert load_res([RES_FILE]).sum().sum() == pytest.approx(657.2946374, rel=1)
@@ -1,9 +1,12 @@
 from datetime import datetime
 
+import numpy as np
 from ladybug.dt import DateTime
 from ladybugtools_toolkit.ladybug_extension.dt import (
     lb_datetime_from_datetime,
     lb_datetime_to_datetime,
+    lb_datetimes_from_datetimes,
+    lb_datetimes_to_datetimes,
 )
 
 
@@ -12,8 +15,28 @@ def test_from_datetime():
     assert lb_datetime_from_datetime(datetime(2007, 1, 1, 1, 30, 0)).hoy == 1.5
 
 
+def test_datetimes_from_datetimes():
+    """_"""
+    lb_datetimes = lb_datetimes_from_datetimes(
+        [datetime(2007, 1, 1, 1, 30, 0), datetime(2008, 3, 1, 0, 0, 0)]
+    )
+    assert [i.hoy for i in lb_datetimes] == [1.5, 1440]
+
+
 def test_to_datetime():
     """_"""
     assert (
         lb_datetime_to_datetime(DateTime(month=1, day=1, hour=12, minute=0)).hour == 12
     )
+
+
+def test_datetimes_to_datetimes():
+    """_"""
+    lb_datetimes = [
+        DateTime(month=1, day=1, hour=12, minute=0),
+        DateTime(month=2, day=29, hour=23, minute=30, leap_year=True),
+    ]
+    np.testing.assert_array_equal(
+        lb_datetimes_to_datetimes(lb_datetimes),
+        np.array(["2017-01-01T12:00", "2016-02-29T23:30"], dtype="datetime64[s]"),
+    )
@@ -87,6 +87,17 @@ def test_solar_altitude():
     assert isinstance(solar_altitude(EPW_OBJ), HourlyContinuousCollection)
 
 
+def test_solar_angles_match_sun_position():
+    """_"""
+    sun_position = sun_position_collection(EPW_OBJ)
+    assert solar_altitude(EPW_OBJ).values == pytest.approx(
+        solar_altitude(EPW_OBJ, sun_position).values, abs=1e-6
+    )
+    assert solar_azimuth(EPW_OBJ).values == pytest.approx(
+        solar_azimuth(EPW_OBJ, sun_position).values, abs=1e-6
+    )
+
+
 def test_solar_azimuth_radians():
     """_"""
     assert isinstance(solar_azimuth_radians(EPW_OBJ), HourlyContinuousCollection)
@@ -27,12 +27,28 @@ def test_cardinality_good():
     assert cardinality(22.5, directions=16) == "NNE"
 
 
+def test_cardinality_array():
+    """_"""
+    assert cardinality([0, 22.5, 180, 359], directions=16).tolist() == [
+        "N",
+        "NNE",
+        "S",
+        "N",
+    ]
+
+
 def test_cardinality_bad():
     """_"""
     with pytest.raises(ValueError):
         cardinality(370, directions=16)
 
 
+def test_cardinality_array_nan():
+    """_"""
+    with pytest.raises(ValueError):
+        cardinality([float("nan"), 10], directions=16)
+
+
 def test_decay_rate_smoother():
     """_"""
     s = pd.Series([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1, 0])
@@ -54,6 +70,16 @@ def test_proximity_decay_good():
     )
 
 
+def test_proximity_decay_array():
+    """_"""
+    assert proximity_decay(
+        value=10,
+        distance_to_value=[-1, 0, 5, 10, 20],
+        max_distance=10,
+        decay_method="sigmoid",
+    ).tolist() == pytest.approx([10, 10, 5, 0, 0])
+
+
 def test_proximity_decay_bad():
     """_"""
     with pytest.raises(ValueError):
@@ -71,6 +97,13 @@ def test_evaporative_cooling_effect():
     assert (dbt == pytest.approx(16.9, rel=0.1)) and (rh == pytest.approx(75, rel=0.1))
 
 
+def test_evaporative_cooling_effect_array():
+    """_"""
+    dbt, rh = evaporative_cooling_effect([20, 20], [50, 50], [0.5, 0])
+    assert dbt.tolist() == pytest.approx([16.9, 20], rel=0.01)
+    assert rh.tolist() == pytest.approx([75, 50])
+
+
 def test_evaporative_cooling_effect_collection():
     """_"""
     dbt, rh = evaporative_cooling_effect_collection(
@@ -7,7 +7,11 @@ from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.epw import EPW
 from ladybug_comfort.collection.utci import UTCI
 from ladybugtools_toolkit.external_comfort.material import Materials
-from ladybugtools_toolkit.helpers import create_triangulation, lighten_color
+from ladybugtools_toolkit.helpers import (
+    create_triangulation,
+    lighten_color,
+    lighten_colors,
+)
 from ladybugtools_toolkit.ladybug_extension.datacollection import collection_to_series
 from ladybugtools_toolkit.plot import (
     colormap_sequential,
@@ -40,6 +44,7 @@ LB_UTCI_COLLECTION = UTCI(
     EPW_OBJ.dry_bulb_temperature,
     EPW_OBJ.wind_speed,
 ).universal_thermal_climate_index
+DBT_SERIES = collection_to_series(EPW_OBJ.dry_bulb_temperature)
 
 
 def test_colormap_sequential():
@@ -53,8 +58,8 @@ def test_create_triangulation():
     """_"""
     x = np.linspace(0, 100, 101)
     y = np.linspace(0, 100, 101)
-    xx, yy = np.meshgrid(x, y)
-    assert create_triangulation(xx.flatten(), yy.flatten()).x.shape == (10201,)
+    xf, yf = np.tile(x, len(y)), np.repeat(y, len(x))
+    assert create_triangulation(xf, yf).x.shape == (10201,)
 
 
 def test_lighten_color():
@@ -62,15 +67,22 @@ def test_lighten_color():
     assert sum(lighten_color("#000444")) == pytest.approx(1.3176470588235292, rel=0.01)
 
 
+def test_lighten_colors():
+    """_"""
+    colors = ["#000444", "red", (0.3, 0.55, 0.1)]
+    assert lighten_colors(colors, 0.3).tolist() == [
+        pytest.approx(lighten_color(i, 0.3)) for i in colors
+    ]
+
+
 def test_spatial_heatmap():
     """_"""
     x = np.linspace(0, 100, 101)
     y = np.linspace(0, 100, 101)
-    xx, yy = np.meshgrid(x, y)
-    zz = (np.sin(xx) * np.cos(yy)).flatten()
-    tri = create_triangulation(xx.flatten(), yy.flatten())
+    xf, yf = np.tile(x, len(y)), np.repeat(y, len(x))
+    zz = np.sin(xf) * np.cos(yf)
+    tri = create_triangulation(xf, yf)
     assert isinstance(spatial_heatmap([tri], [zz], contours=[0]), plt.Figure)
-    plt.close("all")
 
 
 def test_sunpath():
@@ -86,23 +98,16 @@ def test_sunpath():
         ),
         plt.Axes,
     )
-    plt.close("all")
 
 
 def test_timeseries_diurnal():
     """_"""
-    assert isinstance(
-        timeseries_diurnal(collection_to_series(EPW_OBJ.dry_bulb_temperature)), plt.Axes
-    )
-    plt.close("all")
+    assert isinstance(timeseries_diurnal(DBT_SERIES), plt.Axes)
 
 
 def test_timeseries_heatmap():
     """_"""
-    assert isinstance(
-        heatmap(collection_to_series(EPW_OBJ.dry_bulb_temperature)), plt.Axes
-    )
-    plt.close("all")
+    assert isinstance(heatmap(DBT_SERIES), plt.Axes)
 
 
 def test_utci_comparison_diurnal():
@@ -111,7 +116,6 @@ def test_utci_comparison_diurnal():
         utci_comparison_diurnal([LB_UTCI_COLLECTION - 12, LB_UTCI_COLLECTION]),
         plt.Figure,
     )
-    plt.close("all")
 
 
 def test_utci_day_comfort_metrics():
@@ -119,10 +123,8 @@ def test_utci_day_comfort_metrics():
     assert isinstance(
         utci_day_comfort_metrics(
             collection_to_series(LB_UTCI_COLLECTION),
-            collection_to_series(EPW_OBJ.dry_bulb_temperature),
-            collection_to_series(EPW_OBJ.dry_bulb_temperature).rename(
-                "Mean Radiant Temperature (C)"
-            ),
+            DBT_SERIES,
+            DBT_SERIES.rename("Mean Radiant Temperature (C)"),
             collection_to_series(EPW_OBJ.relative_humidity),
             collection_to_series(EPW_OBJ.wind_speed),
             month=6,
@@ -130,13 +132,11 @@ def test_utci_day_comfort_metrics():
         ),
         plt.Figure,
     )
-    plt.close("all")
 
 
 def test_utci_distance_to_comfortable():
     """_"""
     assert isinstance(utci_distance_to_comfortable(LB_UTCI_COLLECTION), plt.Figure)
-    plt.close("all")
 
 
 def test_utci_heatmap_difference():
@@ -144,19 +144,16 @@ def test_utci_heatmap_difference():
     assert isinstance(
         utci_heatmap_difference(LB_UTCI_COLLECTION, LB_UTCI_COLLECTION - 3), plt.Axes
     )
-    plt.close("all")
 
 
 def test_utci_heatmap_histogram():
     """_"""
     assert isinstance(utci_heatmap_histogram(LB_UTCI_COLLECTION), plt.Figure)
-    plt.close("all")
 
 
 def test_utci_heatmap():
     """_"""
     assert isinstance(utci_heatmap(LB_UTCI_COLLECTION), plt.Axes)
-    plt.close("all")
 
 
 def test_utci_journey():
@@ -174,15 +171,11 @@ def test_utci_journey():
         ),
         plt.Axes,
     )
-    plt.close("all")
 
 
 def test_week_profile():
     """_"""
-    assert isinstance(
-        week_profile(collection_to_series(EPW_OBJ.dry_bulb_temperature)), plt.Axes
-    )
-    plt.close("all")
+    assert isinstance(week_profile(DBT_SERIES), plt.Axes)
 
 
 def test_windrose():
@@ -198,7 +191,6 @@ def test_windrose():
             ),
             plt.Axes,
         )
-    plt.close("all")
 
 
 # def test_fisheye_sky():
@@ -214,10 +206,8 @@ def test_windrose():
 # def test_skymatrix():
 #     """_"""
 #     assert isinstance(skymatrix(EPW_OBJ), plt.Figure)
-#     plt.close("all")
 
 
 def test_utci_pie():
     """_"""
     assert isinstance(utci_pie(LB_UTCI_COLLECTION), plt.Axes)
-    plt.close("all")